@@ -85,6 +85,36 @@ def generate_content():
         'content': result
     })
 
+def _batch_jobs():
+    data = request.get_json(silent=True)
+    return data.get('jobs') if isinstance(data, dict) else None
+
+def _batch_cost():
+    # Charge the generate limit per job rather than per request; rejected
+    # oversized batches still cost at most the maximum batch size
+    jobs = _batch_jobs()
+    return min(len(jobs), 5) if isinstance(jobs, list) and jobs else 1
+
+@app.route('/api/agents/generate:batch', methods=['POST'])
+@require_auth
+@limiter.limit("20 per hour", cost=_batch_cost)
+def generate_content_batch():
+    jobs = _batch_jobs()
+
+    if not isinstance(jobs, list) or not 0 < len(jobs) <= 5:
+        return jsonify({'error': 'Between 1 and 5 jobs required'}), 400
+    if not all(isinstance(job, dict) and job.get('platform') and job.get('prompt') for job in jobs):
+        return jsonify({'error': 'Platform and prompt required for every job'}), 400
+
+    from agents.content_agent import ContentAgent
+    agent = ContentAgent()
+    results = [agent.generate(job['platform'], job['prompt']) for job in jobs]
+
+    return jsonify({
+        'status': 'success',
+        'results': results
+    })
+
 @app.route('/api/agents/engage', methods=['POST'])
 @require_auth
 @limiter.limit("50 per day")
@@ -105,6 +135,44 @@ def engage_audience():
         'engagement': result
     })
 
+@app.route('/api/engagement/settings', methods=['POST'])
+@require_auth
+def update_engagement_settings():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'JSON object required'}), 400
+
+    platform = data.get('platform')
+    brand_voice = data.get('brand_voice')
+    if not isinstance(platform, str) or not platform or not isinstance(brand_voice, str) or not brand_voice:
+        return jsonify({'error': 'Platform and brand_voice required'}), 400
+    if len(platform) > 50 or len(brand_voice) > 50:
+        return jsonify({'error': 'Platform and brand_voice must be at most 50 characters'}), 400
+
+    daily_limit = data.get('daily_limit', 30)
+    if isinstance(daily_limit, bool) or not isinstance(daily_limit, int) or not 1 <= daily_limit <= 50:
+        return jsonify({'error': 'daily_limit must be an integer between 1 and 50'}), 400
+
+    engagement_types = data.get('engagement_types', [])
+    if (not isinstance(engagement_types, list) or len(engagement_types) > 10
+            or not all(isinstance(t, str) and len(t) <= 50 for t in engagement_types)):
+        return jsonify({'error': 'engagement_types must be a list of strings'}), 400
+
+    # Only the known keys are kept; the session cookie is not a free-form store
+    settings = {
+        'platform': platform,
+        'brand_voice': brand_voice,
+        'daily_limit': daily_limit,
+        'engagement_types': engagement_types
+    }
+    session['engagement_settings'] = settings
+    logger.info(f"Engagement settings updated for {session['user_id']}")
+
+    return jsonify({
+        'status': 'success',
+        'settings': settings
+    })
+
 @app.route('/api/analytics/summary', methods=['GET'])
 @require_auth
 def get_analytics():
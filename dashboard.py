@@ -1,12 +1,11 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import requests
+from requests.adapters import HTTPAdapter
+import html
 import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
-import base64
 import anthropic
 
 st.set_page_config(
@@ -16,48 +15,36 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-def get_base64_image(image_path):
-    """Convert image to base64 string for embedding"""
-    try:
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except:
-        return None
-
-# Load images as base64
-hero_bg = get_base64_image("static/images/hero-bg.jpg")
-ai_brain = get_base64_image("static/images/ai-brain.jpg")
-analytics_img = get_base64_image("static/images/analytics-dashboard.jpg")
-content_img = get_base64_image("static/images/content-creation.jpg")
-engagement_img = get_base64_image("static/images/engagement.jpg")
-social_media_img = get_base64_image("static/images/social-media.jpg")
-team_img = get_base64_image("static/images/team-photo.jpg")
-ceo_img = get_base64_image("static/images/ceo-portrait.jpg")
-
-# Enhanced CSS with professional images
-st.markdown(f"""
-<style>
+# Enhanced CSS with professional images. Images are served by Streamlit's static
+# file server (see .streamlit/config.toml) so browsers fetch and cache them once
+# instead of receiving them base64-encoded inside every rerun's <style> block.
+_CSS = """
     /* Hide Streamlit branding */
-    #MainMenu {{visibility: hidden;}}
-    footer {{visibility: hidden;}}
-    header {{visibility: hidden;}}
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
     
     /* Custom fonts and colors */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
     
-    .main-header {{
+    :root {
+        /* Shared by the analytics feature card and the analytics tab background */
+        --analytics-img: url('app/static/images/analytics-dashboard.webp');
+    }
+    
+    .main-header {
         font-family: 'Inter', sans-serif;
         background: linear-gradient(135deg, rgba(102, 126, 234, 0.9) 0%, rgba(118, 75, 162, 0.9) 100%), 
-                    url(data:image/jpeg;base64,{hero_bg}) center/cover;
+                    url('app/static/images/hero-bg.webp') center/cover;
         padding: 4rem 0;
         margin: -1rem -1rem 3rem -1rem;
         text-align: center;
         color: white;
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .main-header::before {{
+    .main-header::before {
         content: '';
         position: absolute;
         top: 0;
@@ -66,37 +53,37 @@ st.markdown(f"""
         bottom: 0;
         background: rgba(0, 0, 0, 0.3);
         z-index: 1;
-    }}
+    }
     
-    .main-header > * {{
+    .main-header > * {
         position: relative;
         z-index: 2;
-    }}
+    }
     
-    .hero-title {{
+    .hero-title {
         font-size: 4rem;
         font-weight: 700;
         margin-bottom: 1rem;
         line-height: 1.1;
         text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }}
+    }
     
-    .hero-subtitle {{
+    .hero-subtitle {
         font-size: 1.8rem;
         font-weight: 400;
         opacity: 0.95;
         margin-bottom: 2rem;
         text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-    }}
+    }
     
-    .hero-stats {{
+    .hero-stats {
         font-size: 1.3rem;
         opacity: 0.9;
         font-weight: 500;
         text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-    }}
+    }
     
-    .value-prop {{
+    .value-prop {
         background: white;
         border-radius: 16px;
         padding: 2.5rem;
@@ -104,14 +91,14 @@ st.markdown(f"""
         margin: 1.5rem 0;
         border-left: 4px solid #667eea;
         transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }}
+    }
     
-    .value-prop:hover {{
+    .value-prop:hover {
         transform: translateY(-5px);
         box-shadow: 0 12px 40px rgba(0,0,0,0.15);
-    }}
+    }
     
-    .metric-card {{
+    .metric-card {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         border-radius: 20px;
         padding: 2.5rem;
@@ -120,13 +107,13 @@ st.markdown(f"""
         margin: 1rem 0;
         box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
         transition: transform 0.3s ease;
-    }}
+    }
     
-    .metric-card:hover {{
+    .metric-card:hover {
         transform: translateY(-5px);
-    }}
+    }
     
-    .feature-card {{
+    .feature-card {
         background: white;
         border-radius: 16px;
         padding: 2rem;
@@ -136,9 +123,9 @@ st.markdown(f"""
         border: 1px solid #f0f0f0;
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .feature-card::before {{
+    .feature-card::before {
         content: '';
         position: absolute;
         top: 0;
@@ -149,35 +136,35 @@ st.markdown(f"""
         background-position: center;
         opacity: 0.1;
         transition: opacity 0.3s ease;
-    }}
+    }
     
-    .feature-card:hover {{
+    .feature-card:hover {
         transform: translateY(-8px);
         box-shadow: 0 12px 40px rgba(0,0,0,0.15);
-    }}
+    }
     
-    .feature-card:hover::before {{
+    .feature-card:hover::before {
         opacity: 0.2;
-    }}
+    }
     
-    .feature-card-content {{
+    .feature-card-content {
         position: relative;
         z-index: 2;
-    }}
+    }
     
-    .feature-card-ai {{
-        background-image: url(data:image/jpeg;base64,{ai_brain});
-    }}
+    .feature-card-ai {
+        background-image: url('app/static/images/ai-brain.webp');
+    }
     
-    .feature-card-engagement {{
-        background-image: url(data:image/jpeg;base64,{engagement_img});
-    }}
+    .feature-card-engagement {
+        background-image: url('app/static/images/engagement.webp');
+    }
     
-    .feature-card-analytics {{
-        background-image: url(data:image/jpeg;base64,{analytics_img});
-    }}
+    .feature-card-analytics {
+        background-image: var(--analytics-img);
+    }
     
-    .testimonial {{
+    .testimonial {
         background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
         border-radius: 16px;
         padding: 2.5rem;
@@ -185,25 +172,25 @@ st.markdown(f"""
         border-left: 4px solid #4facfe;
         box-shadow: 0 4px 20px rgba(0,0,0,0.08);
         position: relative;
-    }}
+    }
     
-    .testimonial-content {{
+    .testimonial-content {
         display: flex;
         align-items: center;
         gap: 2rem;
-    }}
+    }
     
-    .testimonial-avatar {{
+    .testimonial-avatar {
         width: 80px;
         height: 80px;
         border-radius: 50%;
-        background: url(data:image/jpeg;base64,{ceo_img}) center/cover;
+        background: url('app/static/images/ceo-portrait.webp') center/cover;
         border: 4px solid white;
         box-shadow: 0 4px 12px rgba(0,0,0,0.15);
         flex-shrink: 0;
-    }}
+    }
     
-    .demo-banner {{
+    .demo-banner {
         background: linear-gradient(90deg, #4facfe 0%, #00f2fe 100%);
         color: white;
         padding: 1.5rem;
@@ -213,9 +200,9 @@ st.markdown(f"""
         font-weight: 500;
         font-size: 1.1rem;
         box-shadow: 0 4px 20px rgba(79, 172, 254, 0.3);
-    }}
+    }
     
-    .pricing-card {{
+    .pricing-card {
         background: white;
         border-radius: 16px;
         padding: 2.5rem;
@@ -223,35 +210,35 @@ st.markdown(f"""
         box-shadow: 0 4px 20px rgba(0,0,0,0.08);
         transition: transform 0.3s ease, box-shadow 0.3s ease;
         border: 2px solid #f0f0f0;
-    }}
+    }
     
-    .pricing-card:hover {{
+    .pricing-card:hover {
         transform: translateY(-5px);
         box-shadow: 0 8px 32px rgba(0,0,0,0.15);
-    }}
+    }
     
-    .pricing-card-featured {{
+    .pricing-card-featured {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         border: 2px solid #667eea;
         transform: scale(1.05);
-    }}
+    }
     
-    .pricing-card-featured:hover {{
+    .pricing-card-featured:hover {
         transform: scale(1.08) translateY(-5px);
-    }}
+    }
     
-    .social-proof {{
+    .social-proof {
         background: linear-gradient(135deg, #f8f9fa 0%, #ffffff 100%);
         border-radius: 16px;
         padding: 2rem;
         margin: 2rem 0;
         text-align: center;
         box-shadow: 0 4px 20px rgba(0,0,0,0.05);
-    }}
+    }
     
-    .team-showcase {{
-        background: url(data:image/jpeg;base64,{team_img}) center/cover;
+    .team-showcase {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         border-radius: 16px;
         padding: 3rem;
         margin: 2rem 0;
@@ -259,9 +246,9 @@ st.markdown(f"""
         color: white;
         position: relative;
         overflow: hidden;
-    }}
+    }
     
-    .team-showcase::before {{
+    .team-showcase::before {
         content: '';
         position: absolute;
         top: 0;
@@ -270,38 +257,49 @@ st.markdown(f"""
         bottom: 0;
         background: linear-gradient(135deg, rgba(102, 126, 234, 0.8) 0%, rgba(118, 75, 162, 0.8) 100%);
         z-index: 1;
-    }}
+    }
     
-    .team-showcase > * {{
+    .team-showcase > * {
         position: relative;
         z-index: 2;
-    }}
+    }
     
-    .content-studio-bg {{
+    /* Below-the-fold photo: an <img> so the browser can defer loading it */
+    .team-showcase > .team-showcase-img {
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        object-fit: cover;
+        z-index: 0;
+    }
+    
+    .content-studio-bg {
         background: linear-gradient(135deg, rgba(255, 255, 255, 0.95) 0%, rgba(248, 249, 250, 0.95) 100%),
-                    url(data:image/jpeg;base64,{content_img}) center/cover;
+                    url('app/static/images/content-creation.webp') center/cover;
         border-radius: 16px;
         padding: 2rem;
         margin: 1rem 0;
-    }}
+    }
     
-    .analytics-bg {{
+    .analytics-bg {
         background: linear-gradient(135deg, rgba(255, 255, 255, 0.95) 0%, rgba(248, 249, 250, 0.95) 100%),
-                    url(data:image/jpeg;base64,{analytics_img}) center/cover;
+                    var(--analytics-img) center/cover;
         border-radius: 16px;
         padding: 2rem;
         margin: 1rem 0;
-    }}
+    }
     
-    .social-media-bg {{
+    .social-media-bg {
         background: linear-gradient(135deg, rgba(255, 255, 255, 0.9) 0%, rgba(248, 249, 250, 0.9) 100%),
-                    url(data:image/jpeg;base64,{social_media_img}) center/cover;
+                    url('app/static/images/social-media.webp') center/cover;
         border-radius: 16px;
         padding: 2rem;
         margin: 1rem 0;
-    }}
+    }
     
-    .floating-stats {{
+    .floating-stats {
         position: absolute;
         top: 20px;
         right: 20px;
@@ -310,9 +308,9 @@ st.markdown(f"""
         border-radius: 12px;
         box-shadow: 0 4px 20px rgba(0,0,0,0.1);
         backdrop-filter: blur(10px);
-    }}
+    }
     
-    .btn-primary {{
+    .btn-primary {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
         padding: 1rem 2rem;
@@ -323,20 +321,20 @@ st.markdown(f"""
         cursor: pointer;
         transition: all 0.3s ease;
         box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }}
+    }
     
-    .btn-primary:hover {{
+    .btn-primary:hover {
         transform: translateY(-2px);
         box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }}
+    }
     
-    .feature-icon {{
+    .feature-icon {
         font-size: 3rem;
         margin-bottom: 1rem;
         display: block;
-    }}
+    }
     
-    .stats-number {{
+    .stats-number {
         font-size: 3rem;
         font-weight: 700;
         margin-bottom: 0.5rem;
@@ -344,29 +342,62 @@ st.markdown(f"""
         -webkit-background-clip: text;
         -webkit-text-fill-color: transparent;
         background-clip: text;
-    }}
+    }
+    
+    .landing-grid {
+        display: grid;
+        gap: 1rem;
+        align-items: start;
+    }
     
-    @media (max-width: 768px) {{
-        .hero-title {{
+    .landing-grid-2 { grid-template-columns: repeat(2, 1fr); }
+    .landing-grid-3 { grid-template-columns: repeat(3, 1fr); }
+    .landing-grid-4 { grid-template-columns: repeat(4, 1fr); }
+    
+    @media (max-width: 768px) {
+        .hero-title {
             font-size: 2.5rem;
-        }}
+        }
         
-        .hero-subtitle {{
+        .hero-subtitle {
             font-size: 1.3rem;
-        }}
+        }
         
-        .feature-card {{
+        .feature-card {
             margin: 1rem 0;
             padding: 1.5rem;
-        }}
+        }
         
-        .testimonial-content {{
+        .testimonial-content {
             flex-direction: column;
             text-align: center;
-        }}
-    }}
-</style>
-""", unsafe_allow_html=True)
+        }
+        
+        .landing-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+"""
+
+# Streamlit drops any element a rerun does not re-emit, so a gated st.markdown
+# would lose the styles after the first interaction. Instead the stylesheet is
+# appended to the parent document's <head>, which outlives reruns, once per session.
+_CSS_INJECT = """
+<script>
+(function () {
+    const doc = window.parent.document;
+    if (doc.getElementById("northstar-css")) return;
+    const style = doc.createElement("style");
+    style.id = "northstar-css";
+    style.textContent = %s;
+    doc.head.appendChild(style);
+})();
+</script>
+""" % json.dumps(_CSS)
+
+if not st.session_state.get("_css_injected"):
+    components.html(_CSS_INJECT, height=0)
+    st.session_state["_css_injected"] = True
 
 # Initialize Anthropic client
 @st.cache_resource
@@ -376,222 +407,666 @@ def get_anthropic_client():
         return anthropic.Anthropic(api_key=api_key)
     return None
 
+API_BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:5001')
+
+@st.cache_resource
+def _api_adapter():
+    # One connection pool per server process; it holds no cookies, so it is
+    # safe to share between users
+    return HTTPAdapter(pool_maxsize=10)
+
+def _api_session():
+    # The backend authenticates with a session cookie, so every user gets their
+    # own Session (and cookie jar) on top of the shared pooled adapter
+    session = st.session_state.get("_api_session")
+    if session is None:
+        session = requests.Session()
+        adapter = _api_adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        st.session_state["_api_session"] = session
+    return session
+
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
     st.session_state.user_email = None
 
+def _set_user(email):
+    st.session_state.authenticated = True
+    st.session_state.user_email = email
+    # The nav bar only depends on the email, so build it once per login
+    st.session_state["_nav_html"] = f"""
+    <div style="background: white; padding: 1rem 0; margin: -1rem -1rem 2rem -1rem; border-bottom: 1px solid #e0e0e0; box-shadow: 0 2px 10px rgba(0,0,0,0.05);">
+        <div style="display: flex; justify-content: space-between; align-items: center; max-width: 1200px; margin: 0 auto; padding: 0 2rem;">
+            <h2 style="margin: 0; color: #667eea; font-size: 1.8rem;">⭐ NorthStar AI</h2>
+            <div style="display: flex; align-items: center; gap: 1rem;">
+                <span style="color: #666; font-weight: 500;">Welcome, {email}</span>
+                <div style="width: 40px; height: 40px; border-radius: 50%; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; color: white; font-weight: 600;">
+                    {email[0].upper()}
+                </div>
+            </div>
+        </div>
+    </div>
+    """
+
 def login(email, password):
     try:
-        response = requests.post(
+        response = _api_session().post(
             f"{API_BASE_URL}/api/auth/login",
-            json={'email': email, 'password': password}
+            json={'email': email, 'password': password},
+            timeout=(3, 5)
         )
         if response.status_code == 200:
-            st.session_state.authenticated = True
-            st.session_state.user_email = email
+            _set_user(email)
             return True
-    except:
+    except requests.RequestException:
         pass
     return False
 
 def logout():
     st.session_state.authenticated = False
     st.session_state.user_email = None
+    st.session_state.pop("_nav_html", None)
+    st.session_state.pop("_api_session", None)
 
-# Landing Page
-if not st.session_state.authenticated:
-    # Hero Section with Background Image
-    st.markdown(f"""
-    <div class="main-header">
-        <div class="hero-title">⭐ NorthStar AI</div>
-        <div class="hero-subtitle">Social Media Automation That Actually Works</div>
-        <div class="hero-stats">Save 50+ hours monthly • 850% ROI • 3x faster growth</div>
+# Dashboard charts use static data; build the figures once and share them.
+# The trend chart is keyed on the current UTC date (not a microsecond-precise
+# now()) so the cache holds until midnight and the axis rolls over daily.
+@st.cache_data
+def _trend_dates(today):
+    return pd.date_range(end=today, periods=7)
+
+@st.cache_resource
+def _perf_trend_fig(today):
+    dates = _trend_dates(today)
+    performance_data = pd.DataFrame({
+        'Date': dates,
+        'Impressions': [4500, 4800, 5200, 4900, 5500, 6000, 6300],
+        'Engagements': [220, 235, 265, 245, 280, 310, 340]
+    })
+    
+    fig = px.line(performance_data, x='Date', y=['Impressions', 'Engagements'],
+                 title='7-Day Performance Trend',
+                 color_discrete_map={'Impressions': '#667eea', 'Engagements': '#f093fb'})
+    fig.update_layout(
+        height=400, 
+        showlegend=True,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+@st.cache_resource
+def _agent_activity_fig():
+    agent_data = pd.DataFrame({
+        'Agent': ['Content Generator', 'Engagement Bot', 'Analytics AI'],
+        'Actions': [45, 125, 23],
+        'Success Rate': [95, 92, 98]
+    })
+    
+    fig = px.bar(agent_data, x='Agent', y='Actions',
+                color='Success Rate',
+                color_continuous_scale='viridis',
+                title='AI Agent Performance Today')
+    fig.update_layout(
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+@st.cache_data(ttl=60)
+def _recent_posts_df():
+    recent_posts = [
+        {"Time": "2 mins ago", "Platform": "Twitter", "Content": "🚀 AI is revolutionizing content creation across industries...", "Engagement": "5.2%", "Status": "🟢 Live", "Reach": "12.3K"},
+        {"Time": "15 mins ago", "Platform": "Instagram", "Content": "✨ Behind the scenes of our AI lab where magic happens...", "Engagement": "7.8%", "Status": "🟢 Live", "Reach": "8.7K"},
+        {"Time": "1 hour ago", "Platform": "LinkedIn", "Content": "The future of work is AI-assisted, here's what we've learned...", "Engagement": "4.1%", "Status": "📅 Scheduled", "Reach": "5.2K"}
+    ]
+    return pd.DataFrame(recent_posts)
+
+# Three fixed rows; st.table renders them without a pandas/Arrow round trip
+_RECENT_ENGAGEMENTS = [
+    {"Time": "2 mins ago", "Type": "💬 Reply", "Platform": "Twitter", "Preview": "Thanks for sharing! We'd love to hear more about...", "Sentiment": "😊 Positive"},
+    {"Time": "15 mins ago", "Type": "❤️ Like", "Platform": "Instagram", "Preview": "Liked comment about AI automation trends", "Sentiment": "👍 Neutral"},
+    {"Time": "1 hour ago", "Type": "💬 Answer", "Platform": "LinkedIn", "Preview": "Great question! Here's how our AI handles...", "Sentiment": "🤔 Question"}
+]
+
+# Static landing page HTML, built once per process
+_HERO_HTML = """
+<div class="main-header">
+    <div class="hero-title">⭐ NorthStar AI</div>
+    <div class="hero-subtitle">Social Media Automation That Actually Works</div>
+    <div class="hero-stats">Save 50+ hours monthly • 850% ROI • 3x faster growth</div>
+</div>
+<div class="social-proof">
+    <h3>🚀 Trusted by 500+ creators and businesses worldwide</h3>
+    <p><strong>Join companies like TechFlow, StartupHub, and GrowthLabs</strong></p>
+</div>
+"""
+
+_PROBLEM_HTML = """
+<div class="value-prop">
+    <div class="feature-icon">😰</div>
+    <h3>🚀 The Problem</h3>
+    <p>Content creators and businesses are <strong>burning out</strong> spending <strong>40+ hours weekly</strong> on:</p>
+    <ul>
+        <li>📝 Writing social media posts manually</li>
+        <li>💬 Responding to comments one by one</li>
+        <li>📊 Analyzing performance metrics</li>
+        <li>⏰ Scheduling across multiple platforms</li>
+        <li>🎯 Maintaining consistent brand voice</li>
+    </ul>
+    <p><strong>Result:</strong> Burnout, inconsistent posting, missed opportunities, and declining engagement</p>
+</div>
+"""
+
+_SOLUTION_HTML = """
+<div class="value-prop">
+    <div class="feature-icon">✨</div>
+    <h3>✨ Our Solution</h3>
+    <p>AI agents that work <strong>24/7</strong> to:</p>
+    <ul>
+        <li>🤖 <strong>Generate</strong> viral content in seconds</li>
+        <li>💬 <strong>Engage</strong> audiences authentically</li>
+        <li>📈 <strong>Analyze</strong> ROI with ML predictions</li>
+        <li>🚀 <strong>Scale</strong> across all platforms</li>
+        <li>🎯 <strong>Maintain</strong> perfect brand voice</li>
+    </ul>
+    <p><strong>Result:</strong> 850% ROI, 70% time savings, 3x growth, and happier customers</p>
+</div>
+"""
+
+_DEMO_BANNER_HTML = """
+<div class="demo-banner">
+    🎯 <strong>Live Demo Available:</strong> See AI generate content for your brand in real-time
+</div>
+"""
+
+_LANDING_METRIC_TMPL = """
+<div class="metric-card">
+    <div class="stats-number">{value}</div>
+    <p><strong>{label}</strong></p>
+    <small>{caption}</small>
+</div>
+"""
+
+_LANDING_METRICS = (
+    {"value": "50+", "label": "Hours Saved Monthly", "caption": "Average time savings reported by users"},
+    {"value": "850%", "label": "Average ROI", "caption": "Return on investment within 3 months"},
+    {"value": "3x", "label": "Faster Growth", "caption": "Engagement and follower growth rate"},
+    {"value": "24/7", "label": "AI Working", "caption": "Never miss an engagement opportunity"}
+)
+
+_LANDING_METRIC_CARDS = tuple(_LANDING_METRIC_TMPL.format(**m) for m in _LANDING_METRICS)
+
+_FEATURES_HEADER_HTML = "<h2 style='text-align: center; margin: 4rem 0 3rem 0; font-size: 2.5rem;'>🎯 How Our AI Agents Transform Your Social Media</h2>"
+
+_FEATURE_CARDS = (
+    """
+<div class="feature-card">
+    <div class="feature-card-ai feature-card::before"></div>
+    <div class="feature-card-content">
+        <div class="feature-icon">🤖</div>
+        <h3>AI Content Agent</h3>
+        <p><strong>What it does:</strong> Creates viral-optimized posts using Claude AI with trend analysis</p>
+        <p><strong>Time saved:</strong> 20 hours/week</p>
+        <p><strong>Result:</strong> 25% higher engagement rates</p>
+        <hr>
+        <small>✅ Real-time trend analysis<br>✅ A/B testing variants<br>✅ Brand voice matching<br>✅ Platform optimization</small>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Social Proof Banner
-    st.markdown("""
-    <div class="social-proof">
-        <h3>🚀 Trusted by 500+ creators and businesses worldwide</h3>
-        <p><strong>Join companies like TechFlow, StartupHub, and GrowthLabs</strong></p>
+</div>
+""",
+    """
+<div class="feature-card">
+    <div class="feature-card-engagement feature-card::before"></div>
+    <div class="feature-card-content">
+        <div class="feature-icon">💬</div>
+        <h3>Smart Engagement</h3>
+        <p><strong>What it does:</strong> Responds to comments with empathy & context while maintaining authenticity</p>
+        <p><strong>Time saved:</strong> 15 hours/week</p>
+        <p><strong>Result:</strong> 92% response rate maintenance</p>
+        <hr>
+        <small>✅ Sentiment analysis<br>✅ Spam protection<br>✅ Brand safety filters<br>✅ Human-like responses</small>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Value Proposition Section
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        st.markdown("""
-        <div class="value-prop">
-            <div class="feature-icon">😰</div>
-            <h3>🚀 The Problem</h3>
-            <p>Content creators and businesses are <strong>burning out</strong> spending <strong>40+ hours weekly</strong> on:</p>
-            <ul>
-                <li>📝 Writing social media posts manually</li>
-                <li>💬 Responding to comments one by one</li>
-                <li>📊 Analyzing performance metrics</li>
-                <li>⏰ Scheduling across multiple platforms</li>
-                <li>🎯 Maintaining consistent brand voice</li>
-            </ul>
-            <p><strong>Result:</strong> Burnout, inconsistent posting, missed opportunities, and declining engagement</p>
+</div>
+""",
+    """
+<div class="feature-card">
+    <div class="feature-card-analytics feature-card::before"></div>
+    <div class="feature-card-content">
+        <div class="feature-icon">📊</div>
+        <h3>ROI Analytics</h3>
+        <p><strong>What it does:</strong> Predicts performance & optimizes strategy with machine learning</p>
+        <p><strong>Time saved:</strong> 10 hours/week</p>
+        <p><strong>Result:</strong> 30% better content performance</p>
+        <hr>
+        <small>✅ ML predictions<br>✅ Growth forecasting<br>✅ Competitor analysis<br>✅ ROI tracking</small>
+    </div>
+</div>
+"""
+)
+
+_TESTIMONIAL_HTML = """
+<div class="testimonial">
+    <div class="testimonial-content">
+        <div class="testimonial-avatar"></div>
+        <div>
+            <h4 style="margin: 0 0 1rem 0; font-size: 1.3rem;">"NorthStar AI increased our social media ROI by 400% in just 6 weeks. The AI agents feel like having a full marketing team working 24/7."</h4>
+            <p style="margin: 0; font-weight: 600; color: #667eea;">Sarah Kim, CEO of TechFlow</p>
+            <small style="color: #666;">50-person SaaS company, $2M ARR</small>
         </div>
-        """, unsafe_allow_html=True)
+    </div>
+</div>
+<div class="team-showcase">
+    <img class="team-showcase-img" src="app/static/images/team-photo.webp" alt="" loading="lazy" decoding="async">
+    <h3 style="font-size: 2rem; margin-bottom: 1rem;">Built by AI Experts from Google, Meta & OpenAI</h3>
+    <p style="font-size: 1.2rem; opacity: 0.9;">Our team has shipped AI products used by millions</p>
+</div>
+<br>
+"""
+
+_CTA_OPEN_HTML = """
+<div style="text-align: center; background: white; padding: 3rem; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.1);">
+    <h3 style="font-size: 2rem; margin-bottom: 1rem;">Ready to 10x Your Social Media?</h3>
+    <p style="font-size: 1.2rem; margin-bottom: 2rem;">Join 500+ creators saving 50+ hours weekly with AI automation</p>
+"""
+
+_PRICING_HEADER_HTML = """
+<br><br>
+<h3 style='text-align: center; font-size: 2.2rem; margin-bottom: 2rem;'>💰 Simple, Transparent Pricing</h3>
+"""
+
+_PRICING_CARDS = (
+    """
+<div class="pricing-card">
+    <h4 style="font-size: 1.5rem; margin-bottom: 1rem;">Starter</h4>
+    <h2 style="font-size: 3rem; margin: 1rem 0; color: #667eea;">Free</h2>
+    <p style="margin-bottom: 2rem; color: #666;">Perfect for testing our AI</p>
+    <ul style="text-align: left; margin-bottom: 2rem;">
+        <li>10 AI posts/month</li>
+        <li>Basic analytics</li>
+        <li>1 platform connection</li>
+        <li>Email support</li>
+    </ul>
+    <button style="width: 100%; padding: 1rem; border: 2px solid #667eea; background: white; color: #667eea; border-radius: 8px; font-weight: 600;">Get Started Free</button>
+</div>
+""",
+    """
+<div class="pricing-card pricing-card-featured">
+    <div style="background: rgba(255,255,255,0.2); padding: 0.5rem; border-radius: 20px; margin-bottom: 1rem; font-weight: 600;">⭐ MOST POPULAR</div>
+    <h4 style="font-size: 1.5rem; margin-bottom: 1rem;">Pro</h4>
+    <h2 style="font-size: 3rem; margin: 1rem 0;">$299<span style="font-size: 1rem;">/mo</span></h2>
+    <p style="margin-bottom: 2rem; opacity: 0.9;">For growing businesses</p>
+    <ul style="text-align: left; margin-bottom: 2rem;">
+        <li>Unlimited AI posts</li>
+        <li>All platform integrations</li>
+        <li>Advanced analytics & predictions</li>
+        <li>Priority support</li>
+        <li>A/B testing</li>
+        <li>Custom brand voice</li>
+    </ul>
+    <button style="width: 100%; padding: 1rem; border: none; background: white; color: #667eea; border-radius: 8px; font-weight: 600;">Start 14-Day Trial</button>
+</div>
+""",
+    """
+<div class="pricing-card">
+    <h4 style="font-size: 1.5rem; margin-bottom: 1rem;">Enterprise</h4>
+    <h2 style="font-size: 3rem; margin: 1rem 0; color: #667eea;">$999<span style="font-size: 1rem;">/mo</span></h2>
+    <p style="margin-bottom: 2rem; color: #666;">For large teams</p>
+    <ul style="text-align: left; margin-bottom: 2rem;">
+        <li>Custom AI training</li>
+        <li>White-label option</li>
+        <li>Dedicated success manager</li>
+        <li>API access</li>
+        <li>Custom integrations</li>
+        <li>SLA guarantee</li>
+    </ul>
+    <button style="width: 100%; padding: 1rem; border: 2px solid #667eea; background: white; color: #667eea; border-radius: 8px; font-weight: 600;">Contact Sales</button>
+</div>
+"""
+)
+
+def _html_grid(cards):
+    # Blocks are joined without blank lines so markdown keeps them as one raw
+    # HTML block instead of turning indented card markup into code blocks
+    cells = "\n".join(card.strip() for card in cards)
+    return f'<div class="landing-grid landing-grid-{len(cards)}">\n{cells}\n</div>'
+
+# Everything static above and below the CTA widgets, prebuilt into two blocks
+# so the marketing sections render with two markdown calls instead of fifteen
+_LANDING_HTML = "\n".join((
+    _HERO_HTML.strip(),
+    _html_grid((_PROBLEM_HTML, _SOLUTION_HTML)),
+    _DEMO_BANNER_HTML.strip(),
+    _html_grid(_LANDING_METRIC_CARDS),
+    _FEATURES_HEADER_HTML,
+    _html_grid(_FEATURE_CARDS),
+    _TESTIMONIAL_HTML.strip()
+))
+
+_PRICING_HTML = "\n".join((
+    _PRICING_HEADER_HTML.strip(),
+    _html_grid(_PRICING_CARDS)
+))
+
+_DASHBOARD_METRIC_TMPL = """
+<div style="background: {gradient}; color: {color}; padding: 2rem; border-radius: 16px; text-align: center; box-shadow: 0 8px 32px {shadow};">
+    <h3 style="margin: 0; font-size: 2.5rem; font-weight: 700;">{value}</h3>
+    <p style="margin: 0.5rem 0 0 0; {label_style}font-weight: 500;">{label}</p>
+    <small style="{badge_style}">{caption}</small>
+</div>
+"""
+
+_DASHBOARD_METRICS = (
+    {"gradient": "linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)", "color": "white", "shadow": "rgba(79, 172, 254, 0.3)",
+     "value": "45.2K", "label": "Total Impressions", "label_style": "opacity: 0.9; ", "caption": "+12% vs last week",
+     "badge_style": "opacity: 0.8; background: rgba(255,255,255,0.2); padding: 0.3rem 0.8rem; border-radius: 20px;"},
+    {"gradient": "linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)", "color": "#333", "shadow": "rgba(168, 237, 234, 0.3)",
+     "value": "2.3K", "label": "Engagements", "label_style": "", "caption": "+18% growth",
+     "badge_style": "background: rgba(102, 126, 234, 0.1); color: #667eea; padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: 600;"},
+    {"gradient": "linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%)", "color": "#333", "shadow": "rgba(255, 236, 210, 0.3)",
+     "value": "45.5h", "label": "Time Saved", "label_style": "", "caption": "This month",
+     "badge_style": "background: rgba(252, 182, 159, 0.3); padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: 600;"},
+    {"gradient": "linear-gradient(135deg, #f093fb 0%, #f5576c 100%)", "color": "white", "shadow": "rgba(240, 147, 251, 0.3)",
+     "value": "₩2.1M", "label": "ROI Generated", "label_style": "opacity: 0.9; ", "caption": "850% return",
+     "badge_style": "opacity: 0.8; background: rgba(255,255,255,0.2); padding: 0.3rem 0.8rem; border-radius: 20px;"}
+)
+
+_DASHBOARD_METRICS_HTML = _html_grid(tuple(_DASHBOARD_METRIC_TMPL.format(**m) for m in _DASHBOARD_METRICS))
+
+# Static decoration for the Content Studio and Engagement Hub tabs, one
+# markdown call per block instead of a heading call plus a card call
+_CONTENT_STUDIO_HEADER_HTML = """
+<div class="content-studio-bg">
+    <h2>✨ AI Content Studio</h2>
+    <p><em>Create viral content in seconds with our Claude-powered AI</em></p>
+</div>
+"""
+
+_PRO_TIPS_HTML = """
+<h3>💡 Pro Tips</h3>
+<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 16px; box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3); margin-bottom: 1.5rem;">
+    <h4 style="margin-top: 0;">📝 Content Best Practices</h4>
+    <ul style="margin: 0; padding-left: 1.2rem;">
+        <li>Be specific with your target audience</li>
+        <li>Include emotional triggers and pain points</li>
+        <li>Mention concrete benefits and numbers</li>
+        <li>Use action-oriented language</li>
+        <li>Add questions to boost engagement</li>
+    </ul>
+</div>
+<h3>📊 Content Performance</h3>
+"""
+
+_TRENDING_TOPICS_HTML = """
+<h3>🎯 Trending Topics</h3>
+<div style="background: #f8f9fa; padding: 1.5rem; border-radius: 12px; margin-top: 1rem;">
+    <small style="font-weight: 600; color: #667eea;">🔥 Hot right now:</small><br>
+    <span style="background: #e3f2fd; padding: 0.3rem 0.8rem; border-radius: 20px; margin: 0.2rem; display: inline-block; font-size: 0.9rem;">#AI</span>
+    <span style="background: #f3e5f5; padding: 0.3rem 0.8rem; border-radius: 20px; margin: 0.2rem; display: inline-block; font-size: 0.9rem;">#Automation</span>
+    <span style="background: #e8f5e8; padding: 0.3rem 0.8rem; border-radius: 20px; margin: 0.2rem; display: inline-block; font-size: 0.9rem;">#Productivity</span>
+</div>
+"""
+
+_PRIMARY_CONTENT_TMPL = """
+<h3>🎯 Primary Content</h3>
+<div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); padding: 2rem; border-radius: 12px; border-left: 4px solid #667eea; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
+    <div style="font-size: 1.1rem; line-height: 1.6;">{content}</div>
+</div>
+"""
+
+_VARIANTS_HEADER_HTML = "<h3>🎲 A/B Testing Variants</h3>"
+
+_VARIANT_TMPL = """
+<div style="background: linear-gradient(135deg, #f0f8ff 0%, #e6f3ff 100%); padding: 1.5rem; border-radius: 8px; margin: 0.8rem 0; border-left: 3px solid #4facfe;">
+    <strong style="color: #4facfe;">Variant {number}:</strong><br>
+    <div style="margin-top: 0.8rem; font-size: 1rem; line-height: 1.5;">{content}</div>
+</div>
+"""
+
+_ENGAGEMENT_HEADER_HTML = """
+<h2>💬 Smart Engagement Hub</h2>
+<p><em>AI-powered responses that maintain your brand voice</em></p>
+"""
+
+_ENGAGEMENT_STATS_HTML = """
+<h3>📈 Engagement Stats</h3>
+<div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 2rem; border-radius: 16px; text-align: center; margin-bottom: 1.5rem; box-shadow: 0 8px 25px rgba(79, 172, 254, 0.3);">
+    <h3 style="margin: 0; font-size: 2.5rem;">18/30</h3>
+    <p style="margin: 0; opacity: 0.9; font-weight: 500;">Today's Engagements</p>
+</div>
+"""
+
+# Tab bodies run as fragments so a widget interaction inside one tab reruns
+# only that tab instead of re-executing all six. st.fragment needs Streamlit
+# >= 1.37; on the pinned 1.28 they fall back to plain functions
+_fragment = getattr(st, "fragment", None) or (lambda func: func)
+
+@_fragment
+def _dashboard_tab():
+    st.markdown("## 🎯 Your AI-Powered Command Center")
     
-    with col2:
-        st.markdown("""
-        <div class="value-prop">
-            <div class="feature-icon">✨</div>
-            <h3>✨ Our Solution</h3>
-            <p>AI agents that work <strong>24/7</strong> to:</p>
-            <ul>
-                <li>🤖 <strong>Generate</strong> viral content in seconds</li>
-                <li>💬 <strong>Engage</strong> audiences authentically</li>
-                <li>📈 <strong>Analyze</strong> ROI with ML predictions</li>
-                <li>🚀 <strong>Scale</strong> across all platforms</li>
-                <li>🎯 <strong>Maintain</strong> perfect brand voice</li>
-            </ul>
-            <p><strong>Result:</strong> 850% ROI, 70% time savings, 3x growth, and happier customers</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Key Metrics Row with Enhanced Design
+    st.markdown(_DASHBOARD_METRICS_HTML, unsafe_allow_html=True)
     
-    # Live Demo Banner
-    st.markdown("""
-    <div class="demo-banner">
-        🎯 <strong>Live Demo Available:</strong> See AI generate content for your brand in real-time
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown("<br><br>", unsafe_allow_html=True)
     
-    # Stats Grid with Enhanced Design
-    col1, col2, col3, col4 = st.columns(4)
+    # Performance Charts with Background
+    col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="stats-number">50+</div>
-            <p><strong>Hours Saved Monthly</strong></p>
-            <small>Average time savings reported by users</small>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown('<div class="analytics-bg">', unsafe_allow_html=True)
+        st.markdown("### 📈 Performance Trend")
+        st.plotly_chart(_perf_trend_fig(datetime.utcnow().date()), use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="stats-number">850%</div>
-            <p><strong>Average ROI</strong></p>
-            <small>Return on investment within 3 months</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="stats-number">3x</div>
-            <p><strong>Faster Growth</strong></p>
-            <small>Engagement and follower growth rate</small>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="stats-number">24/7</div>
-            <p><strong>AI Working</strong></p>
-            <small>Never miss an engagement opportunity</small>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown('<div class="social-media-bg">', unsafe_allow_html=True)
+        st.markdown("### 🎯 AI Agent Activity")
+        st.plotly_chart(_agent_activity_fig(), use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Recent Activity with Enhanced Design
+    st.markdown("### 🚀 Recent AI-Generated Content")
     
-    # Features Section with Background Images
-    st.markdown("<h2 style='text-align: center; margin: 4rem 0 3rem 0; font-size: 2.5rem;'>🎯 How Our AI Agents Transform Your Social Media</h2>", unsafe_allow_html=True)
+    st.dataframe(_recent_posts_df(), use_container_width=True, hide_index=True)
+
+@_fragment
+def _content_studio_tab():
+    st.markdown(_CONTENT_STUDIO_HEADER_HTML, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown(f"""
-        <div class="feature-card">
-            <div class="feature-card-ai feature-card::before"></div>
-            <div class="feature-card-content">
-                <div class="feature-icon">🤖</div>
-                <h3>AI Content Agent</h3>
-                <p><strong>What it does:</strong> Creates viral-optimized posts using Claude AI with trend analysis</p>
-                <p><strong>Time saved:</strong> 20 hours/week</p>
-                <p><strong>Result:</strong> 25% higher engagement rates</p>
-                <hr>
-                <small>✅ Real-time trend analysis<br>✅ A/B testing variants<br>✅ Brand voice matching<br>✅ Platform optimization</small>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown("### 🎯 Content Generation")
+        
+        platform = st.selectbox(
+            "Select Platform",
+            ["Twitter", "Instagram", "LinkedIn", "TikTok"],
+            help="Each platform has optimized prompts and character limits"
+        )
+        
+        content_type = st.selectbox(
+            "Content Type",
+            ["Product Launch", "Industry Insights", "Behind the Scenes", "Educational", "Promotional", "Custom"]
+        )
+        
+        prompt = st.text_area(
+            "Describe your content",
+            placeholder="E.g., Launch our new AI feature that helps users save 20 hours per week on social media management...",
+            height=120,
+            help="Be specific about your product, audience, and desired tone"
+        )
+        
+        col_opt1, col_opt2, col_opt3 = st.columns(3)
+        with col_opt1:
+            optimize_virality = st.checkbox("🔥 Viral Optimization", value=True)
+        with col_opt2:
+            generate_variants = st.checkbox("🎲 A/B Test Variants", value=True)
+        with col_opt3:
+            include_hashtags = st.checkbox("# Smart Hashtags", value=True)
+        
+        if st.button("🚀 Generate Content", type="primary", use_container_width=True):
+            with st.spinner("🤖 AI is crafting your perfect post..."):
+                try:
+                    client = get_anthropic_client()
+                    if not client:
+                        st.error("⚠️ AI service not available. Please configure ANTHROPIC_API_KEY.")
+                        return
+                    
+                    # Construct AI prompt based on platform and requirements
+                    platform_prompts = {
+                        "twitter": f"Create an engaging Twitter post (max 280 characters) about: {prompt}",
+                        "instagram": f"Create an engaging Instagram caption with emojis about: {prompt}",
+                        "linkedin": f"Create a professional LinkedIn post about: {prompt}",
+                        "tiktok": f"Create a fun, viral TikTok caption about: {prompt}"
+                    }
+                    
+                    ai_prompt = platform_prompts.get(platform.lower(), platform_prompts["twitter"])
+                    ai_prompt += "\n\nTone: professional"
+                    
+                    if include_hashtags:
+                        ai_prompt += "\nInclude 3-5 relevant hashtags."
+                    
+                    ai_prompt += "\nInclude relevant emojis."
+                    ai_prompt += "\n\nAlso provide 2 alternative variants of the same content."
+                    
+                    # Call Anthropic API
+                    response = client.messages.create(
+                        model="claude-3-5-sonnet-20241022",
+                        max_tokens=500,
+                        messages=[{
+                            "role": "user", 
+                            "content": ai_prompt
+                        }]
+                    )
+                    
+                    # Extract content from response
+                    generated_text = response.content[0].text if response.content else "Generated content"
+                    
+                    # Simple parsing to extract main content and variants
+                    lines = generated_text.split('\n\n')
+                    main_content = lines[0] if lines else generated_text
+                    
+                    # Extract hashtags if present
+                    hashtags = []
+                    if '#' in main_content:
+                        import re
+                        hashtags = re.findall(r'#(\w+)', main_content)
+                    
+                    # Create variants (simplified)
+                    variants = []
+                    if len(lines) > 1:
+                        variants = [line.strip() for line in lines[1:3] if line.strip()]
+                    
+                    content = {
+                        'primary_content': main_content,
+                        'variants': variants,
+                        'hashtags': hashtags
+                    }
+                    
+                    st.success("✅ Content generated successfully!")
+                    
+                    # Primary content and variants go out as one block
+                    result_html = [_PRIMARY_CONTENT_TMPL.format(
+                        content=html.escape(content.get('primary_content', 'Generated content'))
+                    )]
+                    if generate_variants and content.get('variants'):
+                        result_html.append(_VARIANTS_HEADER_HTML)
+                        result_html.extend(
+                            _VARIANT_TMPL.format(number=i + 1, content=html.escape(variant))
+                            for i, variant in enumerate(content['variants'][:2])
+                        )
+                    st.markdown("".join(result_html), unsafe_allow_html=True)
+                    
+                    # Performance prediction with enhanced design
+                    st.markdown("### 📊 AI Performance Prediction")
+                    col_pred1, col_pred2, col_pred3 = st.columns(3)
+                    with col_pred1:
+                        st.metric("Expected Engagement", "5.2% - 7.8%", "📈")
+                    with col_pred2:
+                        st.metric("Viral Potential", "High", "🔥")
+                    with col_pred3:
+                        st.metric("Best Time to Post", "2:15 PM", "⏰")
+                    
+                except Exception as e:
+                    st.error(f"⚠️ Content generation failed: {str(e)}")
+                    st.info("💡 Tip: Make sure your prompt is descriptive and specific for better results.")
     
     with col2:
-        st.markdown(f"""
-        <div class="feature-card">
-            <div class="feature-card-engagement feature-card::before"></div>
-            <div class="feature-card-content">
-                <div class="feature-icon">💬</div>
-                <h3>Smart Engagement</h3>
-                <p><strong>What it does:</strong> Responds to comments with empathy & context while maintaining authenticity</p>
-                <p><strong>Time saved:</strong> 15 hours/week</p>
-                <p><strong>Result:</strong> 92% response rate maintenance</p>
-                <hr>
-                <small>✅ Sentiment analysis<br>✅ Spam protection<br>✅ Brand safety filters<br>✅ Human-like responses</small>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="feature-card">
-            <div class="feature-card-analytics feature-card::before"></div>
-            <div class="feature-card-content">
-                <div class="feature-icon">📊</div>
-                <h3>ROI Analytics</h3>
-                <p><strong>What it does:</strong> Predicts performance & optimizes strategy with machine learning</p>
-                <p><strong>Time saved:</strong> 10 hours/week</p>
-                <p><strong>Result:</strong> 30% better content performance</p>
-                <hr>
-                <small>✅ ML predictions<br>✅ Growth forecasting<br>✅ Competitor analysis<br>✅ ROI tracking</small>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_PRO_TIPS_HTML, unsafe_allow_html=True)
+        st.metric("Posts This Week", "12", "+3")
+        st.metric("Avg Engagement", "6.2%", "+1.4%")
+        st.metric("Viral Posts", "3", "+2")
+        
+        st.markdown(_TRENDING_TOPICS_HTML, unsafe_allow_html=True)
+
+@_fragment
+def _engagement_tab():
+    st.markdown(_ENGAGEMENT_HEADER_HTML, unsafe_allow_html=True)
     
-    # Customer Testimonial with Photo
-    st.markdown("""
-    <div class="testimonial">
-        <div class="testimonial-content">
-            <div class="testimonial-avatar"></div>
-            <div>
-                <h4 style="margin: 0 0 1rem 0; font-size: 1.3rem;">"NorthStar AI increased our social media ROI by 400% in just 6 weeks. The AI agents feel like having a full marketing team working 24/7."</h4>
-                <p style="margin: 0; font-weight: 600; color: #667eea;">Sarah Kim, CEO of TechFlow</p>
-                <small style="color: #666;">50-person SaaS company, $2M ARR</small>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Rest of engagement hub code...
+    col1, col2 = st.columns([2, 1])
     
-    # Team Showcase
-    st.markdown("""
-    <div class="team-showcase">
-        <h3 style="font-size: 2rem; margin-bottom: 1rem;">Built by AI Experts from Google, Meta & OpenAI</h3>
-        <p style="font-size: 1.2rem; opacity: 0.9;">Our team has shipped AI products used by millions</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with col1:
+        st.markdown("### 🤖 Auto-Engagement Settings")
+        
+        platform = st.selectbox("Platform", ["All Platforms", "Twitter", "Instagram", "LinkedIn"])
+        
+        engagement_level = st.slider(
+            "Daily Engagement Limit",
+            min_value=10,
+            max_value=50,
+            value=30,
+            help="AI will engage up to this many times per day to avoid spam"
+        )
+        
+        engagement_types = st.multiselect(
+            "Engagement Types",
+            ["Positive Comments", "Questions", "Mentions", "Industry Discussions"],
+            default=["Positive Comments", "Questions"]
+        )
+        
+        brand_voice = st.selectbox(
+            "Brand Voice",
+            ["Professional", "Friendly", "Casual", "Expert", "Inspiring"]
+        )
+        
+        if st.button("💾 Update Settings", type="primary"):
+            st.success("✅ Engagement settings updated successfully!")
+        
+        st.markdown("### 📊 Recent AI Engagements")
+        
+        st.table(_RECENT_ENGAGEMENTS)
+    
+    with col2:
+        st.markdown(_ENGAGEMENT_STATS_HTML, unsafe_allow_html=True)
+        
+        st.metric("Response Rate", "94%", "+2%")
+        st.metric("Avg Response Time", "2.3 mins", "-1.2 mins")
+        st.metric("Quality Score", "9.2/10", "+0.3")
+        
+        st.markdown("### 🎯 Engagement Quality")
+        quality_score = 92
+        st.progress(quality_score/100)
+        st.caption(f"AI Authenticity Score: {quality_score}%")
+
+# Landing Page
+if not st.session_state.authenticated:
+    # Hero, value props, stats, features, testimonial and team showcase
+    st.markdown(_LANDING_HTML, unsafe_allow_html=True)
     
     # CTA Section
-    st.markdown("<br>", unsafe_allow_html=True)
     col1, col2, col3 = st.columns([1, 2, 1])
     
     with col2:
-        st.markdown("""
-        <div style="text-align: center; background: white; padding: 3rem; border-radius: 16px; box-shadow: 0 8px 32px rgba(0,0,0,0.1);">
-            <h3 style="font-size: 2rem; margin-bottom: 1rem;">Ready to 10x Your Social Media?</h3>
-            <p style="font-size: 1.2rem; margin-bottom: 2rem;">Join 500+ creators saving 50+ hours weekly with AI automation</p>
-        """, unsafe_allow_html=True)
+        st.markdown(_CTA_OPEN_HTML, unsafe_allow_html=True)
         
         col_btn1, col_btn2 = st.columns(2)
         
         with col_btn1:
             if st.button("🚀 Start Free Demo", type="primary", use_container_width=True, key="demo_btn"):
-                st.session_state.authenticated = True
-                st.session_state.user_email = "demo@northstar.ai"
+                _set_user("demo@northstar.ai")
                 st.rerun()
         
         with col_btn2:
@@ -610,411 +1085,29 @@ if not st.session_state.authenticated:
         st.markdown("</div>", unsafe_allow_html=True)
     
     # Pricing Section with Enhanced Design
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    st.markdown("<h3 style='text-align: center; font-size: 2.2rem; margin-bottom: 2rem;'>💰 Simple, Transparent Pricing</h3>", unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class="pricing-card">
-            <h4 style="font-size: 1.5rem; margin-bottom: 1rem;">Starter</h4>
-            <h2 style="font-size: 3rem; margin: 1rem 0; color: #667eea;">Free</h2>
-            <p style="margin-bottom: 2rem; color: #666;">Perfect for testing our AI</p>
-            <ul style="text-align: left; margin-bottom: 2rem;">
-                <li>10 AI posts/month</li>
-                <li>Basic analytics</li>
-                <li>1 platform connection</li>
-                <li>Email support</li>
-            </ul>
-            <button style="width: 100%; padding: 1rem; border: 2px solid #667eea; background: white; color: #667eea; border-radius: 8px; font-weight: 600;">Get Started Free</button>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="pricing-card pricing-card-featured">
-            <div style="background: rgba(255,255,255,0.2); padding: 0.5rem; border-radius: 20px; margin-bottom: 1rem; font-weight: 600;">⭐ MOST POPULAR</div>
-            <h4 style="font-size: 1.5rem; margin-bottom: 1rem;">Pro</h4>
-            <h2 style="font-size: 3rem; margin: 1rem 0;">$299<span style="font-size: 1rem;">/mo</span></h2>
-            <p style="margin-bottom: 2rem; opacity: 0.9;">For growing businesses</p>
-            <ul style="text-align: left; margin-bottom: 2rem;">
-                <li>Unlimited AI posts</li>
-                <li>All platform integrations</li>
-                <li>Advanced analytics & predictions</li>
-                <li>Priority support</li>
-                <li>A/B testing</li>
-                <li>Custom brand voice</li>
-            </ul>
-            <button style="width: 100%; padding: 1rem; border: none; background: white; color: #667eea; border-radius: 8px; font-weight: 600;">Start 14-Day Trial</button>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class="pricing-card">
-            <h4 style="font-size: 1.5rem; margin-bottom: 1rem;">Enterprise</h4>
-            <h2 style="font-size: 3rem; margin: 1rem 0; color: #667eea;">$999<span style="font-size: 1rem;">/mo</span></h2>
-            <p style="margin-bottom: 2rem; color: #666;">For large teams</p>
-            <ul style="text-align: left; margin-bottom: 2rem;">
-                <li>Custom AI training</li>
-                <li>White-label option</li>
-                <li>Dedicated success manager</li>
-                <li>API access</li>
-                <li>Custom integrations</li>
-                <li>SLA guarantee</li>
-            </ul>
-            <button style="width: 100%; padding: 1rem; border: 2px solid #667eea; background: white; color: #667eea; border-radius: 8px; font-weight: 600;">Contact Sales</button>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_PRICING_HTML, unsafe_allow_html=True)
 
 # Main Dashboard for Authenticated Users
 else:
+    # Charting libraries are only needed past the landing page; the cached
+    # figure helpers above resolve these module globals when first called
+    import pandas as pd
+    import plotly.express as px
+
     # Top Navigation
-    st.markdown(f"""
-    <div style="background: white; padding: 1rem 0; margin: -1rem -1rem 2rem -1rem; border-bottom: 1px solid #e0e0e0; box-shadow: 0 2px 10px rgba(0,0,0,0.05);">
-        <div style="display: flex; justify-content: space-between; align-items: center; max-width: 1200px; margin: 0 auto; padding: 0 2rem;">
-            <h2 style="margin: 0; color: #667eea; font-size: 1.8rem;">⭐ NorthStar AI</h2>
-            <div style="display: flex; align-items: center; gap: 1rem;">
-                <span style="color: #666; font-weight: 500;">Welcome, {st.session_state.user_email}</span>
-                <div style="width: 40px; height: 40px; border-radius: 50%; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); display: flex; align-items: center; justify-content: center; color: white; font-weight: 600;">
-                    {st.session_state.user_email[0].upper()}
-                </div>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(st.session_state["_nav_html"], unsafe_allow_html=True)
     
     # Tab Navigation
     tabs = st.tabs(["📊 Dashboard", "✨ AI Content Studio", "💬 Engagement Hub", "📈 Analytics Lab", "⏰ Scheduler", "⚙️ Settings"])
     
     with tabs[0]:  # Dashboard
-        st.markdown("## 🎯 Your AI-Powered Command Center")
-        
-        # Key Metrics Row with Enhanced Design
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 2rem; border-radius: 16px; text-align: center; box-shadow: 0 8px 32px rgba(79, 172, 254, 0.3);">
-                <h3 style="margin: 0; font-size: 2.5rem; font-weight: 700;">45.2K</h3>
-                <p style="margin: 0.5rem 0 0 0; opacity: 0.9; font-weight: 500;">Total Impressions</p>
-                <small style="opacity: 0.8; background: rgba(255,255,255,0.2); padding: 0.3rem 0.8rem; border-radius: 20px;">+12% vs last week</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%); color: #333; padding: 2rem; border-radius: 16px; text-align: center; box-shadow: 0 8px 32px rgba(168, 237, 234, 0.3);">
-                <h3 style="margin: 0; font-size: 2.5rem; font-weight: 700;">2.3K</h3>
-                <p style="margin: 0.5rem 0 0 0; font-weight: 500;">Engagements</p>
-                <small style="background: rgba(102, 126, 234, 0.1); color: #667eea; padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: 600;">+18% growth</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%); color: #333; padding: 2rem; border-radius: 16px; text-align: center; box-shadow: 0 8px 32px rgba(255, 236, 210, 0.3);">
-                <h3 style="margin: 0; font-size: 2.5rem; font-weight: 700;">45.5h</h3>
-                <p style="margin: 0.5rem 0 0 0; font-weight: 500;">Time Saved</p>
-                <small style="background: rgba(252, 182, 159, 0.3); padding: 0.3rem 0.8rem; border-radius: 20px; font-weight: 600;">This month</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 2rem; border-radius: 16px; text-align: center; box-shadow: 0 8px 32px rgba(240, 147, 251, 0.3);">
-                <h3 style="margin: 0; font-size: 2.5rem; font-weight: 700;">₩2.1M</h3>
-                <p style="margin: 0.5rem 0 0 0; opacity: 0.9; font-weight: 500;">ROI Generated</p>
-                <small style="opacity: 0.8; background: rgba(255,255,255,0.2); padding: 0.3rem 0.8rem; border-radius: 20px;">850% return</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("<br><br>", unsafe_allow_html=True)
-        
-        # Performance Charts with Background
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown('<div class="analytics-bg">', unsafe_allow_html=True)
-            st.markdown("### 📈 Performance Trend")
-            dates = pd.date_range(end=datetime.now(), periods=7)
-            performance_data = pd.DataFrame({
-                'Date': dates,
-                'Impressions': [4500, 4800, 5200, 4900, 5500, 6000, 6300],
-                'Engagements': [220, 235, 265, 245, 280, 310, 340]
-            })
-            
-            fig = px.line(performance_data, x='Date', y=['Impressions', 'Engagements'],
-                         title='7-Day Performance Trend',
-                         color_discrete_map={'Impressions': '#667eea', 'Engagements': '#f093fb'})
-            fig.update_layout(
-                height=400, 
-                showlegend=True,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown('<div class="social-media-bg">', unsafe_allow_html=True)
-            st.markdown("### 🎯 AI Agent Activity")
-            agent_data = pd.DataFrame({
-                'Agent': ['Content Generator', 'Engagement Bot', 'Analytics AI'],
-                'Actions': [45, 125, 23],
-                'Success Rate': [95, 92, 98]
-            })
-            
-            fig = px.bar(agent_data, x='Agent', y='Actions',
-                        color='Success Rate',
-                        color_continuous_scale='viridis',
-                        title='AI Agent Performance Today')
-            fig.update_layout(
-                height=400,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Recent Activity with Enhanced Design
-        st.markdown("### 🚀 Recent AI-Generated Content")
-        
-        recent_posts = [
-            {"Time": "2 mins ago", "Platform": "Twitter", "Content": "🚀 AI is revolutionizing content creation across industries...", "Engagement": "5.2%", "Status": "🟢 Live", "Reach": "12.3K"},
-            {"Time": "15 mins ago", "Platform": "Instagram", "Content": "✨ Behind the scenes of our AI lab where magic happens...", "Engagement": "7.8%", "Status": "🟢 Live", "Reach": "8.7K"},
-            {"Time": "1 hour ago", "Platform": "LinkedIn", "Content": "The future of work is AI-assisted, here's what we've learned...", "Engagement": "4.1%", "Status": "📅 Scheduled", "Reach": "5.2K"}
-        ]
-        
-        df = pd.DataFrame(recent_posts)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        _dashboard_tab()
     
     with tabs[1]:  # AI Content Studio
-        st.markdown('<div class="content-studio-bg">', unsafe_allow_html=True)
-        st.markdown("## ✨ AI Content Studio")
-        st.markdown("*Create viral content in seconds with our Claude-powered AI*")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.markdown("### 🎯 Content Generation")
-            
-            platform = st.selectbox(
-                "Select Platform",
-                ["Twitter", "Instagram", "LinkedIn", "TikTok"],
-                help="Each platform has optimized prompts and character limits"
-            )
-            
-            content_type = st.selectbox(
-                "Content Type",
-                ["Product Launch", "Industry Insights", "Behind the Scenes", "Educational", "Promotional", "Custom"]
-            )
-            
-            prompt = st.text_area(
-                "Describe your content",
-                placeholder="E.g., Launch our new AI feature that helps users save 20 hours per week on social media management...",
-                height=120,
-                help="Be specific about your product, audience, and desired tone"
-            )
-            
-            col_opt1, col_opt2, col_opt3 = st.columns(3)
-            with col_opt1:
-                optimize_virality = st.checkbox("🔥 Viral Optimization", value=True)
-            with col_opt2:
-                generate_variants = st.checkbox("🎲 A/B Test Variants", value=True)
-            with col_opt3:
-                include_hashtags = st.checkbox("# Smart Hashtags", value=True)
-            
-            if st.button("🚀 Generate Content", type="primary", use_container_width=True):
-                with st.spinner("🤖 AI is crafting your perfect post..."):
-                    try:
-                        client = get_anthropic_client()
-                        if not client:
-                            st.error("⚠️ AI service not available. Please configure ANTHROPIC_API_KEY.")
-                            return
-                        
-                        # Construct AI prompt based on platform and requirements
-                        platform_prompts = {
-                            "twitter": f"Create an engaging Twitter post (max 280 characters) about: {prompt}",
-                            "instagram": f"Create an engaging Instagram caption with emojis about: {prompt}",
-                            "linkedin": f"Create a professional LinkedIn post about: {prompt}",
-                            "tiktok": f"Create a fun, viral TikTok caption about: {prompt}"
-                        }
-                        
-                        ai_prompt = platform_prompts.get(platform.lower(), platform_prompts["twitter"])
-                        ai_prompt += "\n\nTone: professional"
-                        
-                        if include_hashtags:
-                            ai_prompt += "\nInclude 3-5 relevant hashtags."
-                        
-                        ai_prompt += "\nInclude relevant emojis."
-                        ai_prompt += "\n\nAlso provide 2 alternative variants of the same content."
-                        
-                        # Call Anthropic API
-                        response = client.messages.create(
-                            model="claude-3-5-sonnet-20241022",
-                            max_tokens=500,
-                            messages=[{
-                                "role": "user", 
-                                "content": ai_prompt
-                            }]
-                        )
-                        
-                        # Extract content from response
-                        generated_text = response.content[0].text if response.content else "Generated content"
-                        
-                        # Simple parsing to extract main content and variants
-                        lines = generated_text.split('\n\n')
-                        main_content = lines[0] if lines else generated_text
-                        
-                        # Extract hashtags if present
-                        hashtags = []
-                        if '#' in main_content:
-                            import re
-                            hashtags = re.findall(r'#(\w+)', main_content)
-                        
-                        # Create variants (simplified)
-                        variants = []
-                        if len(lines) > 1:
-                            variants = [line.strip() for line in lines[1:3] if line.strip()]
-                        
-                        content = {
-                            'primary_content': main_content,
-                            'variants': variants,
-                            'hashtags': hashtags
-                        }
-                        
-                        st.success("✅ Content generated successfully!")
-                        
-                        st.markdown("### 🎯 Primary Content")
-                        st.markdown(f"""
-                        <div style="background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); padding: 2rem; border-radius: 12px; border-left: 4px solid #667eea; box-shadow: 0 4px 15px rgba(0,0,0,0.1);">
-                            <div style="font-size: 1.1rem; line-height: 1.6;">{content.get('primary_content', 'Generated content')}</div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if generate_variants and content.get('variants'):
-                            st.markdown("### 🎲 A/B Testing Variants")
-                            for i, variant in enumerate(content.get('variants', [])[:2]):
-                                st.markdown(f"""
-                                <div style="background: linear-gradient(135deg, #f0f8ff 0%, #e6f3ff 100%); padding: 1.5rem; border-radius: 8px; margin: 0.8rem 0; border-left: 3px solid #4facfe;">
-                                        <strong style="color: #4facfe;">Variant {i+1}:</strong><br>
-                                        <div style="margin-top: 0.8rem; font-size: 1rem; line-height: 1.5;">{variant}</div>
-                                    </div>
-                                """, unsafe_allow_html=True)
-                        
-                        # Performance prediction with enhanced design
-                        st.markdown("### 📊 AI Performance Prediction")
-                        col_pred1, col_pred2, col_pred3 = st.columns(3)
-                        with col_pred1:
-                            st.metric("Expected Engagement", "5.2% - 7.8%", "📈")
-                        with col_pred2:
-                            st.metric("Viral Potential", "High", "🔥")
-                        with col_pred3:
-                            st.metric("Best Time to Post", "2:15 PM", "⏰")
-                        
-                    except Exception as e:
-                        st.error(f"⚠️ Content generation failed: {str(e)}")
-                        st.info("💡 Tip: Make sure your prompt is descriptive and specific for better results.")
-        
-        with col2:
-            st.markdown("### 💡 Pro Tips")
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 16px; box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);">
-                <h4 style="margin-top: 0;">📝 Content Best Practices</h4>
-                <ul style="margin: 0; padding-left: 1.2rem;">
-                    <li>Be specific with your target audience</li>
-                    <li>Include emotional triggers and pain points</li>
-                    <li>Mention concrete benefits and numbers</li>
-                    <li>Use action-oriented language</li>
-                    <li>Add questions to boost engagement</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.markdown("<br>", unsafe_allow_html=True)
-            
-            st.markdown("### 📊 Content Performance")
-            st.metric("Posts This Week", "12", "+3")
-            st.metric("Avg Engagement", "6.2%", "+1.4%")
-            st.metric("Viral Posts", "3", "+2")
-            
-            st.markdown("### 🎯 Trending Topics")
-            st.markdown("""
-            <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 12px; margin-top: 1rem;">
-                <small style="font-weight: 600; color: #667eea;">🔥 Hot right now:</small><br>
-                <span style="background: #e3f2fd; padding: 0.3rem 0.8rem; border-radius: 20px; margin: 0.2rem; display: inline-block; font-size: 0.9rem;">#AI</span>
-                <span style="background: #f3e5f5; padding: 0.3rem 0.8rem; border-radius: 20px; margin: 0.2rem; display: inline-block; font-size: 0.9rem;">#Automation</span>
-                <span style="background: #e8f5e8; padding: 0.3rem 0.8rem; border-radius: 20px; margin: 0.2rem; display: inline-block; font-size: 0.9rem;">#Productivity</span>
-            </div>
-            """, unsafe_allow_html=True)
+        _content_studio_tab()
     
-    # Continue with other tabs...
     with tabs[2]:  # Engagement Hub
-        st.markdown("## 💬 Smart Engagement Hub")
-        st.markdown("*AI-powered responses that maintain your brand voice*")
-        
-        # Rest of engagement hub code...
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.markdown("### 🤖 Auto-Engagement Settings")
-            
-            platform = st.selectbox("Platform", ["All Platforms", "Twitter", "Instagram", "LinkedIn"])
-            
-            engagement_level = st.slider(
-                "Daily Engagement Limit",
-                min_value=10,
-                max_value=50,
-                value=30,
-                help="AI will engage up to this many times per day to avoid spam"
-            )
-            
-            engagement_types = st.multiselect(
-                "Engagement Types",
-                ["Positive Comments", "Questions", "Mentions", "Industry Discussions"],
-                default=["Positive Comments", "Questions"]
-            )
-            
-            brand_voice = st.selectbox(
-                "Brand Voice",
-                ["Professional", "Friendly", "Casual", "Expert", "Inspiring"]
-            )
-            
-            if st.button("💾 Update Settings", type="primary"):
-                st.success("✅ Engagement settings updated successfully!")
-            
-            st.markdown("### 📊 Recent AI Engagements")
-            
-            engagements = [
-                {"Time": "2 mins ago", "Type": "💬 Reply", "Platform": "Twitter", "Preview": "Thanks for sharing! We'd love to hear more about...", "Sentiment": "😊 Positive"},
-                {"Time": "15 mins ago", "Type": "❤️ Like", "Platform": "Instagram", "Preview": "Liked comment about AI automation trends", "Sentiment": "👍 Neutral"},
-                {"Time": "1 hour ago", "Type": "💬 Answer", "Platform": "LinkedIn", "Preview": "Great question! Here's how our AI handles...", "Sentiment": "🤔 Question"}
-            ]
-            
-            df = pd.DataFrame(engagements)
-            st.dataframe(df, use_container_width=True, hide_index=True)
-        
-        with col2:
-            st.markdown("### 📈 Engagement Stats")
-            
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); color: white; padding: 2rem; border-radius: 16px; text-align: center; margin-bottom: 1.5rem; box-shadow: 0 8px 25px rgba(79, 172, 254, 0.3);">
-                <h3 style="margin: 0; font-size: 2.5rem;">18/30</h3>
-                <p style="margin: 0; opacity: 0.9; font-weight: 500;">Today's Engagements</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            st.metric("Response Rate", "94%", "+2%")
-            st.metric("Avg Response Time", "2.3 mins", "-1.2 mins")
-            st.metric("Quality Score", "9.2/10", "+0.3")
-            
-            st.markdown("### 🎯 Engagement Quality")
-            quality_score = 92
-            st.progress(quality_score/100)
-            st.caption(f"AI Authenticity Score: {quality_score}%")
+        _engagement_tab()
     
     # Continue with remaining tabs (Analytics, Scheduler, Settings)...
     with tabs[3]:  # Analytics Lab
@@ -24,13 +24,14 @@ def login(email, password):
     try:
         response = requests.post(
             f"{API_BASE_URL}/api/auth/login",
-            json={'email': email, 'password': password}
+            json={'email': email, 'password': password},
+            timeout=(3, 5)
         )
         if response.status_code == 200:
             st.session_state.authenticated = True
             st.session_state.user_email = email
             return True
-    except:
+    except requests.RequestException:
         pass
     return False
 
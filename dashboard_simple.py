@@ -1,12 +1,18 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 import json
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 st.set_page_config(
     page_title="NorthStar AI - Social Media Automation",
     page_icon="⭐",
@@ -139,27 +145,156 @@ st.markdown("""
 
 API_BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:5001')
 
+# Pre-formed HTML cards skip the markdown pass with st.html (Streamlit >= 1.33);
+# on the pinned 1.28 they go through st.markdown with raw HTML allowed
+_html = getattr(st, "html", None) or (lambda body: st.markdown(body, unsafe_allow_html=True))
+
+# Static HTML blocks, built once at import instead of on every rerun
+_AI_TIMES_HTML = (
+    '<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem;">'
+    '<h4>📊 Optimal Times</h4><p>'
+    + "<br>".join((
+        "<strong>Twitter:</strong> 9 AM, 2 PM",
+        "<strong>Instagram:</strong> 11 AM, 7 PM",
+        "<strong>LinkedIn:</strong> 8 AM, 5 PM",
+    ))
+    + "</p></div>"
+)
+
+_INTEGRATIONS = (
+    {"name": "Twitter", "status": "✅ Connected", "accounts": "2 accounts"},
+    {"name": "Instagram", "status": "✅ Connected", "accounts": "1 business account"},
+    {"name": "LinkedIn", "status": "❌ Not Connected", "accounts": "Add account"},
+    {"name": "TikTok", "status": "❌ Not Connected", "accounts": "Add account"}
+)
+_SCHEDULED_POSTS = [
+    {"Time": "Today 2:00 PM", "Platform": "Twitter", "Content": "🚀 Exciting AI update coming...", "Status": "⏳ Pending", "Engagement": "Est. 5.2%"},
+    {"Time": "Tomorrow 10:00 AM", "Platform": "LinkedIn", "Content": "Industry insights on automation...", "Status": "⏳ Pending", "Engagement": "Est. 4.8%"},
+    {"Time": "Friday 3:00 PM", "Platform": "Instagram", "Content": "Behind the scenes content...", "Status": "⏳ Pending", "Engagement": "Est. 7.1%"}
+]
+_RECENT_ENGAGEMENTS = [
+    {"Time": "2 mins ago", "Type": "💬 Reply", "Platform": "Twitter", "Preview": "Thanks for sharing! We'd love to...", "Sentiment": "😊 Positive"},
+    {"Time": "15 mins ago", "Type": "❤️ Like", "Platform": "Instagram", "Preview": "Liked comment about AI trends", "Sentiment": "👍 Neutral"},
+    {"Time": "1 hour ago", "Type": "💬 Answer", "Platform": "LinkedIn", "Preview": "Great question! Here's how we...", "Sentiment": "🤔 Question"}
+]
+
+_BRAND_VOICE_OPTIONS = ["Professional", "Casual", "Friendly", "Expert", "Inspirational"]
+_RESPONSE_STYLE_OPTIONS = ["Helpful", "Enthusiastic", "Professional", "Witty"]
+_AI_CONFIG_DEFAULTS = {
+    "Creativity Level": 0.7,
+    "Default Brand Voice": "Professional",
+    "Response Style": "Helpful",
+    "Enable Auto-Engagement": True
+}
+
+_MANAGE_KEYS = tuple(f"manage_{p['name']}" for p in _INTEGRATIONS)
+_CONNECT_KEYS = tuple(f"connect_{p['name']}" for p in _INTEGRATIONS)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+@st.cache_resource
+def _api_adapter():
+    # One connection pool per server process; it holds no cookies, so it is
+    # safe to share between users
+    return HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                       max_retries=Retry(total=2, backoff_factor=0.2))
+
+def _api_session():
+    # The backend authenticates with a session cookie, so every user gets their
+    # own Session (and cookie jar) on top of the shared pooled adapter
+    session = st.session_state.get("_api_session")
+    if session is None:
+        session = requests.Session()
+        adapter = _api_adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        st.session_state["_api_session"] = session
+    return session
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _generate(user_email, platform, prompt):
+    # Identical requests from the same user within ten minutes are served from
+    # the cache; user_email is part of the key so one user's generations are
+    # never returned to another. Errors raise and are therefore never cached
+    response = _api_session().post(
+        f"{API_BASE_URL}/api/agents/generate",
+        data=_json_dumps({
+            'platform': platform,
+            'prompt': prompt
+        }),
+        headers=_JSON_HEADERS,
+        timeout=(3.05, 30)
+    )
+    response.raise_for_status()
+    return response.json()
+
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
     st.session_state.user_email = None
 
 def login(email, password):
     try:
-        response = requests.post(
+        response = _api_session().post(
             f"{API_BASE_URL}/api/auth/login",
-            json={'email': email, 'password': password}
+            json={'email': email, 'password': password},
+            timeout=(3, 5)
         )
         if response.status_code == 200:
             st.session_state.authenticated = True
             st.session_state.user_email = email
             return True
-    except:
+    except requests.RequestException:
         pass
     return False
 
+def save_engagement_settings(settings):
+    try:
+        response = _api_session().post(
+            f"{API_BASE_URL}/api/engagement/settings",
+            data=_json_dumps(settings),
+            headers=_JSON_HEADERS,
+            timeout=(3, 10)
+        )
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
 def logout():
     st.session_state.authenticated = False
     st.session_state.user_email = None
+    # Drop the cookie jar so the next login starts from a clean session
+    st.session_state.pop("_api_session", None)
+
+# st.fragment needs Streamlit >= 1.37; on the pinned 1.28 the footer simply
+# reruns with the rest of the script
+_fragment = getattr(st, "fragment", None) or (lambda func: func)
+
+@_fragment
+def _footer():
+    st.markdown("---")
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        if st.button("🚪 Logout", use_container_width=True):
+            logout()
+            # Full app rerun so the landing page replaces the dashboard
+            st.rerun()
+
+# Static figure, built once per process and shared by every session
+@st.cache_resource
+def _roi_pie():
+    import pandas as pd
+    import plotly.express as px
+
+    roi_data = pd.DataFrame({
+        'Category': ['Time Savings', 'Engagement Value', 'Lead Generation', 'Brand Awareness'],
+        'Value (₩K)': [2300, 800, 500, 400]
+    })
+    
+    fig = px.pie(roi_data, values='Value (₩K)', names='Category',
+               title='ROI Breakdown',
+               color_discrete_sequence=['#667eea', '#f093fb', '#4facfe', '#ffecd2'])
+    fig.update_layout(height=400)
+    return fig
 
 # Landing Page
 if not st.session_state.authenticated:
@@ -381,6 +516,11 @@ if not st.session_state.authenticated:
 
 # Main Dashboard for Authenticated Users
 else:
+    # Charting libraries are only needed once the user is past the landing page
+    import pandas as pd
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     # Top Navigation
     st.markdown("""
     <div style="background: white; padding: 1rem 0; margin: -1rem -1rem 2rem -1rem; border-bottom: 1px solid #e0e0e0;">
@@ -523,49 +663,50 @@ else:
             if st.button("🚀 Generate Content", type="primary", use_container_width=True):
                 with st.spinner("🤖 AI is crafting your perfect post..."):
                     try:
-                        response = requests.post(
-                            f"{API_BASE_URL}/api/agents/generate",
-                            json={
-                                'platform': platform.lower(),
-                                'prompt': prompt
-                            }
-                        )
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            content = result.get('content', {})
-                            
-                            st.success("✅ Content generated successfully!")
-                            
-                            st.markdown("### 🎯 Primary Content")
-                            st.markdown(f"""
-                            <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 12px; border-left: 4px solid #667eea;">
-                                {content.get('primary_content', 'Generated content')}
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            if generate_variants and content.get('variants'):
-                                st.markdown("### 🎲 A/B Testing Variants")
-                                for i, variant in enumerate(content.get('variants', [])[:2]):
-                                    st.markdown(f"""
-                                    <div style="background: #f0f8ff; padding: 1rem; border-radius: 8px; margin: 0.5rem 0;">
-                                        <strong>Variant {i+1}:</strong> {variant}
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                            
-                            # Performance prediction
-                            st.markdown("### 📊 AI Performance Prediction")
-                            col_pred1, col_pred2, col_pred3 = st.columns(3)
-                            with col_pred1:
-                                st.metric("Expected Engagement", "5.2% - 7.8%", "📈")
-                            with col_pred2:
-                                st.metric("Viral Potential", "High", "🔥")
-                            with col_pred3:
-                                st.metric("Best Time to Post", "2:15 PM", "⏰")
-                        else:
-                            st.error("Failed to generate content")
+                        result = _generate(st.session_state.user_email, platform.lower(), prompt)
+                        st.session_state["last_generation"] = {
+                            "key": (platform.lower(), prompt),
+                            "result": result
+                        }
+                        st.success("✅ Content generated successfully!")
+                    except requests.Timeout:
+                        st.error("⏱️ The AI took too long to respond. Please try again.")
+                    except requests.HTTPError:
+                        st.error("Failed to generate content")
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
+            
+            # Render the last result from session state so it survives reruns and
+            # tab switches; editing the platform or prompt hides the stale result
+            generation = st.session_state.get("last_generation")
+            if generation and generation["key"] == (platform.lower(), prompt):
+                content = generation["result"].get('content', {})
+                
+                st.markdown("### 🎯 Primary Content")
+                st.markdown(f"""
+                <div style="background: #f8f9fa; padding: 1.5rem; border-radius: 12px; border-left: 4px solid #667eea;">
+                    {content.get('primary_content', 'Generated content')}
+                </div>
+                """, unsafe_allow_html=True)
+                
+                if generate_variants and content.get('variants'):
+                    st.markdown("### 🎲 A/B Testing Variants")
+                    for i, variant in enumerate(content.get('variants', [])[:2]):
+                        st.markdown(f"""
+                        <div style="background: #f0f8ff; padding: 1rem; border-radius: 8px; margin: 0.5rem 0;">
+                            <strong>Variant {i+1}:</strong> {variant}
+                        </div>
+                        """, unsafe_allow_html=True)
+                
+                # Performance prediction
+                st.markdown("### 📊 AI Performance Prediction")
+                col_pred1, col_pred2, col_pred3 = st.columns(3)
+                with col_pred1:
+                    st.metric("Expected Engagement", "5.2% - 7.8%", "📈")
+                with col_pred2:
+                    st.metric("Viral Potential", "High", "🔥")
+                with col_pred3:
+                    st.metric("Best Time to Post", "2:15 PM", "⏰")
         
         with col2:
             st.markdown("### 💡 Pro Tips")
@@ -616,19 +757,27 @@ else:
                 ["Professional", "Friendly", "Casual", "Expert", "Inspiring"]
             )
             
+            # Only POST when the settings differ from the last saved state, so
+            # repeated clicks don't resend an identical payload
+            settings = {
+                'platform': platform,
+                'daily_limit': engagement_level,
+                'engagement_types': engagement_types,
+                'brand_voice': brand_voice
+            }
+            settings_hash = hash((platform, engagement_level, tuple(engagement_types), brand_voice))
             if st.button("💾 Update Settings", type="primary"):
-                st.success("✅ Engagement settings updated successfully!")
+                if settings_hash == st.session_state.get("_settings_hash"):
+                    st.success("✅ Engagement settings updated successfully!")
+                elif save_engagement_settings(settings):
+                    st.session_state["_settings_hash"] = settings_hash
+                    st.success("✅ Engagement settings updated successfully!")
+                else:
+                    st.error("Failed to update settings. Please try again.")
             
             st.markdown("### 📊 Recent AI Engagements")
             
-            engagements = [
-                {"Time": "2 mins ago", "Type": "💬 Reply", "Platform": "Twitter", "Preview": "Thanks for sharing! We'd love to...", "Sentiment": "😊 Positive"},
-                {"Time": "15 mins ago", "Type": "❤️ Like", "Platform": "Instagram", "Preview": "Liked comment about AI trends", "Sentiment": "👍 Neutral"},
-                {"Time": "1 hour ago", "Type": "💬 Answer", "Platform": "LinkedIn", "Preview": "Great question! Here's how we...", "Sentiment": "🤔 Question"}
-            ]
-            
-            df = pd.DataFrame(engagements)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.table(_RECENT_ENGAGEMENTS)
         
         with col2:
             st.markdown("### 📈 Engagement Stats")
@@ -689,7 +838,7 @@ else:
             
             with col2:
                 st.markdown("### 🎯 Key Insights")
-                st.markdown("""
+                _html("""
                 <div style="background: #e8f5e8; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
                     <strong>🚀 Top Insight</strong><br>
                     Video content performs 3x better on weekends
@@ -704,7 +853,7 @@ else:
                     <strong>📊 Growth Trend</strong><br>
                     Audience growing 15% monthly
                 </div>
-                """, unsafe_allow_html=True)
+                """)
         
         with analytics_tabs[1]:  # Predictions
             st.markdown("### 🔮 AI Growth Predictions")
@@ -750,16 +899,7 @@ else:
                 st.metric("Total ROI", "850%", help="Return on ₩299K investment")
             
             with col2:
-                roi_data = pd.DataFrame({
-                    'Category': ['Time Savings', 'Engagement Value', 'Lead Generation', 'Brand Awareness'],
-                    'Value (₩K)': [2300, 800, 500, 400]
-                })
-                
-                fig = px.pie(roi_data, values='Value (₩K)', names='Category',
-                           title='ROI Breakdown',
-                           color_discrete_sequence=['#667eea', '#f093fb', '#4facfe', '#ffecd2'])
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_roi_pie(), use_container_width=True)
             
             st.success("📊 **Monthly ROI Summary**: ₩4M value generated from ₩299K investment = 1,240% ROI")
     
@@ -774,44 +914,29 @@ else:
             
             content = st.text_area("Content", height=100, placeholder="Your amazing content here...")
             
-            col_s1, col_s2 = st.columns(2)
-            with col_s1:
-                platform = st.selectbox("Platform", ["Twitter", "Instagram", "LinkedIn", "TikTok"])
-                schedule_type = st.selectbox("Scheduling", ["Specific Time", "AI Optimal Time", "Recurring"])
-            with col_s2:
-                if schedule_type == "Specific Time":
-                    schedule_date = st.date_input("Date", min_value=datetime.now().date())
-                    schedule_time = st.time_input("Time")
-                elif schedule_type == "AI Optimal Time":
-                    st.info("🤖 AI will choose the best time based on your audience")
-                else:
-                    repeat_frequency = st.selectbox("Frequency", ["Daily", "Weekly", "Monthly"])
+            # Single column grid for the tab: scheduling inputs stack under the
+            # content box instead of opening a nested column split
+            platform = st.selectbox("Platform", ["Twitter", "Instagram", "LinkedIn", "TikTok"])
+            schedule_type = st.selectbox("Scheduling", ["Specific Time", "AI Optimal Time", "Recurring"])
+            if schedule_type == "Specific Time":
+                schedule_date = st.date_input("Date", min_value=datetime.now().date())
+                schedule_time = st.time_input("Time")
+            elif schedule_type == "AI Optimal Time":
+                st.info("🤖 AI will choose the best time based on your audience")
+            else:
+                repeat_frequency = st.selectbox("Frequency", ["Daily", "Weekly", "Monthly"])
             
             if st.button("📅 Schedule Post", type="primary", use_container_width=True):
                 st.success(f"✅ Post scheduled successfully for {platform}!")
             
             st.markdown("### 📋 Scheduled Posts")
             
-            scheduled = [
-                {"Time": "Today 2:00 PM", "Platform": "Twitter", "Content": "🚀 Exciting AI update coming...", "Status": "⏳ Pending", "Engagement": "Est. 5.2%"},
-                {"Time": "Tomorrow 10:00 AM", "Platform": "LinkedIn", "Content": "Industry insights on automation...", "Status": "⏳ Pending", "Engagement": "Est. 4.8%"},
-                {"Time": "Friday 3:00 PM", "Platform": "Instagram", "Content": "Behind the scenes content...", "Status": "⏳ Pending", "Engagement": "Est. 7.1%"}
-            ]
-            
-            df = pd.DataFrame(scheduled)
-            st.dataframe(df, use_container_width=True, hide_index=True)
+            st.table(_SCHEDULED_POSTS)
         
         with col2:
             st.markdown("### 🎯 AI Recommendations")
             
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1.5rem; border-radius: 12px; margin-bottom: 1rem;">
-                <h4>📊 Optimal Times</h4>
-                <p><strong>Twitter:</strong> 9 AM, 2 PM<br>
-                <strong>Instagram:</strong> 11 AM, 7 PM<br>
-                <strong>LinkedIn:</strong> 8 AM, 5 PM</p>
-            </div>
-            """, unsafe_allow_html=True)
+            _html(_AI_TIMES_HTML)
             
             st.markdown("### 📈 Scheduler Stats")
             st.metric("Posts This Week", "12")
@@ -828,11 +953,12 @@ else:
         
         with settings_tabs[0]:  # Profile
             st.markdown("### 👤 Account Settings")
+            _email = st.session_state.get("user_email", "")
             
             col1, col2 = st.columns(2)
             
             with col1:
-                st.text_input("Email", value=st.session_state.user_email, disabled=True)
+                st.text_input("Email", value=_email, disabled=True)
                 st.text_input("Company Name", placeholder="Your company")
                 st.selectbox("Industry", ["Technology", "Marketing", "E-commerce", "Healthcare", "Finance", "Other"])
                 st.selectbox("Team Size", ["1-5", "6-20", "21-50", "51-200", "200+"])
@@ -849,14 +975,7 @@ else:
         with settings_tabs[1]:  # Integrations
             st.markdown("### 🔗 Platform Integrations")
             
-            platforms = [
-                {"name": "Twitter", "status": "✅ Connected", "accounts": "2 accounts"},
-                {"name": "Instagram", "status": "✅ Connected", "accounts": "1 business account"},
-                {"name": "LinkedIn", "status": "❌ Not Connected", "accounts": "Add account"},
-                {"name": "TikTok", "status": "❌ Not Connected", "accounts": "Add account"}
-            ]
-            
-            for platform in platforms:
+            for i, platform in enumerate(_INTEGRATIONS):
                 col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
                 with col1:
                     st.markdown(f"**{platform['name']}**")
@@ -866,9 +985,9 @@ else:
                     st.markdown(platform['accounts'])
                 with col4:
                     if "Connected" in platform['status']:
-                        st.button("Manage", key=f"manage_{platform['name']}")
+                        st.button("Manage", key=_MANAGE_KEYS[i])
                     else:
-                        st.button("Connect", key=f"connect_{platform['name']}", type="primary")
+                        st.button("Connect", key=_CONNECT_KEYS[i], type="primary")
         
         with settings_tabs[2]:  # Billing
             st.markdown("### 💳 Billing & Subscription")
@@ -876,7 +995,7 @@ else:
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown("""
+                _html("""
                 <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 12px;">
                     <h3>Pro Plan</h3>
                     <h2>$299/month</h2>
@@ -885,7 +1004,7 @@ else:
                     ✅ Advanced analytics<br>
                     ✅ Priority support</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """)
             
             with col2:
                 st.markdown("### 📊 Usage This Month")
@@ -901,21 +1020,32 @@ else:
         with settings_tabs[3]:  # AI Config
             st.markdown("### 🤖 AI Configuration")
             
-            st.markdown("#### Content Generation Settings")
-            creativity_level = st.slider("Creativity Level", 0.1, 1.0, 0.7, help="Higher = more creative, Lower = more conservative")
-            brand_voice = st.selectbox("Default Brand Voice", ["Professional", "Casual", "Friendly", "Expert", "Inspirational"])
-            
-            st.markdown("#### Engagement Settings")
-            response_style = st.selectbox("Response Style", ["Helpful", "Enthusiastic", "Professional", "Witty"])
-            auto_engage = st.checkbox("Enable Auto-Engagement", value=True)
+            st.markdown("#### Content & Engagement Settings")
+            # One editable row instead of four separate widgets
+            ai_config = st.data_editor(
+                pd.DataFrame([_AI_CONFIG_DEFAULTS]),
+                column_config={
+                    "Creativity Level": st.column_config.NumberColumn(
+                        min_value=0.1, max_value=1.0, step=0.1,
+                        help="Higher = more creative, Lower = more conservative"
+                    ),
+                    "Default Brand Voice": st.column_config.SelectboxColumn(options=_BRAND_VOICE_OPTIONS, required=True),
+                    "Response Style": st.column_config.SelectboxColumn(options=_RESPONSE_STYLE_OPTIONS, required=True),
+                    "Enable Auto-Engagement": st.column_config.CheckboxColumn()
+                },
+                num_rows="fixed",
+                hide_index=True,
+                use_container_width=True,
+                key="ai_config_editor"
+            )
             
             if st.button("🔧 Update AI Settings", type="primary"):
+                config = ai_config.iloc[0].to_dict()
+                creativity_level = config["Creativity Level"]
+                brand_voice = config["Default Brand Voice"]
+                response_style = config["Response Style"]
+                auto_engage = config["Enable Auto-Engagement"]
                 st.success("✅ AI configuration updated successfully!")
     
     # Footer with logout
-    st.markdown("---")
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col2:
-        if st.button("🚪 Logout", use_container_width=True):
-            logout()
-            st.rerun()
\ No newline at end of file
+    _footer()
\ No newline at end of file
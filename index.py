@@ -3,136 +3,89 @@ NorthStar AI - Ultra Minimal FastAPI Version for Vercel
 Basic HTML interface with AI content generation
 """
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import hashlib
+import html
+import json
 import os
+import re
+import tempfile
+import time
 
-app = FastAPI(title="NorthStar AI")
+try:
+    import orjson  # noqa: F401  (needed by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    _DefaultResponse = JSONResponse
 
-# Initialize Anthropic client
+# Imported at module load so the cost lands in the cold-start init phase
+# rather than on the first /generate request
+try:
+    import anthropic
+    _ANTHROPIC_OK = True
+except ImportError:
+    anthropic = None
+    _ANTHROPIC_OK = False
+
+app = FastAPI(title="NorthStar AI", default_response_class=_DefaultResponse)
+
+def _make_http_client():
+    # Shared keep-alive pool for Anthropic calls; HTTP/2 multiplexes the
+    # concurrent primary/variant requests over one connection when h2 is present
+    import httpx
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    return anthropic.DefaultAsyncHttpxClient(
+        http2=http2,
+        timeout=anthropic.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+    )
+
+# Initialize Anthropic client once; it owns a connection pool worth reusing
+@lru_cache(maxsize=1)
 def get_anthropic_client():
     api_key = os.environ.get('ANTHROPIC_API_KEY')
-    if api_key:
-        try:
-            import anthropic
-            return anthropic.Anthropic(api_key=api_key)
-        except ImportError:
-            return None
-    return None
+    if not (_ANTHROPIC_OK and api_key):
+        return None
+    return anthropic.AsyncAnthropic(api_key=api_key, http_client=_make_http_client())
 
-@app.get("/", response_class=HTMLResponse)
-async def homepage():
-    return """
+@app.on_event("shutdown")
+async def close_anthropic_client():
+    if get_anthropic_client.cache_info().currsize:
+        client = get_anthropic_client()
+        if client:
+            await client.close()
+
+# Shared stylesheet; the content hash in the URL lets browsers cache it forever
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+with open(os.path.join(_STATIC_DIR, "app.css"), "rb") as _css:
+    _CSS_HREF = "/static/app.css?v=%s" % hashlib.sha256(_css.read()).hexdigest()[:12]
+_STYLESHEET_LINK = '<link rel="stylesheet" href="%s">' % _CSS_HREF
+
+class _ImmutableStaticFiles(StaticFiles):
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+app.mount("/static", _ImmutableStaticFiles(directory=_STATIC_DIR, html=False), name="static")
+
+# Static homepage, encoded once at import
+_HOMEPAGE_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>NorthStar AI - Social Media Automation</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6; 
-            color: #333;
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            min-height: 100vh;
-        }
-        .container { max-width: 1200px; margin: 0 auto; padding: 2rem; }
-        .hero {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            text-align: center;
-            padding: 4rem 2rem;
-            border-radius: 20px;
-            margin-bottom: 3rem;
-            box-shadow: 0 20px 40px rgba(102, 126, 234, 0.3);
-        }
-        .hero h1 { font-size: 3.5rem; margin-bottom: 1rem; font-weight: 700; }
-        .hero p { font-size: 1.3rem; opacity: 0.9; }
-        .content-section {
-            background: white;
-            padding: 3rem;
-            border-radius: 16px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            margin-bottom: 2rem;
-        }
-        .form-group { margin-bottom: 1.5rem; }
-        .form-group label { 
-            display: block; 
-            margin-bottom: 0.5rem; 
-            font-weight: 600; 
-            color: #555;
-        }
-        .form-control {
-            width: 100%;
-            padding: 1rem;
-            border: 2px solid #e1e5e9;
-            border-radius: 8px;
-            font-size: 1rem;
-            transition: border-color 0.3s ease;
-        }
-        .form-control:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-        select.form-control { height: 3.5rem; }
-        textarea.form-control { min-height: 120px; resize: vertical; }
-        .btn {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem 2rem;
-            border: none;
-            border-radius: 50px;
-            font-size: 1.1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            width: 100%;
-        }
-        .btn:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-        }
-        .checkbox-group {
-            display: flex;
-            gap: 2rem;
-            margin: 1rem 0;
-        }
-        .checkbox-item {
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        .stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1.5rem;
-            margin: 2rem 0;
-        }
-        .stat-card {
-            background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-            color: white;
-            padding: 2rem;
-            border-radius: 16px;
-            text-align: center;
-        }
-        .stat-number { font-size: 2.5rem; font-weight: 700; margin-bottom: 0.5rem; }
-        .result-box {
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            padding: 2rem;
-            border-radius: 12px;
-            border-left: 4px solid #667eea;
-            margin: 1.5rem 0;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        }
-        .grid { display: grid; grid-template-columns: 2fr 1fr; gap: 2rem; }
-        @media (max-width: 768px) {
-            .grid { grid-template-columns: 1fr; }
-            .hero h1 { font-size: 2.5rem; }
-            .checkbox-group { flex-direction: column; gap: 1rem; }
-        }
-    </style>
+    """ + _STYLESHEET_LINK + """
 </head>
 <body>
     <div class="container">
@@ -187,8 +140,13 @@ async def homepage():
                         </div>
                     </div>
                     
-                    <button type="submit" class="btn">🚀 Generate Content</button>
+                    <button type="submit" class="btn btn-block">🚀 Generate Content</button>
                 </form>
+                
+                <div id="result" hidden>
+                    <h3>🎯 Generated Content</h3>
+                    <div class="generated-content"></div>
+                </div>
             </div>
             
             <div class="content-section">
@@ -208,9 +166,186 @@ async def homepage():
             </div>
         </div>
     </div>
+    <script>
+        // Stream tokens into the page as they arrive; without EventSource the
+        // form falls back to the full-page POST /generate
+        document.querySelector('form[action="/generate"]').addEventListener('submit', function (event) {
+            if (!window.EventSource) return;
+            event.preventDefault();
+            var box = document.getElementById('result');
+            var output = box.querySelector('.generated-content');
+            var button = this.querySelector('button');
+            var source = new EventSource('/generate/stream?' + new URLSearchParams(new FormData(this)));
+            var finish = function () { source.close(); button.disabled = false; };
+            output.textContent = '';
+            box.hidden = false;
+            button.disabled = true;
+            source.onmessage = function (message) {
+                var data = JSON.parse(message.data);
+                if (data.delta) output.textContent += data.delta;
+                if (data.error) output.textContent = data.error;
+            };
+            source.addEventListener('done', finish);
+            source.onerror = finish;
+        });
+    </script>
 </body>
 </html>
-    """
+"""
+_HOMEPAGE_BYTES = _HOMEPAGE_HTML.encode("utf-8")
+_HOMEPAGE_ETAG = '"%s"' % hashlib.sha256(_HOMEPAGE_BYTES).hexdigest()[:32]
+_HOMEPAGE_HEADERS = {"ETag": _HOMEPAGE_ETAG, "Cache-Control": "public, max-age=60, s-maxage=300"}
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+@app.get("/", response_class=HTMLResponse)
+async def homepage(request: Request):
+    # Revalidations of the unchanged page get an empty 304 instead of the body
+    if _etag_matches(request.headers.get("if-none-match"), _HOMEPAGE_ETAG):
+        return Response(status_code=304, headers=_HOMEPAGE_HEADERS)
+    return HTMLResponse(content=_HOMEPAGE_BYTES, headers=_HOMEPAGE_HEADERS)
+
+# Prompt pieces are fixed, so build them once rather than per request
+_PLATFORM_PROMPTS = {
+    "twitter": "Create an engaging Twitter post (max 280 characters)",
+    "instagram": "Create an engaging Instagram caption with visual appeal",
+    "linkedin": "Create a professional LinkedIn post",
+    "tiktok": "Create a fun, viral TikTok caption"
+}
+_DEFAULT_PLATFORM_PROMPT = _PLATFORM_PROMPTS["twitter"]
+_HASHTAG_SUFFIX = "\n\nInclude 3-5 relevant hashtags."
+_EMOJI_SUFFIX = "\nInclude appropriate emojis."
+_VARIANT_SUFFIX = "\n\nWrite an alternative version with a different hook."
+
+def _build_prompt(platform, prompt, hashtags, emojis):
+    return "".join((
+        _PLATFORM_PROMPTS.get(platform.lower(), _DEFAULT_PLATFORM_PROMPT),
+        " about: ",
+        prompt.strip(),
+        _HASHTAG_SUFFIX if hashtags else "",
+        _EMOJI_SUFFIX if emojis else ""
+    ))
+
+# Bound on the concurrent primary + variant calls so a slow one can't hang /generate
+_GENERATE_TIMEOUT = 25
+
+async def _complete(client, ai_prompt):
+    response = await client.messages.create(
+        model="claude-3-5-sonnet-20241022",
+        max_tokens=400,
+        messages=[{
+            "role": "user",
+            "content": ai_prompt
+        }]
+    )
+    return response.content[0].text if response.content else ""
+
+# Near-duplicate prompts ("Launch our new AI feature" vs "launch our new AI
+# feature!") reuse an earlier generation instead of another LLM round trip.
+# Similarity is Jaccard over word unigrams + bigrams, so word order still counts.
+_CACHE_MAX_ENTRIES = 512
+_CACHE_MIN_SIMILARITY = 0.9
+_generation_cache = OrderedDict()
+
+def _prompt_shingles(prompt):
+    words = re.findall(r"\w+", prompt.lower())
+    return frozenset(words) | frozenset(zip(words, words[1:]))
+
+def _cache_get(scope, shingles):
+    key = (scope, shingles)
+    if key in _generation_cache:
+        _generation_cache.move_to_end(key)
+        return _generation_cache[key]
+    
+    best_key, best_score = None, _CACHE_MIN_SIMILARITY
+    for cached_key in _generation_cache:
+        cached_scope, cached_shingles = cached_key
+        if cached_scope != scope:
+            continue
+        score = len(shingles & cached_shingles) / len(shingles | cached_shingles)
+        if score >= best_score:
+            best_key, best_score = cached_key, score
+    
+    if best_key is None:
+        return None
+    _generation_cache.move_to_end(best_key)
+    return _generation_cache[best_key]
+
+def _cache_put(scope, shingles, text):
+    _generation_cache[(scope, shingles)] = text
+    _generation_cache.move_to_end((scope, shingles))
+    if len(_generation_cache) > _CACHE_MAX_ENTRIES:
+        _generation_cache.popitem(last=False)
+
+# Exact-match L2 behind the in-memory cache: one file per sha256 key under
+# /tmp, so identical prompts survive a process restart on the same instance.
+# The file helpers block, so the handlers run them via asyncio.to_thread.
+_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), "northstar-llm-cache")
+_DISK_CACHE_TTL = 86400
+_DISK_CACHE_MAX_FILES = 2048
+
+def _disk_cache_get(digest):
+    path = os.path.join(_DISK_CACHE_DIR, digest)
+    try:
+        if time.time() - os.path.getmtime(path) > _DISK_CACHE_TTL:
+            os.remove(path)
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _disk_cache_prune():
+    # Drop the least recently written files once the directory is over its cap
+    entries = list(os.scandir(_DISK_CACHE_DIR))
+    if len(entries) <= _DISK_CACHE_MAX_FILES:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[:len(entries) - _DISK_CACHE_MAX_FILES]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def _disk_cache_set(digest, text):
+    path = os.path.join(_DISK_CACHE_DIR, digest)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        _disk_cache_prune()
+    except OSError:
+        pass
+
+def _cache_keys(shape, platform, prompt, hashtags, emojis):
+    # shape separates what each endpoint stores: "post" is primary plus
+    # alternative, "stream" the primary text alone
+    scope = (shape, platform.lower(), bool(hashtags), bool(emojis))
+    digest = hashlib.sha256(
+        f"{shape}|{scope[1]}|{prompt.strip()}|{scope[2]}|{scope[3]}".encode("utf-8")
+    ).hexdigest()
+    return scope, _prompt_shingles(prompt), digest
+
+async def _lookup_generation(keys):
+    scope, shingles, digest = keys
+    cached = _cache_get(scope, shingles) if shingles else None
+    if cached is None:
+        cached = await asyncio.to_thread(_disk_cache_get, digest)
+        if cached is not None and shingles:
+            _cache_put(scope, shingles, cached)
+    return cached
+
+async def _store_generation(keys, text):
+    scope, shingles, digest = keys
+    if shingles:
+        _cache_put(scope, shingles, text)
+    await asyncio.to_thread(_disk_cache_set, digest, text)
 
 @app.post("/generate", response_class=HTMLResponse)
 async def generate_content(
@@ -228,123 +363,146 @@ async def generate_content(
         if not client:
             return error_page("AI service not configured. Please contact support.")
         
-        # Create platform-specific prompt
-        platform_info = {
-            "twitter": "Create an engaging Twitter post (max 280 characters)",
-            "instagram": "Create an engaging Instagram caption with visual appeal", 
-            "linkedin": "Create a professional LinkedIn post",
-            "tiktok": "Create a fun, viral TikTok caption"
-        }
+        keys = _cache_keys("post", platform, prompt, hashtags, emojis)
+        cached = await _lookup_generation(keys)
+        if cached is not None:
+            return success_page(cached, platform.title())
+        
+        ai_prompt = _build_prompt(platform, prompt, hashtags, emojis)
         
-        ai_prompt = f"{platform_info.get(platform.lower(), platform_info['twitter'])} about: {prompt.strip()}"
+        # Primary and alternative are independent calls, so run them concurrently
+        try:
+            primary, variant = await asyncio.wait_for(
+                asyncio.gather(
+                    _complete(client, ai_prompt),
+                    _complete(client, ai_prompt + _VARIANT_SUFFIX),
+                    return_exceptions=True
+                ),
+                timeout=_GENERATE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            primary = variant = None
         
-        if hashtags:
-            ai_prompt += "\\n\\nInclude 3-5 relevant hashtags."
+        if isinstance(primary, str):
+            generated_text = primary or "AI-generated content for your social media post!"
+            if isinstance(variant, str) and variant:
+                generated_text += f"\n\nAlternative version:\n{variant}"
+                # Only complete results are cached; a missing alternative
+                # (error or timeout) is retried on the next request
+                if primary:
+                    await _store_generation(keys, generated_text)
+        else:
+            generated_text = f"Demo content for {platform.title()}: {prompt[:100]}... [AI generation temporarily unavailable]"
         
-        if emojis:
-            ai_prompt += "\\nInclude appropriate emojis."
+        return success_page(generated_text, platform.title())
         
-        ai_prompt += "\\n\\nAlso provide one alternative version."
+    except Exception as e:
+        return error_page("Something went wrong. Please try again.")
+
+def _sse(payload):
+    return f"data: {json.dumps(payload)}\n\n"
+
+_SSE_DONE = "event: done\ndata: {}\n\n"
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@app.get("/generate/stream")
+async def generate_stream(
+    platform: str = "twitter",
+    prompt: str = "",
+    hashtags: str = None,
+    emojis: str = None
+):
+    """Server-sent events version of /generate: one {"delta": ...} per text chunk"""
+    async def events():
+        if len(prompt.strip()) < 3:
+            yield _sse({"error": "Please enter a valid content description (at least 3 characters)."})
+            yield _SSE_DONE
+            return
         
-        # Call Anthropic API with error handling
+        client = get_anthropic_client()
+        if not client:
+            yield _sse({"error": "AI service not configured. Please contact support."})
+            yield _SSE_DONE
+            return
+        
+        keys = _cache_keys("stream", platform, prompt, hashtags, emojis)
+        cached = await _lookup_generation(keys)
+        if cached is not None:
+            yield _sse({"delta": cached})
+            yield _SSE_DONE
+            return
+        
+        chunks = []
         try:
-            response = client.messages.create(
+            async with client.messages.stream(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=400,
                 messages=[{
                     "role": "user",
-                    "content": ai_prompt
+                    "content": _build_prompt(platform, prompt, hashtags, emojis)
                 }]
-            )
-            
-            generated_text = response.content[0].text if response.content else "AI-generated content for your social media post!"
-            
-        except Exception as api_error:
-            generated_text = f"Demo content for {platform.title()}: {prompt[:100]}... [AI generation temporarily unavailable]"
-        
-        return success_page(generated_text, platform.title())
-        
-    except Exception as e:
-        return error_page("Something went wrong. Please try again.")
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    yield _sse({"delta": text})
+        except Exception:
+            yield _sse({"error": "AI generation temporarily unavailable. Please try again."})
+        else:
+            if chunks:
+                await _store_generation(keys, "".join(chunks))
+        yield _SSE_DONE
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_SSE_HEADERS)
 
-def success_page(content, platform):
-    return f"""
+# Upper bound on jobs per batch so one request can't fan out unboundedly
+_MAX_BATCH_JOBS = 5
+
+@app.post("/generate/batch")
+async def generate_batch(request: Request):
+    """Run several generations in one round trip: {"jobs": [...]} -> {"results": [...]}"""
+    try:
+        body = await request.json()
+    except ValueError:
+        body = {}
+    jobs = body.get("jobs") if isinstance(body, dict) else None
+    if not isinstance(jobs, list) or not 0 < len(jobs) <= _MAX_BATCH_JOBS:
+        return JSONResponse({"error": f"Provide between 1 and {_MAX_BATCH_JOBS} jobs"}, status_code=422)
+    if not all(isinstance(job, dict) for job in jobs):
+        return JSONResponse({"error": "Every job must be an object"}, status_code=422)
+    
+    client = get_anthropic_client()
+    if not client:
+        return JSONResponse({"error": "AI service not configured"}, status_code=503)
+    
+    async def run(job):
+        platform = job.get("platform", "twitter")
+        prompt = job.get("prompt", "")
+        if not isinstance(prompt, str) or len(prompt.strip()) < 3:
+            return {"platform": platform, "error": "Prompt too short"}
+        try:
+            text = await _complete(client, _build_prompt(platform, prompt, job.get("hashtags"), job.get("emojis")))
+            return {"platform": platform, "content": text}
+        except Exception:
+            return {"platform": platform, "error": "AI generation temporarily unavailable"}
+    
+    # Jobs are independent, so total latency is the slowest job rather than the sum
+    results = await asyncio.gather(*(run(job) for job in jobs))
+    return {"results": results}
+
+_SUCCESS_TMPL = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Content Generated - NorthStar AI</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6; 
-            color: #333;
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            min-height: 100vh;
-            padding: 2rem;
-        }}
-        .container {{ max-width: 800px; margin: 0 auto; }}
-        .success-header {{
-            background: linear-gradient(135deg, #00C851 0%, #007E33 100%);
-            color: white;
-            text-align: center;
-            padding: 2rem;
-            border-radius: 16px;
-            margin-bottom: 2rem;
-        }}
-        .content-box {{
-            background: white;
-            padding: 2.5rem;
-            border-radius: 16px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            margin-bottom: 2rem;
-        }}
-        .generated-content {{
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            padding: 2rem;
-            border-radius: 12px;
-            border-left: 4px solid #667eea;
-            margin: 1.5rem 0;
-            font-size: 1.1rem;
-            line-height: 1.6;
-            white-space: pre-wrap;
-        }}
-        .metrics {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 1rem;
-            margin: 2rem 0;
-        }}
-        .metric {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1.5rem;
-            border-radius: 12px;
-            text-align: center;
-        }}
-        .btn {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem 2rem;
-            border: none;
-            border-radius: 50px;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            text-decoration: none;
-            display: inline-block;
-            transition: transform 0.3s ease;
-        }}
-        .btn:hover {{ transform: translateY(-2px); }}
-    </style>
+    """ + _STYLESHEET_LINK + """
 </head>
 <body>
-    <div class="container">
+    <div class="container narrow">
         <div class="success-header">
             <h1>✅ Content Generated Successfully!</h1>
-            <p>Your {platform.title()} content is ready to go viral</p>
+            <p>Your {platform} content is ready to go viral</p>
         </div>
         
         <div class="content-box">
@@ -372,54 +530,24 @@ def success_page(content, platform):
     </div>
 </body>
 </html>
-    """
+"""
 
-def error_page(error_message):
-    return f"""
+def success_page(content, platform):
+    return _SUCCESS_TMPL.format_map({
+        "content": html.escape(content),
+        "platform": html.escape(platform.title())
+    })
+
+_ERROR_TMPL = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Error - NorthStar AI</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6; 
-            color: #333;
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            min-height: 100vh;
-            padding: 2rem;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        .error-box {{
-            background: white;
-            padding: 3rem;
-            border-radius: 16px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            text-align: center;
-            max-width: 500px;
-        }}
-        .error-icon {{ font-size: 4rem; margin-bottom: 1rem; }}
-        .btn {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem 2rem;
-            border: none;
-            border-radius: 50px;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            text-decoration: none;
-            display: inline-block;
-            margin-top: 2rem;
-        }}
-    </style>
+    """ + _STYLESHEET_LINK + """
 </head>
-<body>
+<body class="centered">
     <div class="error-box">
         <div class="error-icon">⚠️</div>
         <h2>Oops! Something went wrong</h2>
@@ -429,11 +557,17 @@ def error_page(error_message):
     </div>
 </body>
 </html>
-    """
+"""
+
+def error_page(error_message):
+    return _ERROR_TMPL.format_map({"error_message": html.escape(error_message)})
+
+_HEALTH_HEADERS = {"Cache-Control": "no-store"}
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "northstar-ai"}
+    # Never let the edge cache a "healthy" reply from an instance that has since failed
+    return _DefaultResponse({"status": "healthy", "service": "northstar-ai"}, headers=_HEALTH_HEADERS)
 
 # Vercel expects 'app' to be available directly
 # No need for a custom handler function
\ No newline at end of file
@@ -1,4 +1,4 @@
-from .twitter_api import TwitterAPI
-from .instagram_api import InstagramAPI
+from .twitter_api import TwitterAPI, get_twitter_api
+from .instagram_api import InstagramAPI, get_instagram_api
 
-__all__ = ['TwitterAPI', 'InstagramAPI']
\ No newline at end of file
+__all__ = ['TwitterAPI', 'InstagramAPI', 'get_twitter_api', 'get_instagram_api']
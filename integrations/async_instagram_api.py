@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+from .instagram_api import InstagramAPI, get_instagram_api, _json_loads
+
+logger = logging.getLogger(__name__)
+
+class AsyncInstagramAPI:
+    """asyncio version of the InstagramAPI read endpoints.
+
+    Shares one httpx client so callers can ``asyncio.gather`` many media ids
+    at once; a semaphore keeps concurrent Graph API requests under rate limits.
+    """
+
+    def __init__(self, api: Optional[InstagramAPI] = None, max_concurrency: int = 5):
+        # Configuration, mock responses and lookup caches come from the
+        # process-wide sync client, which this class never closes
+        self._api = api or get_instagram_api()
+        self.base_url = self._api.base_url
+        self.mock_mode = self._api.mock_mode
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Created lazily so both live on the caller's running event loop
+        if self._client is None or self._client.is_closed:
+            # With HTTP/2, concurrent requests share one multiplexed TLS connection
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._client
+
+    async def _get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        client = self._get_client()
+        params = {**self._api._base_params, **params}
+
+        async with self._semaphore:
+            response = await client.get(endpoint, params=params)
+        if response.status_code == 200:
+            return _json_loads(response.content)
+        logger.error(f"Instagram API error {response.status_code}: {response.text}")
+        return None
+
+    async def get_insights(self, media_id: str, metrics: Optional[List[str]] = None) -> Dict:
+        if self.mock_mode:
+            return self._api._mock_get_insights(media_id)
+
+        try:
+            if not metrics:
+                metrics = ['impressions', 'reach', 'engagement', 'saved']
+
+            body = await self._get(
+                f"{self.base_url}/{media_id}/insights",
+                {'metric': ','.join(metrics)}
+            )
+            if body is None:
+                return {}
+
+            return {metric['name']: metric['values'][0]['value'] for metric in body.get('data', [])}
+
+        except Exception as e:
+            logger.error(f"Insights fetch error: {e}")
+            return {}
+
+    async def get_comments(self, media_id: str) -> List[Dict]:
+        if self.mock_mode:
+            return self._api._mock_get_comments(media_id)
+
+        try:
+            body = await self._get(
+                f"{self.base_url}/{media_id}/comments",
+                {'fields': 'id,text,username,timestamp'}
+            )
+            return body.get('data', []) if body else []
+
+        except Exception as e:
+            logger.error(f"Comments fetch error: {e}")
+            return []
+
+    async def get_hashtag_search(self, hashtag: str) -> Dict:
+        if self.mock_mode:
+            return self._api._mock_hashtag_search(hashtag)
+
+        try:
+            # Shares the sync client's hashtag id cache
+            hashtag_id = self._api._hashtag_ids.get(hashtag)
+            if not hashtag_id:
+                search = await self._get(f"{self.base_url}/ig_hashtag_search", {'q': hashtag})
+                if not search:
+                    return {}
+
+                hashtag_id = search['data'][0]['id']
+                self._api._hashtag_ids[hashtag] = hashtag_id
+
+            media = await self._get(
+                f"{self.base_url}/{hashtag_id}/recent_media",
+                {'fields': 'id,caption,media_type,media_url,permalink', 'limit': '25'}
+            )
+            return media or {}
+
+        except Exception as e:
+            logger.error(f"Hashtag search error: {e}")
+            return {}
+
+    async def gather_insights(self, media_ids: List[str],
+                              metrics: Optional[List[str]] = None) -> Dict[str, Dict]:
+        results = await asyncio.gather(*(self.get_insights(media_id, metrics) for media_id in media_ids))
+        return dict(zip(media_ids, results))
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+from .twitter_api import TwitterAPI, get_twitter_api, _json_loads, _MAX_IDS_PER_LOOKUP
+
+logger = logging.getLogger(__name__)
+
+class AsyncTwitterAPI:
+    """asyncio version of the TwitterAPI read endpoints.
+
+    Shares one httpx client so independent lookups can run concurrently
+    under ``asyncio.gather``; a semaphore bounds in-flight requests.
+    """
+
+    def __init__(self, api: Optional[TwitterAPI] = None, max_concurrency: int = 5):
+        # Configuration, mock responses and lookup caches come from the
+        # process-wide sync client, which this class never closes
+        self._api = api or get_twitter_api()
+        self.base_url = self._api.base_url
+        self.mock_mode = self._api.mock_mode
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Created lazily so both live on the caller's running event loop
+        if self._client is None or self._client.is_closed:
+            # With HTTP/2, concurrent requests share one multiplexed TLS connection
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                headers=self._api._headers,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._client
+
+    async def _get(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        client = self._get_client()
+
+        async with self._semaphore:
+            response = await client.get(endpoint, params=params)
+        if response.status_code == 200:
+            return _json_loads(response.content)
+        logger.error(f"Twitter API error: {response.status_code}")
+        return None
+
+    async def get_mentions(self, since_id: Optional[str] = None) -> List[Dict]:
+        if self.mock_mode:
+            return self._api._mock_get_mentions()
+
+        try:
+            params = {"max_results": "100"}
+            if since_id:
+                params["since_id"] = since_id
+
+            body = await self._get(f"{self.base_url}/users/me/mentions", params)
+            return body.get('data', []) if body else []
+
+        except Exception as e:
+            logger.error(f"Twitter mentions fetch error: {e}")
+            return []
+
+    async def get_analytics(self, tweet_ids: List[str]) -> Dict:
+        if self.mock_mode:
+            return self._api._mock_get_analytics(tweet_ids)
+
+        # The /tweets lookup accepts at most 100 ids per request
+        chunks = [tweet_ids[i:i + _MAX_IDS_PER_LOOKUP]
+                  for i in range(0, len(tweet_ids), _MAX_IDS_PER_LOOKUP)]
+        analytics = {}
+        for fetched in await asyncio.gather(*(self._fetch_analytics_chunk(c) for c in chunks)):
+            analytics.update(fetched)
+        return analytics
+
+    async def _fetch_analytics_chunk(self, tweet_ids: List[str]) -> Dict:
+        try:
+            body = await self._get(
+                f"{self.base_url}/tweets",
+                {"ids": ",".join(tweet_ids), "tweet.fields": "public_metrics,created_at"}
+            )
+            if body is None:
+                return {}
+
+            analytics = {}
+            for tweet in body.get('data', []):
+                analytics[tweet['id']] = {
+                    'impressions': tweet['public_metrics'].get('impression_count', 0),
+                    'likes': tweet['public_metrics'].get('like_count', 0),
+                    'retweets': tweet['public_metrics'].get('retweet_count', 0),
+                    'replies': tweet['public_metrics'].get('reply_count', 0),
+                    'created_at': tweet.get('created_at')
+                }
+            return analytics
+
+        except Exception as e:
+            logger.error(f"Twitter analytics fetch error: {e}")
+            return {}
+
+    async def search_tweets(self, query: str, max_results: int = 10) -> List[Dict]:
+        if self.mock_mode:
+            return self._api._mock_search_tweets(query)
+
+        try:
+            body = await self._get(
+                f"{self.base_url}/tweets/search/recent",
+                {
+                    "query": query,
+                    "max_results": str(min(max_results, 100)),
+                    "tweet.fields": "author_id,created_at,public_metrics"
+                }
+            )
+            return body.get('data', []) if body else []
+
+        except Exception as e:
+            logger.error(f"Twitter search error: {e}")
+            return []
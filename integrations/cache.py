@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Hashable, Optional
+
+@lru_cache(maxsize=1)
+def _format_utc_second(second: int) -> str:
+    return datetime.utcfromtimestamp(second).isoformat()
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO string, truncated to the second.
+
+    Formatted once per second, for the mock responses that stamp every fake event.
+    """
+    return _format_utc_second(int(time.time()))
+
+class TTLCache:
+    """Small in-process cache with per-entry expiry and LRU eviction.
+
+    Thread-safe: instances live on the process-wide API clients, which are used
+    from Streamlit script threads, publisher workers and the scheduler at once.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,18 +1,95 @@
+import copy
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
+import queue
+import threading
+import time
+
+from .cache import TTLCache, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+def _parse(response: requests.Response):
+    # Parse the raw body directly, skipping requests' charset detection
+    return _json_loads(response.content)
+
+# Credentials are read once at import; every client shares them
+_ACCESS_TOKEN = os.environ.get('INSTAGRAM_ACCESS_TOKEN')
+_BUSINESS_ACCOUNT_ID = os.environ.get('INSTAGRAM_BUSINESS_ID')
+_MOCK_MODE = not all([_ACCESS_TOKEN, _BUSINESS_ACCOUNT_ID])
+
+def _build_session() -> requests.Session:
+    # Pooled keep-alive connections to graph.facebook.com, with retries on
+    # rate limiting and transient server errors
+    # Status and read-error retries are limited to GET: a POST that reached the
+    # server may already have published. urllib3 still retries connect errors
+    # for every method, since those requests were never sent.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    # Advertise every codec urllib3 can decode here; brotli is added when the
+    # brotli package is installed and compresses the JSON noticeably better
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    return session
+
 class InstagramAPI:
     def __init__(self):
-        self.access_token = os.environ.get('INSTAGRAM_ACCESS_TOKEN')
-        self.business_account_id = os.environ.get('INSTAGRAM_BUSINESS_ID')
+        self.access_token = _ACCESS_TOKEN
+        self.business_account_id = _BUSINESS_ACCOUNT_ID
         self.base_url = "https://graph.facebook.com/v18.0"
-        self.mock_mode = not all([self.access_token, self.business_account_id])
+        self.mock_mode = _MOCK_MODE
+        self._base_params = {'access_token': self.access_token}
+        self._session = _build_session()
+        # Read endpoints are polled repeatedly by the dashboards; keep recent
+        # answers so repeat calls skip the Graph API (and its rate limits)
+        self._cache = TTLCache(maxsize=1024, ttl=600)
+        # Hashtag ids never change, so ig_hashtag_search is only asked once per tag
+        self._hashtag_ids: Dict[str, str] = {}
+        if self.mock_mode:
+            self._bind_mocks()
+    
+    def _bind_mocks(self):
+        # mock_mode is fixed at construction, so shadow the public methods with
+        # their mocks instead of branching on every call
+        self.create_post = lambda caption, media_url=None, media_type="IMAGE": self._mock_create_post(caption)
+        self.get_insights = lambda media_id, metrics=None: self._mock_get_insights(media_id)
+        self.get_comments = self._mock_get_comments
+        self.reply_to_comment = self._mock_reply_to_comment
+        self.get_hashtag_search = self._mock_hashtag_search
+    
+    def close(self):
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
         
     def create_post(self, caption: str, media_url: Optional[str] = None, 
                    media_type: str = "IMAGE") -> Dict:
@@ -39,7 +116,7 @@ class InstagramAPI:
             endpoint = f"{self.base_url}/{self.business_account_id}/media"
             
             params = {
-                'access_token': self.access_token,
+                **self._base_params,
                 'caption': caption
             }
             
@@ -49,10 +126,10 @@ class InstagramAPI:
                 params['video_url'] = media_url
                 params['media_type'] = 'VIDEO'
             
-            response = requests.post(endpoint, params=params)
+            response = self._session.post(endpoint, params=params)
             
             if response.status_code == 200:
-                return response.json().get('id')
+                return _parse(response).get('id')
             else:
                 logger.error(f"Instagram container creation error: {response.text}")
                 return None
@@ -66,16 +143,16 @@ class InstagramAPI:
             endpoint = f"{self.base_url}/{self.business_account_id}/media_publish"
             
             params = {
-                'access_token': self.access_token,
+                **self._base_params,
                 'creation_id': container_id
             }
             
-            response = requests.post(endpoint, params=params)
+            response = self._session.post(endpoint, params=params)
             
             if response.status_code == 200:
                 return {
                     'success': True,
-                    'media_id': response.json().get('id'),
+                    'media_id': _parse(response).get('id'),
                     'timestamp': datetime.utcnow().isoformat()
                 }
             else:
@@ -101,23 +178,29 @@ class InstagramAPI:
             if not metrics:
                 metrics = ['impressions', 'reach', 'engagement', 'saved']
             
+            cache_key = ('insights', media_id, tuple(sorted(metrics)))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+            
             endpoint = f"{self.base_url}/{media_id}/insights"
             
             params = {
-                'access_token': self.access_token,
+                **self._base_params,
                 'metric': ','.join(metrics)
             }
             
-            response = requests.get(endpoint, params=params)
+            response = self._session.get(endpoint, params=params)
             
             if response.status_code == 200:
-                data = response.json().get('data', [])
+                data = _parse(response).get('data', [])
                 insights = {}
                 
                 for metric in data:
                     insights[metric['name']] = metric['values'][0]['value']
                 
-                return insights
+                self._cache.set(cache_key, insights)
+                return dict(insights)
             else:
                 logger.error(f"Instagram insights error: {response.text}")
                 return {}
@@ -134,14 +217,14 @@ class InstagramAPI:
             endpoint = f"{self.base_url}/{media_id}/comments"
             
             params = {
-                'access_token': self.access_token,
+                **self._base_params,
                 'fields': 'id,text,username,timestamp'
             }
             
-            response = requests.get(endpoint, params=params)
+            response = self._session.get(endpoint, params=params)
             
             if response.status_code == 200:
-                return response.json().get('data', [])
+                return _parse(response).get('data', [])
             else:
                 logger.error(f"Instagram comments error: {response.text}")
                 return []
@@ -158,16 +241,16 @@ class InstagramAPI:
             endpoint = f"{self.base_url}/{comment_id}/replies"
             
             params = {
-                'access_token': self.access_token,
+                **self._base_params,
                 'message': message
             }
             
-            response = requests.post(endpoint, params=params)
+            response = self._session.post(endpoint, params=params)
             
             if response.status_code == 200:
                 return {
                     'success': True,
-                    'reply_id': response.json().get('id'),
+                    'reply_id': _parse(response).get('id'),
                     'timestamp': datetime.utcnow().isoformat()
                 }
             else:
@@ -182,33 +265,32 @@ class InstagramAPI:
         if self.mock_mode:
             return self._mock_hashtag_search(hashtag)
         
+        cache_key = ('hashtag_search', hashtag)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            # The payload nests a list of media dicts, so a shallow copy would
+            # still let callers mutate the shared entry
+            return copy.deepcopy(cached)
+        
         try:
-            search_endpoint = f"{self.base_url}/ig_hashtag_search"
-            
-            search_params = {
-                'access_token': self.access_token,
-                'q': hashtag
-            }
-            
-            search_response = requests.get(search_endpoint, params=search_params)
-            
-            if search_response.status_code != 200:
+            hashtag_id = self._resolve_hashtag_id(hashtag)
+            if not hashtag_id:
                 return {}
             
-            hashtag_id = search_response.json()['data'][0]['id']
-            
             media_endpoint = f"{self.base_url}/{hashtag_id}/recent_media"
             
             media_params = {
-                'access_token': self.access_token,
+                **self._base_params,
                 'fields': 'id,caption,media_type,media_url,permalink',
                 'limit': 25
             }
             
-            media_response = requests.get(media_endpoint, params=media_params)
+            media_response = self._session.get(media_endpoint, params=media_params)
             
             if media_response.status_code == 200:
-                return media_response.json()
+                result = _parse(media_response)
+                self._cache.set(cache_key, result, ttl=300)
+                return copy.deepcopy(result)
             else:
                 return {}
                 
@@ -216,11 +298,32 @@ class InstagramAPI:
             logger.error(f"Hashtag search error: {e}")
             return {}
     
+    def _resolve_hashtag_id(self, hashtag: str) -> Optional[str]:
+        hashtag_id = self._hashtag_ids.get(hashtag)
+        if hashtag_id:
+            return hashtag_id
+        
+        search_endpoint = f"{self.base_url}/ig_hashtag_search"
+        
+        search_params = {
+            **self._base_params,
+            'q': hashtag
+        }
+        
+        search_response = self._session.get(search_endpoint, params=search_params)
+        
+        if search_response.status_code != 200:
+            return None
+        
+        hashtag_id = _parse(search_response)['data'][0]['id']
+        self._hashtag_ids[hashtag] = hashtag_id
+        return hashtag_id
+    
     def _mock_create_post(self, caption: str) -> Dict:
         return {
             'success': True,
-            'media_id': f"mock_ig_{datetime.utcnow().timestamp()}",
-            'timestamp': datetime.utcnow().isoformat(),
+            'media_id': f"mock_ig_{time.time_ns()}",
+            'timestamp': utc_timestamp(),
             'mock': True
         }
     
@@ -235,26 +338,27 @@ class InstagramAPI:
         }
     
     def _mock_get_comments(self, media_id: str) -> List[Dict]:
+        timestamp = utc_timestamp()
         return [
             {
                 'id': 'comment_1',
                 'text': 'Love this post! 😍',
                 'username': 'user123',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': timestamp
             },
             {
                 'id': 'comment_2',
                 'text': 'Amazing content!',
                 'username': 'user456',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': timestamp
             }
         ]
     
     def _mock_reply_to_comment(self, comment_id: str, message: str) -> Dict:
         return {
             'success': True,
-            'reply_id': f"reply_{datetime.utcnow().timestamp()}",
-            'timestamp': datetime.utcnow().isoformat(),
+            'reply_id': f"reply_{time.time_ns()}",
+            'timestamp': utc_timestamp(),
             'mock': True
         }
     
@@ -268,4 +372,76 @@ class InstagramAPI:
                     'permalink': f'https://instagram.com/p/mock_{hashtag}_1'
                 }
             ]
-        }
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=1)
+def get_instagram_api() -> InstagramAPI:
+    """Process-wide InstagramAPI, so callers share one connection pool and cache"""
+    return InstagramAPI()
+
+
+class InstagramPublisher:
+    """Publishes a batch of posts with container creation and publishing overlapped.
+
+    Containers are created on a worker pool while a single consumer thread
+    publishes finished containers in order, so for N posts the wall time is
+    roughly max(create, publish) per post rather than create + publish.
+    """
+    
+    def __init__(self, api: Optional[InstagramAPI] = None, max_workers: int = 4):
+        self.api = api or get_instagram_api()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._created = queue.Queue()
+        self._pending: List[Future] = []
+        self._consumer = threading.Thread(target=self._publish_loop, daemon=True)
+        self._consumer.start()
+    
+    def schedule_post(self, caption: str, media_url: str, media_type: str = "IMAGE") -> Future:
+        result = Future()
+        self._pending.append(result)
+        
+        if self.api.mock_mode:
+            result.set_result(self.api._mock_create_post(caption))
+            return result
+        
+        # Retries happen in the session's HTTPAdapter only, so a post is never
+        # sent more times than its Retry policy allows
+        creation = self._executor.submit(
+            self.api._create_media_container, media_url, caption, media_type
+        )
+        creation.add_done_callback(lambda done: self._created.put((done, result)))
+        return result
+    
+    def await_all(self) -> List[Dict]:
+        results = [future.result() for future in self._pending]
+        self._pending = []
+        return results
+    
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._created.put(None)
+        self._consumer.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _publish_loop(self):
+        while True:
+            item = self._created.get()
+            if item is None:
+                return
+            
+            creation, result = item
+            try:
+                container_id = creation.result()
+                if not container_id:
+                    result.set_result({'success': False, 'error': 'Failed to create media container'})
+                else:
+                    result.set_result(self.api._publish_container(container_id))
+            except Exception as e:
+                logger.error(f"Instagram publish pipeline error: {e}")
+                result.set_result({'success': False, 'error': str(e)})
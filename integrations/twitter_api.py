@@ -1,42 +1,151 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
+import random
+import time
+
+from .cache import TTLCache, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+def _parse(response: requests.Response):
+    # Parse the raw body directly, skipping requests' charset detection
+    return _json_loads(response.content)
+
+_MAX_IDS_PER_LOOKUP = 100
+_MAX_RATE_LIMIT_ATTEMPTS = 3
+_MAX_RATE_LIMIT_WAIT = 60
+
+_MOCK_ANALYTICS_TEMPLATE = {
+    'impressions': 1000,
+    'likes': 50,
+    'retweets': 10,
+    'replies': 5,
+    'created_at': None
+}
+
+def _rate_limit_delay(response: requests.Response, attempt: int) -> float:
+    # Twitter reports when the window resets as epoch seconds; fall back to
+    # jittered exponential backoff when the header is missing or malformed
+    reset = response.headers.get('x-rate-limit-reset')
+    if reset:
+        try:
+            return max(0.0, min(float(reset) - time.time(), _MAX_RATE_LIMIT_WAIT)) + random.random()
+        except ValueError:
+            pass
+    return 2 ** attempt + random.random()
+
+# Credentials are read once at import; every client shares them
+_API_KEY = os.environ.get('TWITTER_API_KEY')
+_API_SECRET = os.environ.get('TWITTER_API_SECRET')
+_ACCESS_TOKEN = os.environ.get('TWITTER_ACCESS_TOKEN')
+_ACCESS_TOKEN_SECRET = os.environ.get('TWITTER_ACCESS_TOKEN_SECRET')
+_MOCK_MODE = not all([_API_KEY, _API_SECRET])
+
+def _build_session() -> requests.Session:
+    # Pooled keep-alive connections to api.twitter.com, with retries on
+    # transient server errors
+    # Status and read-error retries are limited to GET: a POST that reached the
+    # server may already have published. urllib3 still retries connect errors
+    # for every method, since those requests were never sent.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=2,
+            # 429s are retried by TwitterAPI._request, which honours x-rate-limit-reset
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    # Advertise every codec urllib3 can decode here; brotli is added when the
+    # brotli package is installed and compresses the JSON noticeably better
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+    return session
+
 class TwitterAPI:
     def __init__(self):
-        self.api_key = os.environ.get('TWITTER_API_KEY')
-        self.api_secret = os.environ.get('TWITTER_API_SECRET')
-        self.access_token = os.environ.get('TWITTER_ACCESS_TOKEN')
-        self.access_token_secret = os.environ.get('TWITTER_ACCESS_TOKEN_SECRET')
+        self.api_key = _API_KEY
+        self.api_secret = _API_SECRET
+        self.access_token = _ACCESS_TOKEN
+        self.access_token_secret = _ACCESS_TOKEN_SECRET
         self.base_url = "https://api.twitter.com/2"
-        self.mock_mode = not all([self.api_key, self.api_secret])
+        self.mock_mode = _MOCK_MODE
+        self._session = _build_session()
+        self._headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json"
+        }
+        self._session.headers.update(self._headers)
+        # Per-tweet metrics cache, so overlapping analytics batches share hits
+        self._cache = TTLCache(maxsize=1024, ttl=600)
+        if self.mock_mode:
+            self._bind_mocks()
+    
+    def _bind_mocks(self):
+        # mock_mode is fixed at construction, so shadow the public methods with
+        # their mocks instead of branching on every call
+        self.post_tweet = lambda content, media_ids=None: self._mock_post_tweet(content)
+        self.get_mentions = lambda since_id=None: self._mock_get_mentions()
+        self.get_analytics = self._mock_get_analytics
+        self.search_tweets = lambda query, max_results=10: self._mock_search_tweets(query)
+    
+    def close(self):
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        for attempt in range(_MAX_RATE_LIMIT_ATTEMPTS):
+            response = self._session.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_ATTEMPTS - 1:
+                return response
+            delay = _rate_limit_delay(response, attempt)
+            logger.warning(f"Twitter rate limited, retrying in {delay:.1f}s")
+            time.sleep(delay)
         
     def post_tweet(self, content: str, media_ids: Optional[List[str]] = None) -> Dict:
         if self.mock_mode:
             return self._mock_post_tweet(content)
         
         try:
-            headers = self._get_headers()
             payload = {"text": content}
             
             if media_ids:
                 payload["media"] = {"media_ids": media_ids}
             
-            response = requests.post(
+            response = self._request(
+                "POST",
                 f"{self.base_url}/tweets",
-                headers=headers,
                 json=payload
             )
             
             if response.status_code == 201:
                 return {
                     'success': True,
-                    'tweet_id': response.json()['data']['id'],
+                    'tweet_id': _parse(response)['data']['id'],
                     'timestamp': datetime.utcnow().isoformat()
                 }
             else:
@@ -52,20 +161,19 @@ class TwitterAPI:
             return self._mock_get_mentions()
         
         try:
-            headers = self._get_headers()
             params = {"max_results": 100}
             
             if since_id:
                 params["since_id"] = since_id
             
-            response = requests.get(
+            response = self._request(
+                "GET",
                 f"{self.base_url}/users/me/mentions",
-                headers=headers,
                 params=params
             )
             
             if response.status_code == 200:
-                return response.json().get('data', [])
+                return _parse(response).get('data', [])
             else:
                 logger.error(f"Twitter mentions error: {response.status_code}")
                 return []
@@ -78,21 +186,48 @@ class TwitterAPI:
         if self.mock_mode:
             return self._mock_get_analytics(tweet_ids)
         
+        analytics = {}
+        uncached_ids = []
+        for tweet_id in tweet_ids:
+            cached = self._cache.get(('analytics', tweet_id))
+            if cached is not None:
+                analytics[tweet_id] = dict(cached)
+            else:
+                uncached_ids.append(tweet_id)
+        
+        if not uncached_ids:
+            return analytics
+        
+        # The /tweets lookup accepts at most 100 ids, so larger requests are
+        # split into shards fetched in parallel
+        chunks = [uncached_ids[i:i + _MAX_IDS_PER_LOOKUP]
+                  for i in range(0, len(uncached_ids), _MAX_IDS_PER_LOOKUP)]
+        if len(chunks) == 1:
+            results = [self._fetch_analytics_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                results = list(executor.map(self._fetch_analytics_chunk, chunks))
+        
+        for fetched in results:
+            for tweet_id, metrics in fetched.items():
+                self._cache.set(('analytics', tweet_id), metrics)
+                analytics[tweet_id] = dict(metrics)
+        
+        return analytics
+    
+    def _fetch_analytics_chunk(self, tweet_ids: List[str]) -> Dict:
         try:
-            headers = self._get_headers()
-            ids = ",".join(tweet_ids)
-            
-            response = requests.get(
+            response = self._request(
+                "GET",
                 f"{self.base_url}/tweets",
-                headers=headers,
                 params={
-                    "ids": ids,
+                    "ids": ",".join(tweet_ids),
                     "tweet.fields": "public_metrics,created_at"
                 }
             )
             
             if response.status_code == 200:
-                data = response.json().get('data', [])
+                data = _parse(response).get('data', [])
                 analytics = {}
                 
                 for tweet in data:
@@ -118,11 +253,9 @@ class TwitterAPI:
             return self._mock_search_tweets(query)
         
         try:
-            headers = self._get_headers()
-            
-            response = requests.get(
+            response = self._request(
+                "GET",
                 f"{self.base_url}/tweets/search/recent",
-                headers=headers,
                 params={
                     "query": query,
                     "max_results": min(max_results, 100),
@@ -131,7 +264,7 @@ class TwitterAPI:
             )
             
             if response.status_code == 200:
-                return response.json().get('data', [])
+                return _parse(response).get('data', [])
             else:
                 logger.error(f"Twitter search error: {response.status_code}")
                 return []
@@ -140,47 +273,34 @@ class TwitterAPI:
             logger.error(f"Twitter search error: {e}")
             return []
     
-    def _get_headers(self) -> Dict:
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-    
     def _mock_post_tweet(self, content: str) -> Dict:
         return {
             'success': True,
-            'tweet_id': f"mock_{datetime.utcnow().timestamp()}",
-            'timestamp': datetime.utcnow().isoformat(),
+            'tweet_id': f"mock_{time.time_ns()}",
+            'timestamp': utc_timestamp(),
             'mock': True
         }
     
     def _mock_get_mentions(self) -> List[Dict]:
+        created_at = utc_timestamp()
         return [
             {
                 'id': 'mock_mention_1',
                 'text': '@you Great product! Love using it!',
                 'author_id': 'user123',
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': created_at
             },
             {
                 'id': 'mock_mention_2',
                 'text': '@you How does this feature work?',
                 'author_id': 'user456',
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': created_at
             }
         ]
     
     def _mock_get_analytics(self, tweet_ids: List[str]) -> Dict:
-        analytics = {}
-        for tweet_id in tweet_ids:
-            analytics[tweet_id] = {
-                'impressions': 1000,
-                'likes': 50,
-                'retweets': 10,
-                'replies': 5,
-                'created_at': datetime.utcnow().isoformat()
-            }
-        return analytics
+        created_at = utc_timestamp()
+        return {tweet_id: {**_MOCK_ANALYTICS_TEMPLATE, 'created_at': created_at} for tweet_id in tweet_ids}
     
     def _mock_search_tweets(self, query: str) -> List[Dict]:
         return [
@@ -188,10 +308,15 @@ class TwitterAPI:
                 'id': 'search_result_1',
                 'text': f'Sample tweet about {query}',
                 'author_id': 'author1',
-                'created_at': datetime.utcnow().isoformat(),
+                'created_at': utc_timestamp(),
                 'public_metrics': {
                     'like_count': 10,
                     'retweet_count': 2
                 }
             }
-        ]
\ No newline at end of file
+        ]
+
+@lru_cache(maxsize=1)
+def get_twitter_api() -> TwitterAPI:
+    """Process-wide TwitterAPI, so callers share one connection pool and cache"""
+    return TwitterAPI()
@@ -9,106 +9,136 @@ import time
 import webbrowser
 import requests
 import os
+import signal
+import socket
 import sys
 
-def check_port_available(port):
-    """Check if a port is available"""
+def find_free_port(start):
+    """Return the first port from start upwards that can be bound"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Match the servers' own bind semantics so TIME_WAIT leftovers don't count as busy
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     try:
-        import socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('localhost', port))
+        port = start
+        while True:
+            try:
+                sock.bind(('', port))
+                return port
+            except OSError:
+                port += 1
+    finally:
         sock.close()
-        return result != 0
-    except:
-        return True
 
 def wait_for_service(url, timeout=30):
-    """Wait for service to be ready"""
-    for _ in range(timeout):
-        try:
-            response = requests.get(url, timeout=2)
-            if response.status_code == 200:
-                return True
-        except:
-            pass
-        time.sleep(1)
+    """Wait for service to be ready, probing with exponential backoff"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    # One keep-alive session for every probe instead of a new connection each time
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            try:
+                response = session.get(url, timeout=0.5)
+                if response.status_code == 200:
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
     return False
 
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+
+def start_process(args, env, log_name):
+    """Start args in its own process group with output appended to logs/log_name"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    # Output goes straight to a file: an undrained PIPE fills up (~64KB) and
+    # then blocks the child on its next write
+    with open(os.path.join(LOG_DIR, log_name), 'ab') as log:
+        return subprocess.Popen(
+            args,
+            env=env,
+            # Own process group, so shutdown reaches any workers the server forks
+            start_new_session=True,
+            stdout=log,
+            stderr=subprocess.STDOUT
+        )
+
+def stop_process(process, timeout=2):
+    """Terminate the process group started for process, killing it after timeout"""
+    try:
+        pgid = os.getpgid(process.pid)
+        os.killpg(pgid, signal.SIGTERM)
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(pgid, signal.SIGKILL)
+            process.wait()
+    except ProcessLookupError:
+        # Already exited and reaped
+        pass
+
 def main():
     print("🚀 Starting NorthStar AI - Social Media Automation")
     print("=" * 60)
     
-    # Kill any existing processes
-    print("📋 Cleaning up existing processes...")
-    subprocess.run(['pkill', '-f', 'streamlit'], capture_output=True)
-    subprocess.run(['pkill', '-f', 'app.py'], capture_output=True)
-    time.sleep(2)
-    
     # Find available ports
-    flask_port = 5001
-    streamlit_port = 8501
-    
-    while not check_port_available(flask_port):
-        flask_port += 1
-    
-    while not check_port_available(streamlit_port):
-        streamlit_port += 1
+    flask_port = find_free_port(5001)
+    streamlit_port = find_free_port(8501)
     
     print(f"📡 Starting Flask API on port {flask_port}...")
     
     # Start Flask backend
     flask_env = os.environ.copy()
     flask_env['PORT'] = str(flask_port)
-    flask_process = subprocess.Popen(
-        [sys.executable, 'app.py'],
-        env=flask_env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    
-    # Wait for Flask to start
-    flask_url = f"http://localhost:{flask_port}/health"
-    if wait_for_service(flask_url):
-        print(f"✅ Flask API ready at http://localhost:{flask_port}")
-    else:
-        print("❌ Flask API failed to start")
-        return
-    
-    print(f"🎨 Starting Streamlit dashboard on port {streamlit_port}...")
-    
-    # Start Streamlit dashboard
-    streamlit_env = os.environ.copy()
-    streamlit_env['API_BASE_URL'] = f"http://localhost:{flask_port}"
-    
-    streamlit_process = subprocess.Popen(
-        [sys.executable, '-m', 'streamlit', 'run', 'dashboard.py', 
-         '--server.port', str(streamlit_port), '--server.headless', 'true'],
-        env=streamlit_env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-    
-    # Wait for Streamlit to start
-    streamlit_url = f"http://localhost:{streamlit_port}"
-    if wait_for_service(streamlit_url):
-        print(f"✅ Streamlit dashboard ready at {streamlit_url}")
-    else:
-        print("❌ Streamlit dashboard failed to start")
-        return
-    
-    print("=" * 60)
-    print("🎉 NorthStar AI is ready!")
-    print(f"📊 Dashboard: http://localhost:{streamlit_port}")
-    print(f"🔧 API: http://localhost:{flask_port}")
-    print("")
-    print("💡 Click 'Start Free Demo' to try the AI features")
-    print("🔗 Opening dashboard in your browser...")
-    print("=" * 60)
-    
-    # Open browser
-    webbrowser.open(streamlit_url)
+    processes = []
+    flask_process = start_process([sys.executable, 'app.py'], flask_env, 'flask.log')
+    processes.append(flask_process)
     
+    # The servers run in their own sessions, out of reach of the terminal's
+    # Ctrl+C, so every exit path below has to stop them explicitly
     try:
+        # Wait for Flask to start
+        flask_url = f"http://localhost:{flask_port}/health"
+        if wait_for_service(flask_url):
+            print(f"✅ Flask API ready at http://localhost:{flask_port}")
+        else:
+            print(f"❌ Flask API failed to start (see {os.path.join(LOG_DIR, 'flask.log')})")
+            return
+        
+        print(f"🎨 Starting Streamlit dashboard on port {streamlit_port}...")
+        
+        # Start Streamlit dashboard
+        streamlit_env = os.environ.copy()
+        streamlit_env['API_BASE_URL'] = f"http://localhost:{flask_port}"
+        
+        streamlit_process = start_process(
+            [sys.executable, '-m', 'streamlit', 'run', 'dashboard.py', 
+             '--server.port', str(streamlit_port), '--server.headless', 'true'],
+            streamlit_env,
+            'streamlit.log'
+        )
+        processes.append(streamlit_process)
+        
+        # Wait for Streamlit to start
+        streamlit_url = f"http://localhost:{streamlit_port}"
+        if wait_for_service(streamlit_url):
+            print(f"✅ Streamlit dashboard ready at {streamlit_url}")
+        else:
+            print(f"❌ Streamlit dashboard failed to start (see {os.path.join(LOG_DIR, 'streamlit.log')})")
+            return
+        
+        print("=" * 60)
+        print("🎉 NorthStar AI is ready!")
+        print(f"📊 Dashboard: http://localhost:{streamlit_port}")
+        print(f"🔧 API: http://localhost:{flask_port}")
+        print("")
+        print("💡 Click 'Start Free Demo' to try the AI features")
+        print("🔗 Opening dashboard in your browser...")
+        print("=" * 60)
+        
+        # Open browser
+        webbrowser.open(streamlit_url)
+        
         # Keep processes running
         print("⌨️  Press Ctrl+C to stop all services")
         while True:
@@ -124,19 +154,9 @@ def main():
                 
     except KeyboardInterrupt:
         print("\n🛑 Shutting down services...")
-        flask_process.terminate()
-        streamlit_process.terminate()
-        
-        # Wait for graceful shutdown
-        time.sleep(2)
-        
-        # Force kill if needed
-        try:
-            flask_process.kill()
-            streamlit_process.kill()
-        except:
-            pass
-        
+    finally:
+        for process in processes:
+            stop_process(process)
         print("✅ All services stopped")
 
 if __name__ == "__main__":
@@ -3,7 +3,11 @@ NorthStar AI - Minimal Working Version for Vercel
 Simple Streamlit app with AI content generation
 """
 import streamlit as st
+import streamlit.components.v1 as components
+import json
 import os
+import threading
+import time
 import anthropic
 from datetime import datetime
 
@@ -14,8 +18,7 @@ st.set_page_config(
 )
 
 # Custom CSS for professional look
-st.markdown("""
-<style>
+_CSS = """
     .main-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         padding: 3rem 0;
@@ -40,8 +43,27 @@ st.markdown("""
         border-left: 4px solid #667eea;
         margin: 1rem 0;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit drops any element a rerun does not re-emit, so rather than
+# re-sending the <style> block through st.markdown on every widget change the
+# stylesheet is appended to the parent document's <head> once per session.
+_CSS_INJECT = """
+<script>
+(function () {
+    const doc = window.parent.document;
+    if (doc.getElementById("northstar-simple-css")) return;
+    const style = doc.createElement("style");
+    style.id = "northstar-simple-css";
+    style.textContent = %s;
+    doc.head.appendChild(style);
+})();
+</script>
+""" % json.dumps(_CSS)
+
+if not st.session_state.get("_css_injected"):
+    components.html(_CSS_INJECT, height=0)
+    st.session_state["_css_injected"] = True
 
 # Initialize Anthropic client
 @st.cache_resource
@@ -51,13 +73,80 @@ def get_anthropic_client():
         return anthropic.Anthropic(api_key=api_key)
     return None
 
-# Hero Section
-st.markdown("""
+# Platform-specific prompt prefixes, built once instead of on every rerun
+_PLATFORM_INFO = {
+    "Twitter": "Create an engaging Twitter post (max 280 characters)",
+    "Instagram": "Create an engaging Instagram caption with visual appeal",
+    "LinkedIn": "Create a professional LinkedIn post",
+    "TikTok": "Create a fun, viral TikTok caption"
+}
+
+def build_prompt(platform, prompt, include_hashtags, include_emojis):
+    ai_prompt = f"{_PLATFORM_INFO[platform]} about: {prompt}"
+    
+    if include_hashtags:
+        ai_prompt += "\n\nInclude 3-5 relevant hashtags."
+    
+    if include_emojis:
+        ai_prompt += "\nInclude appropriate emojis."
+    
+    return ai_prompt + "\n\nAlso provide one alternative version."
+
+_HERO_HTML = """
 <div class="main-header">
     <div class="hero-title">⭐ NorthStar AI</div>
     <div class="hero-subtitle">AI-Powered Social Media Content Generation</div>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+_GENERATION_TTL = 300
+_GENERATION_CACHE_SIZE = 256
+_CONTENT_BOX = '<div class="content-box">{}</div>'
+
+@st.cache_resource
+def _generation_cache():
+    # ai_prompt -> (expires_at, text), shared by every session in the process.
+    # Sessions run on separate script threads, so access goes through the lock
+    return threading.Lock(), {}
+
+def stream_generation(ai_prompt, placeholder):
+    """Render the completion into placeholder as tokens arrive and return the full text"""
+    lock, cache = _generation_cache()
+    with lock:
+        hit = cache.get(ai_prompt)
+    if hit and hit[0] > time.monotonic():
+        placeholder.markdown(_CONTENT_BOX.format(hit[1]), unsafe_allow_html=True)
+        return hit[1]
+    
+    text = ""
+    with get_anthropic_client().messages.stream(
+        model="claude-3-5-sonnet-20241022",
+        max_tokens=400,
+        messages=[{
+            "role": "user",
+            "content": ai_prompt
+        }]
+    ) as stream:
+        for chunk in stream.text_stream:
+            text += chunk
+            placeholder.markdown(_CONTENT_BOX.format(text), unsafe_allow_html=True)
+    
+    if not text:
+        text = "Content generated!"
+        placeholder.markdown(_CONTENT_BOX.format(text), unsafe_allow_html=True)
+    
+    # Re-clicking Generate with the same inputs is served from here; failed
+    # streams raise before this point and are never cached
+    with lock:
+        cache.pop(ai_prompt, None)
+        if len(cache) >= _GENERATION_CACHE_SIZE:
+            # Oldest insertion first
+            del cache[next(iter(cache))]
+        cache[ai_prompt] = (time.monotonic() + _GENERATION_TTL, text)
+    return text
+
+# Hero Section
+st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
 # Main Content
 st.markdown("## 🚀 Generate Viral Social Media Content")
@@ -96,46 +185,14 @@ with col1:
                         st.error("⚠️ AI service not configured. Please set ANTHROPIC_API_KEY.")
                         st.stop()
                     
-                    # Create platform-specific prompt
-                    platform_info = {
-                        "Twitter": "Create an engaging Twitter post (max 280 characters)",
-                        "Instagram": "Create an engaging Instagram caption with visual appeal",
-                        "LinkedIn": "Create a professional LinkedIn post",
-                        "TikTok": "Create a fun, viral TikTok caption"
-                    }
-                    
-                    ai_prompt = f"{platform_info[platform]} about: {prompt}"
-                    
-                    if include_hashtags:
-                        ai_prompt += "\n\nInclude 3-5 relevant hashtags."
-                    
-                    if include_emojis:
-                        ai_prompt += "\nInclude appropriate emojis."
-                    
-                    ai_prompt += "\n\nAlso provide one alternative version."
-                    
-                    # Call Anthropic API
-                    response = client.messages.create(
-                        model="claude-3-5-sonnet-20241022",
-                        max_tokens=400,
-                        messages=[{
-                            "role": "user",
-                            "content": ai_prompt
-                        }]
+                    # Display results as they stream in
+                    st.markdown("### 🎯 Generated Content")
+                    stream_generation(
+                        build_prompt(platform, prompt, include_hashtags, include_emojis),
+                        st.empty()
                     )
-                    
-                    generated_text = response.content[0].text if response.content else "Content generated!"
-                    
-                    # Display results
                     st.success("✅ Content generated successfully!")
                     
-                    st.markdown("### 🎯 Generated Content")
-                    st.markdown(f"""
-                    <div class="content-box">
-                        {generated_text}
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
                     # Performance prediction
                     st.markdown("### 📊 Performance Prediction")
                     col_metric1, col_metric2, col_metric3 = st.columns(3)
@@ -0,0 +1,24 @@
+"""
+Controller Dependencies
+FastAPI dependencies returning services resolved once at application startup
+"""
+from fastapi import Depends, Request
+from typing import Annotated
+
+from ...core.application.services.content_service import ContentService
+from ...core.domain.repositories.content_repository import ContentRepository
+
+
+# Async so FastAPI calls them inline instead of via its threadpool
+async def get_content_service(request: Request) -> ContentService:
+    """Content service resolved in the application lifespan"""
+    return request.app.state.content_service
+
+
+async def get_content_repository(request: Request) -> ContentRepository:
+    """Content repository resolved in the application lifespan"""
+    return request.app.state.content_repository
+
+
+ContentServiceDep = Annotated[ContentService, Depends(get_content_service)]
+ContentRepositoryDep = Annotated[ContentRepository, Depends(get_content_repository)]
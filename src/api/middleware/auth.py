@@ -2,78 +2,160 @@
 Authentication Middleware
 JWT-based authentication with proper error handling
 """
-from fastapi import HTTPException, Depends, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from fastapi import HTTPException, Depends, Request, status
+import jwt
+from typing import Annotated, Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import bcrypt
+import hashlib
+import os
+import time
 
 from ...infrastructure.config.settings import settings
 from ...core.application.exceptions import AuthenticationError, AuthorizationError
 from ...infrastructure.logging.logger import get_logger
 
 logger = get_logger('northstar.auth')
-security = HTTPBearer()
+
+# Claims every token we issue carries; decoding rejects tokens missing any
+REQUIRED_CLAIMS = ["exp", "iat", "sub", "type"]
+
+# Successful decodes are reused for this long (never past the token's exp)
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 10000
+
+
+class TokenCache:
+    """LRU of verified token payloads keyed by the token's SHA-256 digest"""
+    
+    def __init__(self, max_size: int = TOKEN_CACHE_MAX_SIZE) -> None:
+        self.max_size: int = max_size
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    
+    @staticmethod
+    def key(token: str) -> bytes:
+        # Only the digest is kept, never the bearer token itself
+        return hashlib.sha256(token.encode('utf-8')).digest()
+    
+    def get(self, key: bytes, now: float) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, payload = entry
+        if expires_at <= now:
+            self._entries.pop(key, None)
+            return None
+        
+        self._entries.move_to_end(key)
+        return payload
+    
+    def set(self, key: bytes, payload: Dict[str, Any], expires_at: float) -> None:
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key: bytes) -> None:
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 class JWTManager:
     """JWT token management"""
     
-    def __init__(self):
-        self.secret_key = settings.auth.secret_key
-        self.algorithm = settings.auth.jwt_algorithm
-        self.access_token_expire_minutes = settings.auth.access_token_expire_minutes
-        self.refresh_token_expire_days = settings.auth.refresh_token_expire_days
+    def __init__(self) -> None:
+        self.secret_key: str = settings.auth.secret_key
+        self.algorithm: str = settings.auth.jwt_algorithm
+        self.access_token_expire_minutes: int = settings.auth.access_token_expire_minutes
+        self.refresh_token_expire_days: int = settings.auth.refresh_token_expire_days
+        self.token_cache: TokenCache = TokenCache()
+        self.signing_key: Any
+        self.verification_key: Any
+        
+        if self.algorithm.startswith(('RS', 'PS', 'ES')):
+            # Parse the PEM once; PyJWT returns key objects as-is instead of
+            # re-parsing them on every encode/decode
+            self.signing_key = jwt.get_algorithm_by_name(self.algorithm).prepare_key(self.secret_key)
+            self.verification_key = self.signing_key.public_key()
+        else:
+            self.signing_key = self.verification_key = self.secret_key
     
-    def create_access_token(self, user_id: str, additional_claims: Dict = None) -> str:
+    def create_access_token(self, user_id: str, additional_claims: Optional[Dict[str, Any]] = None) -> str:
         """Create JWT access token"""
-        expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+        now = int(time.time())
         
         payload = {
             'sub': user_id,
-            'exp': expire,
-            'iat': datetime.utcnow(),
+            'exp': now + self.access_token_expire_minutes * 60,
+            'iat': now,
             'type': 'access'
         }
         
         if additional_claims:
             payload.update(additional_claims)
         
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return jwt.encode(payload, self.signing_key, algorithm=self.algorithm)
     
     def create_refresh_token(self, user_id: str) -> str:
         """Create JWT refresh token"""
-        expire = datetime.utcnow() + timedelta(days=self.refresh_token_expire_days)
+        now = int(time.time())
         
         payload = {
             'sub': user_id,
-            'exp': expire,
-            'iat': datetime.utcnow(),
+            'exp': now + self.refresh_token_expire_days * 86400,
+            'iat': now,
             'type': 'refresh'
         }
         
-        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+        return jwt.encode(payload, self.signing_key, algorithm=self.algorithm)
     
     def verify_token(self, token: str, expected_type: str = 'access') -> Dict[str, Any]:
-        """Verify and decode JWT token"""
+        """Verify and decode JWT token
+        
+        Runs inline on the event loop from the async auth dependencies, so it
+        must stay cheap: an HMAC decode is tens of microseconds and repeat
+        tokens are served from the cache.
+        """
+        cache_key = TokenCache.key(token)
+        now = time.time()
+        cached = self.token_cache.get(cache_key, now)
+        if cached is not None:
+            if cached.get('type') != expected_type:
+                raise AuthenticationError(f"Invalid token type. Expected {expected_type}")
+            return dict(cached)
+        
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(
+                token,
+                self.verification_key,
+                algorithms=[self.algorithm],
+                options={'require': REQUIRED_CLAIMS, 'verify_exp': True}
+            )
             
             # Verify token type
             if payload.get('type') != expected_type:
                 raise AuthenticationError(f"Invalid token type. Expected {expected_type}")
             
-            # Verify expiration
-            if datetime.utcnow() > datetime.fromtimestamp(payload['exp']):
-                raise AuthenticationError("Token has expired")
-            
-            return payload
+            self.token_cache.set(
+                cache_key, payload, min(now + TOKEN_CACHE_TTL_SECONDS, payload['exp'])
+            )
+            return dict(payload)
             
-        except JWTError as e:
+        except jwt.ExpiredSignatureError:
+            raise AuthenticationError("Token has expired")
+        except jwt.InvalidTokenError as e:
             logger.warning(f"JWT verification failed: {str(e)}")
             raise AuthenticationError("Invalid token")
     
+    def revoke(self, token: str) -> None:
+        """Drop a cached verification so the token is decoded again on next use"""
+        self.token_cache.pop(TokenCache.key(token))
+    
     def refresh_access_token(self, refresh_token: str) -> str:
         """Create new access token from refresh token"""
         payload = self.verify_token(refresh_token, 'refresh')
@@ -82,20 +164,40 @@ class JWTManager:
         return self.create_access_token(user_id)
 
 
+# bcrypt releases the GIL, so hashing scales across this many threads
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix='password-hash'
+)
+
+
+def _hash_password(password: str) -> str:
+    salt = bcrypt.gensalt()
+    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+
+def _verify_password(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
 class PasswordManager:
-    """Password hashing and verification"""
+    """Password hashing and verification
+    
+    A bcrypt round takes 100ms+ of CPU, so both operations run on a worker
+    thread instead of blocking the event loop.
+    """
     
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password(password: str) -> str:
         """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, _hash_password, password)
     
     @staticmethod
-    def verify_password(password: str, hashed: str) -> bool:
+    async def verify_password(password: str, hashed: str) -> bool:
         """Verify password against hash"""
-        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, _verify_password, password, hashed)
 
 
 # Global instances
@@ -103,37 +205,67 @@ jwt_manager = JWTManager()
 password_manager = PasswordManager()
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    """Extract current user from JWT token"""
+def _user_id_from_token(token: str) -> Optional[str]:
+    """Return the token's subject, or None if it does not verify"""
     try:
-        payload = jwt_manager.verify_token(credentials.credentials)
-        user_id = payload.get('sub')
-        
-        if not user_id:
-            raise AuthenticationError("Invalid token payload")
-        
-        logger.debug(f"Authenticated user: {user_id}")
-        return user_id
-        
+        return jwt_manager.verify_token(token).get('sub') or None
     except AuthenticationError:
+        return None
+
+
+def _bearer_credentials(request: Request) -> Optional[str]:
+    """Return the token from an `Authorization: Bearer <token>` header, if any"""
+    authorization = request.headers.get('authorization')
+    # Plain slicing instead of HTTPBearer's split/partition and credentials model
+    if not authorization or authorization[:7].lower() != 'bearer ':
+        return None
+    return authorization[7:] or None
+
+
+# These dependencies must stay `async def`: FastAPI runs sync dependencies in
+# its threadpool, which costs a thread hop on every authenticated request.
+async def bearer_token(request: Request) -> str:
+    """Extract the bearer token, rejecting the request if there is none"""
+    token = _bearer_credentials(request)
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
+
+async def optional_bearer_token(request: Request) -> Optional[str]:
+    """Extract the bearer token if one was sent"""
+    return _bearer_credentials(request)
+
+
+async def get_current_user(token: str = Depends(bearer_token)) -> str:
+    """Extract current user from JWT token"""
+    user_id = _user_id_from_token(token)
+    if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    logger.debug(f"Authenticated user: {user_id}")
+    return user_id
+
+
+CurrentUser = Annotated[str, Depends(get_current_user)]
 
 
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+    token: Optional[str] = Depends(optional_bearer_token)
 ) -> Optional[str]:
     """Extract current user from JWT token (optional)"""
-    if not credentials:
+    if not token:
         return None
     
-    try:
-        return await get_current_user(credentials)
-    except HTTPException:
-        return None
+    return _user_id_from_token(token)
 
 
 def require_permissions(*permissions: str):
@@ -172,6 +304,7 @@ class AuthenticationService:
             return None
         
         # In a real implementation, you'd verify the password against a stored hash
+        # with `await password_manager.verify_password(password, user.password_hash)`
         # For now, we'll implement basic authentication
         
         logger.info(f"User authenticated: {email}")
@@ -3,10 +3,10 @@ Global Error Handler Middleware
 Centralized error handling with proper logging and user-friendly responses
 """
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 import traceback
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from ...core.application.exceptions import (
     ApplicationError,
@@ -24,6 +24,20 @@ from ...infrastructure.logging.logger import get_logger
 
 logger = get_logger('northstar.error_handler')
 
+# Exception class -> (status code, fallback error code, fallback message)
+ERROR_MAPPINGS: Dict[type, Tuple[int, Optional[str], str]] = {
+    UserNotFoundError: (404, None, "User not found"),
+    InsufficientCreditsError: (402, None, "Insufficient credits"),
+    ContentGenerationError: (500, None, "Content generation failed"),
+    ValidationError: (400, None, "Validation error"),
+    AuthenticationError: (401, None, "Authentication failed"),
+    AuthorizationError: (403, None, "Access denied"),
+    RateLimitExceededError: (429, None, "Rate limit exceeded"),
+    ExternalServiceError: (502, None, "External service unavailable"),
+    ConfigurationError: (500, None, "Configuration error"),
+    ApplicationError: (500, 'APPLICATION_ERROR', "An application error occurred")
+}
+
 
 class GlobalErrorHandler(BaseHTTPMiddleware):
     """Global error handling middleware"""
@@ -33,89 +47,85 @@ class GlobalErrorHandler(BaseHTTPMiddleware):
             response = await call_next(request)
             return response
         except Exception as exc:
-            return await self.handle_exception(request, exc)
+            return await handle_exception(request, exc)
+
+
+async def handle_exception(request: Request, exc: Exception) -> ORJSONResponse:
+    """Log an exception that escaped the routes and build its error response"""
+    
+    request_id = getattr(request.state, 'request_id', 'unknown')
+    
+    # Log the exception
+    logger.error(
+        f"Unhandled exception in {request.method} {request.url.path}",
+        extra={
+            'request_id': request_id,
+            'exception_type': type(exc).__name__,
+            'exception_message': str(exc),
+            'path': request.url.path,
+            'method': request.method
+        },
+        exc_info=True
+    )
     
-    async def handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
-        """Handle different types of exceptions"""
-        
+    # Handle specific application exceptions
+    if isinstance(exc, HTTPException):
+        return create_error_response(exc.status_code, exc.status_code, exc.detail, request_id=request_id)
+    
+    # Nearest mapped class in the exception's MRO, so subclasses inherit
+    # their parent's status without a chain of isinstance checks
+    for exc_type in type(exc).__mro__:
+        mapping = ERROR_MAPPINGS.get(exc_type)
+        if mapping is not None:
+            return _mapped_error_response(exc, exc_type, mapping, request_id)
+    
+    # Handle unexpected exceptions
+    return create_error_response(
+        500, 'INTERNAL_SERVER_ERROR', 'An unexpected error occurred', request_id=request_id
+    )
+
+
+def _mapped_error_response(
+    exc: Exception,
+    exc_type: type,
+    mapping: Tuple[int, Optional[str], str],
+    request_id: str
+) -> ORJSONResponse:
+    """Build the error response for an exception matched in ERROR_MAPPINGS"""
+    status_code, default_code, default_message = mapping
+    return create_error_response(
+        status_code,
+        getattr(exc, 'error_code', None) or default_code or exc_type.__name__,
+        str(exc) or default_message,
+        request_id=request_id
+    )
+
+
+def make_exception_handler(exc_type: type):
+    """Build a FastAPI exception handler for one ERROR_MAPPINGS entry
+    
+    Registered with ``app.add_exception_handler``, Starlette picks the handler
+    by exception class and answers inside the routing layer, so known errors
+    never unwind to GlobalErrorHandler.
+    """
+    mapping = ERROR_MAPPINGS[exc_type]
+    
+    async def handler(request: Request, exc: Exception) -> ORJSONResponse:
         request_id = getattr(request.state, 'request_id', 'unknown')
-        
-        # Log the exception
-        logger.error(
-            f"Unhandled exception in {request.method} {request.url.path}",
-            extra={
-                'request_id': request_id,
-                'exception_type': type(exc).__name__,
-                'exception_message': str(exc),
-                'path': request.url.path,
-                'method': request.method
-            },
-            exc_info=True
-        )
-        
-        # Handle specific application exceptions
-        if isinstance(exc, HTTPException):
-            return JSONResponse(
-                status_code=exc.status_code,
-                content={
-                    'error': {
-                        'code': exc.status_code,
-                        'message': exc.detail,
-                        'request_id': request_id
-                    }
-                }
+        if mapping[0] >= 500:
+            logger.error(
+                f"{type(exc).__name__} in {request.method} {request.url.path}",
+                extra={'request_id': request_id, 'exception_message': str(exc)},
+                exc_info=exc
             )
-        
-        # Handle custom application exceptions
-        error_mappings = {
-            UserNotFoundError: (404, "User not found"),
-            InsufficientCreditsError: (402, "Insufficient credits"),
-            ContentGenerationError: (500, "Content generation failed"),
-            ValidationError: (400, "Validation error"),
-            AuthenticationError: (401, "Authentication failed"),
-            AuthorizationError: (403, "Access denied"),
-            RateLimitExceededError: (429, "Rate limit exceeded"),
-            ExternalServiceError: (502, "External service unavailable"),
-            ConfigurationError: (500, "Configuration error")
-        }
-        
-        for exc_type, (status_code, default_message) in error_mappings.items():
-            if isinstance(exc, exc_type):
-                return JSONResponse(
-                    status_code=status_code,
-                    content={
-                        'error': {
-                            'code': exc.error_code if hasattr(exc, 'error_code') else exc_type.__name__,
-                            'message': str(exc) or default_message,
-                            'request_id': request_id
-                        }
-                    }
-                )
-        
-        # Handle other application errors
-        if isinstance(exc, ApplicationError):
-            return JSONResponse(
-                status_code=500,
-                content={
-                    'error': {
-                        'code': exc.error_code or 'APPLICATION_ERROR',
-                        'message': str(exc) or 'An application error occurred',
-                        'request_id': request_id
-                    }
-                }
+        else:
+            logger.warning(
+                f"{type(exc).__name__} in {request.method} {request.url.path}: {exc}",
+                extra={'request_id': request_id}
             )
-        
-        # Handle unexpected exceptions
-        return JSONResponse(
-            status_code=500,
-            content={
-                'error': {
-                    'code': 'INTERNAL_SERVER_ERROR',
-                    'message': 'An unexpected error occurred',
-                    'request_id': request_id
-                }
-            }
-        )
+        return _mapped_error_response(exc, exc_type, mapping, request_id)
+    
+    return handler
 
 
 def create_error_response(
@@ -124,7 +134,7 @@ def create_error_response(
     message: str,
     details: Dict[str, Any] = None,
     request_id: str = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create standardized error response"""
     
     error_content = {
@@ -138,13 +148,13 @@ def create_error_response(
     if details:
         error_content['error']['details'] = details
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error_content
     )
 
 
-def handle_validation_error(exc) -> JSONResponse:
+def handle_validation_error(exc) -> ORJSONResponse:
     """Handle Pydantic validation errors"""
     errors = []
     for error in exc.errors():
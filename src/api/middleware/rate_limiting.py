@@ -3,42 +3,99 @@ Rate Limiting Middleware
 Redis-based rate limiting with tier-specific limits
 """
 from fastapi import HTTPException, Request, Depends
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Sequence, Tuple
 import time
 import hashlib
+import inspect
+import math
+import os
 from functools import wraps
-import redis.asyncio as redis
 
+from ...infrastructure.cache.redis_client import redis_client
 from ...infrastructure.config.settings import settings
 from ...core.application.exceptions import RateLimitExceededError
 from ...infrastructure.logging.logger import get_logger
 
 logger = get_logger('northstar.rate_limiting')
 
+# Rolling windows over sorted sets of request timestamps (ms), one key per
+# window. Trimming, counting and recording run atomically in Redis, so
+# concurrent workers and instances share one exact limit. ARGV is
+# {now, member, window_1, limit_1, window_2, limit_2, ...} pairing with KEYS.
+# The request is recorded in every window or in none, so a request denied by
+# one window does not use up the others. Returns
+# {denied_index_or_0, remaining_1, reset_ms_1, remaining_2, reset_ms_2, ...},
+# where reset_ms is when the oldest counted request leaves that window.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local counts = {}
+local denied = 0
+
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + 2 * i])
+    local limit = tonumber(ARGV[2 + 2 * i])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    counts[i] = redis.call('ZCARD', key)
+    if denied == 0 and counts[i] >= limit then
+        denied = i
+    end
+end
+
+local result = {denied}
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + 2 * i])
+    local limit = tonumber(ARGV[2 + 2 * i])
+    if denied == 0 then
+        redis.call('ZADD', key, now, ARGV[2])
+        redis.call('PEXPIRE', key, window)
+        counts[i] = counts[i] + 1
+    end
+
+    local reset = now + window
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    if oldest[2] then
+        reset = tonumber(oldest[2]) + window
+    end
+    result[#result + 1] = limit - counts[i]
+    result[#result + 1] = reset
+end
+return result
+"""
+
 
 class RateLimiter:
     """Redis-based rate limiter"""
     
     def __init__(self):
         self.redis_client = None
+        self._sliding_window = None
         self._initialize_redis()
     
     def _initialize_redis(self):
-        """Initialize Redis connection"""
-        try:
-            self.redis_client = redis.from_url(settings.redis.url)
-        except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
-            self.redis_client = None
+        """Bind to the process-wide Redis connection pool"""
+        self.redis_client = redis_client
+        if self.redis_client is None:
+            logger.error("Redis is not configured; rate limiting is disabled")
+            return
+        # Runs via EVALSHA, loading the script on first use (NOSCRIPT)
+        self._sliding_window = self.redis_client.register_script(SLIDING_WINDOW_SCRIPT)
     
     async def is_allowed(
         self, 
         key: str, 
         limit: int, 
-        window_seconds: int,
-        identifier: str = None
+        window_seconds: int
     ) -> tuple[bool, Dict]:
         """Check if request is allowed based on rate limit"""
+        return await self.check_windows([(key, limit, window_seconds)])
+    
+    async def check_windows(self, checks: Sequence[Tuple[str, int, int]]) -> tuple[bool, Dict]:
+        """Check and record a request against several (key, limit, window_seconds) limits
+        
+        All windows are evaluated in one script call. The returned info
+        describes the first denying window, or the window with the least
+        allowance left if the request is allowed.
+        """
         
         if not self.redis_client:
             # If Redis is not available, allow all requests
@@ -46,49 +103,33 @@ class RateLimiter:
             return True, {}
         
         try:
-            # Create rate limit key
-            rate_key = f"rate_limit:{key}"
-            if identifier:
-                rate_key += f":{identifier}"
-            
-            current_time = int(time.time())
-            window_start = current_time - window_seconds
+            now_ms = int(time.time() * 1000)
             
-            # Use sliding window approach
-            pipe = self.redis_client.pipeline()
+            # Members must be unique, or requests in the same instant collapse
+            args = [now_ms, os.urandom(8).hex()]
+            for _, limit, window_seconds in checks:
+                args += [window_seconds * 1000, limit]
             
-            # Remove old entries
-            await pipe.zremrangebyscore(rate_key, 0, window_start)
-            
-            # Count current requests
-            current_count = await pipe.zcard(rate_key)
+            result = await self._sliding_window(
+                keys=[f"rate_limit:{key}" for key, _, _ in checks],
+                args=args
+            )
             
-            if current_count < limit:
-                # Add current request
-                await pipe.zadd(rate_key, {str(current_time): current_time})
-                await pipe.expire(rate_key, window_seconds)
-                await pipe.execute()
-                
-                remaining = limit - current_count - 1
-                reset_time = current_time + window_seconds
-                
-                return True, {
-                    'limit': limit,
-                    'remaining': remaining,
-                    'reset': reset_time,
-                    'retry_after': None
-                }
+            denied = result[0]
+            if denied:
+                index = denied - 1
             else:
-                # Rate limit exceeded
-                reset_time = current_time + window_seconds
-                retry_after = window_seconds
-                
-                return False, {
-                    'limit': limit,
-                    'remaining': 0,
-                    'reset': reset_time,
-                    'retry_after': retry_after
-                }
+                index = min(range(len(checks)), key=lambda i: result[1 + 2 * i])
+            
+            _, limit, window_seconds = checks[index]
+            remaining, reset_ms = result[1 + 2 * index], result[2 + 2 * index]
+            return not denied, {
+                'limit': limit,
+                'remaining': max(remaining, 0),
+                'reset': math.ceil(reset_ms / 1000),
+                'retry_after': max(math.ceil((reset_ms - now_ms) / 1000), 1) if denied else None,
+                'window': window_seconds
+            }
                 
         except Exception as e:
             logger.error(f"Rate limiting error: {e}")
@@ -110,6 +151,9 @@ class RateLimiter:
 rate_limiter = RateLimiter()
 
 
+_INJECTED_REQUEST_PARAM = '_rate_limit_request'
+
+
 def rate_limit(
     operation: str,
     per_minute: Optional[int] = None,
@@ -120,17 +164,19 @@ def rate_limit(
     """Rate limiting decorator"""
     
     def decorator(func):
+        signature = inspect.signature(func)
+        request_param = next(
+            (name for name, param in signature.parameters.items() if param.annotation is Request),
+            None
+        )
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Extract request and user info
-            request = None
-            user_id = None
-            
-            # Look for request in args (FastAPI injects it)
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                    break
+            if request_param:
+                request = kwargs.get(request_param)
+            else:
+                request = kwargs.pop(_INJECTED_REQUEST_PARAM, None)
             
             # Look for user_id in kwargs
             user_id = kwargs.get('user_id') or kwargs.get('current_user')
@@ -148,104 +194,58 @@ def rate_limit(
             # Check different time windows
             checks = []
             if per_minute:
-                checks.append((f"{operation}_per_minute", per_minute, 60))
+                checks.append((f"{operation}_per_minute:{identifier}", per_minute, 60))
             if per_hour:
-                checks.append((f"{operation}_per_hour", per_hour, 3600))
+                checks.append((f"{operation}_per_hour:{identifier}", per_hour, 3600))
             if per_day:
-                checks.append((f"{operation}_per_day", per_day, 86400))
+                checks.append((f"{operation}_per_day:{identifier}", per_day, 86400))
+            
+            # Every window in one round trip
+            allowed, info = await rate_limiter.check_windows(checks) if checks else (True, {})
             
-            # Perform rate limit checks
-            for key_suffix, limit, window in checks:
-                allowed, info = await rate_limiter.is_allowed(
-                    f"{key_suffix}:{identifier}",
-                    limit,
-                    window,
-                    identifier
+            if not allowed:
+                logger.warning(
+                    f"Rate limit exceeded for {operation}",
+                    extra={
+                        'user_id': user_id,
+                        'identifier': identifier,
+                        'operation': operation,
+                        'limit': info['limit'],
+                        'window': info['window']
+                    }
                 )
                 
-                if not allowed:
-                    logger.warning(
-                        f"Rate limit exceeded for {operation}",
-                        extra={
-                            'user_id': user_id,
-                            'identifier': identifier,
-                            'operation': operation,
-                            'limit': limit,
-                            'window': window
-                        }
-                    )
-                    
-                    raise HTTPException(
-                        status_code=429,
-                        detail=f"Rate limit exceeded for {operation}",
-                        headers={
-                            'X-RateLimit-Limit': str(info['limit']),
-                            'X-RateLimit-Remaining': str(info['remaining']),
-                            'X-RateLimit-Reset': str(info['reset']),
-                            'Retry-After': str(info['retry_after'])
-                        }
-                    )
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"Rate limit exceeded for {operation}",
+                    headers={
+                        'X-RateLimit-Limit': str(info['limit']),
+                        'X-RateLimit-Remaining': str(info['remaining']),
+                        'X-RateLimit-Reset': str(info['reset']),
+                        'Retry-After': str(info['retry_after'])
+                    }
+                )
+            
+            # The middleware stamps X-RateLimit-* from request state; report
+            # this endpoint's window when it is tighter than the global one
+            current = getattr(request.state, 'rate_limit_info', None)
+            if info and (not current or info['remaining'] < current['remaining']):
+                request.state.rate_limit_info = info
             
             return await func(*args, **kwargs)
         
+        if not request_param:
+            # FastAPI only passes the Request to endpoints that declare it, so
+            # advertise an extra keyword parameter for it on the wrapper
+            wrapper.__signature__ = signature.replace(parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(_INJECTED_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+            ])
+        
         return wrapper
     return decorator
 
 
-class RateLimitMiddleware:
-    """Middleware for global rate limiting"""
-    
-    def __init__(self):
-        self.rate_limiter = rate_limiter
-    
-    async def __call__(self, request: Request, call_next):
-        """Apply global rate limiting"""
-        
-        # Skip rate limiting for health checks
-        if request.url.path in ['/health', '/metrics']:
-            return await call_next(request)
-        
-        # Get client identifier
-        client_ip = request.client.host if request.client else 'unknown'
-        
-        # Apply global rate limit
-        allowed, info = await self.rate_limiter.is_allowed(
-            f"global:{client_ip}",
-            settings.rate_limit.default_per_minute,
-            60,
-            client_ip
-        )
-        
-        if not allowed:
-            logger.warning(
-                f"Global rate limit exceeded",
-                extra={
-                    'client_ip': client_ip,
-                    'path': request.url.path,
-                    'method': request.method
-                }
-            )
-            
-            return HTTPException(
-                status_code=429,
-                detail="Too many requests",
-                headers={
-                    'X-RateLimit-Limit': str(info['limit']),
-                    'X-RateLimit-Remaining': str(info['remaining']),
-                    'X-RateLimit-Reset': str(info['reset']),
-                    'Retry-After': str(info['retry_after'])
-                }
-            )
-        
-        # Add rate limit headers to response
-        response = await call_next(request)
-        response.headers['X-RateLimit-Limit'] = str(info['limit'])
-        response.headers['X-RateLimit-Remaining'] = str(info['remaining'])
-        response.headers['X-RateLimit-Reset'] = str(info['reset'])
-        
-        return response
-
-
 def create_user_rate_limit_key(request: Request, user_id: Optional[str]) -> str:
     """Create rate limit key based on user or IP"""
     if user_id:
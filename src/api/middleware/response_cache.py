@@ -0,0 +1,182 @@
+"""
+Response Cache Middleware
+Redis-backed caching of read-only endpoint responses with per-route TTLs
+"""
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Optional, Tuple
+import hashlib
+import json
+import re
+import time
+import redis.asyncio as redis
+
+from .auth import _bearer_credentials, jwt_manager
+from ...core.application.exceptions import AuthenticationError
+from ...infrastructure.cache.redis_client import redis_client as shared_redis_client
+from ...infrastructure.logging.logger import get_logger
+
+logger = get_logger('northstar.response_cache')
+
+# (path pattern, fresh seconds, cached per caller)
+#
+# A hit is answered here, so the endpoint and its @rate_limit decorator never
+# run; only UnifiedMiddleware's global per-IP limit, which sits outside this
+# middleware, still applies. Don't list endpoint-rate-limited routes. Health
+# and liveness probes must not be listed either: a cached (or stale-if-error)
+# "healthy" would outlive a failed dependency.
+CACHE_POLICIES: Tuple[Tuple[re.Pattern, int, bool], ...] = (
+    (re.compile(r"^/api/v1/content/?$"), 10, True),
+    (re.compile(r"^/api/v1/content/[^/]+$"), 30, True),
+    (re.compile(r"^/api/v1/content/[^/]+/analytics$"), 30, True),
+)
+
+# How long past freshness an entry may still be served if the backend fails
+STALE_IF_ERROR_SECONDS = 300
+
+# Only these headers are replayed; per-request ones like X-Request-ID are not
+_REPLAYED_HEADERS = ('content-type',)
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """Serve cached GET responses for the routes in CACHE_POLICIES
+
+    Each caller's responses live in one Redis hash, ``resp:<scope>``, where the
+    scope is the verified user id (the token's ``sub``) or ``public``. A field
+    pair per path+query holds the body and its status/headers/timestamps, so a
+    hit is a single HMGET and any successful write by the user, with whichever
+    token, invalidates all of their cached reads with one DEL. Entries never
+    outlive the token that stored them, and requests whose token does not
+    verify bypass the cache. Size is bounded by Redis' eviction policy
+    (``maxmemory-policy allkeys-lfu`` recommended).
+    """
+
+    def __init__(self, app, redis_client: Optional[redis.Redis] = None):
+        super().__init__(app)
+        # Defaults to the process-wide pool shared with the rate limiter
+        self.redis_client = redis_client if redis_client is not None else shared_redis_client
+
+    async def dispatch(self, request: Request, call_next):
+        if not self.redis_client:
+            return await call_next(request)
+
+        if request.method != "GET":
+            response = await call_next(request)
+            if request.method != "HEAD" and response.status_code < 400:
+                await self._invalidate(request)
+            return response
+
+        policy = self._match(request.url.path)
+        if policy is None:
+            return await call_next(request)
+
+        ttl, per_caller = policy
+        scope = self._scope(request, per_caller)
+        if scope is None:
+            # Unverifiable credentials; let the endpoint reject them uncached
+            return await call_next(request)
+        key, expires_at = scope
+        field = hashlib.sha1(
+            f"{request.url.path}?{request.url.query}".encode('utf-8')
+        ).hexdigest()
+
+        cached = await self._load(key, field)
+        now = time.time()
+        if cached is not None and now < cached[1]['stale_at']:
+            return self._replay(cached, "HIT")
+
+        try:
+            response = await call_next(request)
+        except Exception:
+            if cached is not None:
+                logger.warning(f"Serving stale response for {request.url.path} after error")
+                return self._replay(cached, "STALE")
+            raise
+
+        if response.status_code >= 500 and cached is not None:
+            logger.warning(f"Serving stale response for {request.url.path} after {response.status_code}")
+            return self._replay(cached, "STALE")
+
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        meta = {
+            'status': response.status_code,
+            'headers': {
+                name: response.headers[name]
+                for name in _REPLAYED_HEADERS if name in response.headers
+            },
+            'generated_at': now,
+            'stale_at': now + ttl if expires_at is None else min(now + ttl, expires_at)
+        }
+        await self._store(key, field, body, meta, ttl)
+
+        headers = dict(response.headers)
+        headers['X-Cache'] = "MISS"
+        return Response(content=body, status_code=response.status_code, headers=headers)
+
+    @staticmethod
+    def _match(path: str) -> Optional[Tuple[int, bool]]:
+        for pattern, ttl, per_caller in CACHE_POLICIES:
+            if pattern.match(path):
+                return ttl, per_caller
+        return None
+
+    @staticmethod
+    def _scope(request: Request, per_caller: bool = True) -> Optional[Tuple[str, Optional[float]]]:
+        """Return (hash key, token expiry) for the caller, or None if the token is invalid"""
+        if not per_caller or not request.headers.get('authorization'):
+            return "resp:public", None
+        token = _bearer_credentials(request)
+        if token is None:
+            return None
+        try:
+            # Cached per token, so this is a dict lookup on repeat requests
+            payload = jwt_manager.verify_token(token)
+        except AuthenticationError:
+            return None
+        return f"resp:user:{payload['sub']}", payload['exp']
+
+    @staticmethod
+    def _replay(cached: Tuple[bytes, dict], status: str) -> Response:
+        body, meta = cached
+        headers = dict(meta['headers'])
+        headers['X-Cache'] = status
+        headers['Age'] = str(int(time.time() - meta['generated_at']))
+        return Response(content=body, status_code=meta['status'], headers=headers)
+
+    async def _load(self, key: str, field: str) -> Optional[Tuple[bytes, dict]]:
+        try:
+            body, meta = await self.redis_client.hmget(key, f"{field}:body", f"{field}:meta")
+        except Exception as e:
+            logger.error(f"Response cache read error: {e}")
+            return None
+
+        if body is None or meta is None:
+            return None
+
+        meta = json.loads(meta)
+        if time.time() >= meta['stale_at'] + STALE_IF_ERROR_SECONDS:
+            return None
+        return body, meta
+
+    async def _store(self, key: str, field: str, body: bytes, meta: dict, ttl: int):
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hset(key, mapping={f"{field}:body": body, f"{field}:meta": json.dumps(meta)})
+            # The hash outlives its freshest entry by the stale-if-error window
+            pipe.expire(key, ttl + STALE_IF_ERROR_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Response cache write error: {e}")
+
+    async def _invalidate(self, request: Request):
+        scope = self._scope(request)
+        if scope is None:
+            return
+        try:
+            await self.redis_client.delete(scope[0])
+        except Exception as e:
+            logger.error(f"Response cache invalidation error: {e}")
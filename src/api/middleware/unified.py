@@ -0,0 +1,99 @@
+"""
+Unified Request Middleware
+Request ids, global rate limiting, access logging and error handling in one pass
+"""
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+import os
+import time
+
+from .error_handler import create_error_response, handle_exception
+from .rate_limiting import rate_limiter
+from ...infrastructure.config.settings import settings
+from ...infrastructure.logging.logger import get_logger
+
+logger = get_logger('northstar.middleware')
+
+# Paths exempt from the global per-IP limit
+RATE_LIMIT_EXEMPT_PATHS = frozenset({
+    '/health', '/metrics', '/api/docs', '/api/redoc', '/api/openapi.json'
+})
+
+
+class UnifiedMiddleware(BaseHTTPMiddleware):
+    """Single middleware for the cross-cutting work done on every request
+
+    Each BaseHTTPMiddleware layer costs its own task and a handful of
+    coroutines per request, so request ids, the global rate limit, access
+    logging and last-resort error handling share one layer.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.rate_limiter = rate_limiter
+
+    async def dispatch(self, request: Request, call_next):
+        # 128 random bits as 32 hex chars; uuid4() adds object and formatting overhead
+        request_id = os.urandom(16).hex()
+        request.state.request_id = request_id
+        start_time = time.perf_counter()
+
+        # Reported in the X-RateLimit-* headers; the rate_limit decorator may
+        # replace it with a tighter endpoint window
+        request.state.rate_limit_info = {}
+        if request.url.path not in RATE_LIMIT_EXEMPT_PATHS:
+            client_ip = request.client.host if request.client else 'unknown'
+            allowed, rate_info = await self.rate_limiter.is_allowed(
+                f"global:{client_ip}",
+                settings.rate_limit.default_per_minute,
+                60
+            )
+            request.state.rate_limit_info = rate_info
+
+            if not allowed:
+                logger.warning(
+                    "Global rate limit exceeded",
+                    extra={
+                        'request_id': request_id,
+                        'client_ip': client_ip,
+                        'path': request.url.path,
+                        'method': request.method
+                    }
+                )
+                response = create_error_response(
+                    429, 'RATE_LIMIT_EXCEEDED', 'Too many requests', request_id=request_id
+                )
+                response.headers['Retry-After'] = str(rate_info['retry_after'])
+                return self._finish(request, response, start_time)
+
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            response = await handle_exception(request, exc)
+
+        return self._finish(request, response, start_time)
+
+    @staticmethod
+    def _finish(request: Request, response, start_time: float):
+        """Stamp the response headers and write the access log line"""
+        rate_info = request.state.rate_limit_info
+        if rate_info:
+            response.headers['X-RateLimit-Limit'] = str(rate_info['limit'])
+            response.headers['X-RateLimit-Remaining'] = str(rate_info['remaining'])
+            response.headers['X-RateLimit-Reset'] = str(rate_info['reset'])
+        response.headers['X-Request-ID'] = request.state.request_id
+
+        logger.info(
+            f"{request.method} {request.url.path} - {response.status_code}",
+            extra={
+                'request_id': request.state.request_id,
+                'method': request.method,
+                'path': request.url.path,
+                'query_params': str(request.query_params),
+                'status_code': response.status_code,
+                'duration_seconds': time.perf_counter() - start_time,
+                'user_agent': request.headers.get('user-agent'),
+                'ip': request.client.host if request.client else None
+            }
+        )
+        return response
@@ -0,0 +1,96 @@
+"""
+API Routing
+Memoized FastAPI dependency introspection, installed once at application setup
+"""
+from functools import wraps
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from fastapi.dependencies import utils as dependency_utils
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from ..infrastructure.logging.logger import get_logger
+
+logger = get_logger('northstar.routing')
+
+# FastAPI 0.104 re-checks every dependency with inspect.iscoroutinefunction /
+# isgeneratorfunction on each request and, while dependency_overrides are set,
+# rebuilds the override's typed signature per request. The answers never change
+# for a given callable, so they are remembered per callable; weak keys let
+# replaced callables be collected as usual.
+_MEMOIZED_INTROSPECTION = (
+    'is_coroutine_callable',
+    'is_gen_callable',
+    'is_async_gen_callable',
+    'get_typed_signature',
+)
+
+
+def _memoize_by_callable(func: Callable[[Callable[..., Any]], Any]) -> Callable[[Callable[..., Any]], Any]:
+    """Cache func(call) in a WeakKeyDictionary keyed by call"""
+    cache: WeakKeyDictionary = WeakKeyDictionary()
+
+    @wraps(func)
+    def cached(call: Callable[..., Any]) -> Any:
+        try:
+            return cache[call]
+        except KeyError:
+            pass
+        except TypeError:
+            # Not weak-referenceable or unhashable; introspect every time
+            return func(call)
+        result = cache[call] = func(call)
+        return result
+
+    cached._introspection_cache = cache
+    return cached
+
+
+def install_introspection_cache():
+    """Swap FastAPI's dependency introspection helpers for memoized ones
+
+    Call once while setting up the application; repeat calls are no-ops. The
+    helpers are module globals of fastapi.dependencies.utils, so this covers
+    every route. Helpers a FastAPI release no longer has are skipped.
+    """
+    for name in _MEMOIZED_INTROSPECTION:
+        helper = getattr(dependency_utils, name, None)
+        if helper is None:
+            logger.warning(f"fastapi.dependencies.utils.{name} not found; not memoizing it")
+        elif not hasattr(helper, '_introspection_cache'):
+            setattr(dependency_utils, name, _memoize_by_callable(helper))
+
+
+def warm_dependency_caches(routes) -> int:
+    """Introspect every dependency of the given routes ahead of traffic
+
+    FastAPI builds each route's dependency tree when the route is declared, so
+    what is left per request is the callable-kind checks memoized above. Run
+    from the lifespan, after install_introspection_cache, this fills those
+    caches before the first request instead of during it. Returns the number of
+    dependency callables visited.
+    """
+    checks = [
+        helper for helper in (
+            getattr(dependency_utils, name, None)
+            for name in ('is_gen_callable', 'is_async_gen_callable', 'is_coroutine_callable')
+        )
+        if hasattr(helper, '_introspection_cache')
+    ]
+    visited = set()
+
+    def walk(dependant: Dependant):
+        for sub_dependant in dependant.dependencies:
+            call = sub_dependant.call
+            if call is not None and id(call) not in visited:
+                visited.add(id(call))
+                for check in checks:
+                    check(call)
+            walk(sub_dependant)
+
+    for route in routes:
+        if isinstance(route, APIRoute):
+            walk(route.dependant)
+
+    return len(visited)
@@ -224,6 +224,23 @@ class ContentService:
         
         return [ContentResponse.from_entity(content) for content in content_list]
     
+    async def get_content(
+        self, 
+        user_id: str, 
+        content_id: str
+    ) -> ContentResponse:
+        """Get a single piece of the user's content"""
+        
+        user = await self._user_repo.get_by_id(user_id)
+        if not user:
+            raise UserNotFoundError(f"User {user_id} not found")
+        
+        content = await self._content_repo.get_by_id(content_id)
+        if not content or content.user_id != user_id:
+            raise ValidationError("Content not found or access denied")
+        
+        return ContentResponse.from_entity(content)
+    
     async def get_content_analytics(
         self, 
         user_id: str, 
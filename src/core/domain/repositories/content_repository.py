@@ -30,6 +30,11 @@ class ContentRepository(ABC):
         """Delete content by ID"""
         pass
     
+    @abstractmethod
+    async def delete_if_owner(self, content_id: str, user_id: str) -> bool:
+        """Delete content by ID if it belongs to the user"""
+        pass
+    
     @abstractmethod
     async def list_by_user(
         self, 
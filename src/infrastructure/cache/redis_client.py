@@ -0,0 +1,41 @@
+"""
+Redis Connection Pool
+Process-wide Redis client shared by the rate limiter and the response cache
+"""
+from typing import Optional
+import redis.asyncio as redis
+
+from ..config.settings import settings
+from ..logging.logger import get_logger
+
+logger = get_logger('northstar.redis')
+
+# Idle connections are probed before reuse instead of failing a request
+HEALTH_CHECK_INTERVAL_SECONDS = 30
+
+
+def _create_pool() -> Optional[redis.ConnectionPool]:
+    """Build the shared pool; connections are opened lazily on first use"""
+    try:
+        return redis.ConnectionPool.from_url(
+            settings.redis.url,
+            max_connections=settings.redis.pool_size,
+            socket_keepalive=True,
+            health_check_interval=HEALTH_CHECK_INTERVAL_SECONDS,
+            decode_responses=False
+        )
+    except Exception as e:
+        logger.error(f"Failed to configure Redis pool: {e}")
+        return None
+
+
+redis_pool = _create_pool()
+redis_client: Optional[redis.Redis] = (
+    redis.Redis(connection_pool=redis_pool) if redis_pool is not None else None
+)
+
+
+async def close_redis_pool() -> None:
+    """Close every pooled connection; call once on application shutdown"""
+    if redis_pool is not None:
+        await redis_pool.disconnect()
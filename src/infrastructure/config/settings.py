@@ -45,7 +45,7 @@ class RedisConfig:
     db: int = 0
     password: Optional[str] = None
     ssl: bool = False
-    pool_size: int = 10
+    pool_size: int = 256
     
     @property
     def url(self) -> str:
@@ -216,7 +216,7 @@ class Settings:
             db=int(os.getenv("REDIS_DB", 0)),
             password=os.getenv("REDIS_PASSWORD"),
             ssl=os.getenv("REDIS_SSL", "false").lower() == "true",
-            pool_size=int(os.getenv("REDIS_POOL_SIZE", 10))
+            pool_size=int(os.getenv("REDIS_POOL_SIZE", 256))
         )
     
     def _load_ai_config(self) -> AIConfig:
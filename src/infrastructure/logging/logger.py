@@ -4,9 +4,12 @@ Structured logging with multiple output formats and levels
 """
 import logging
 import logging.config
+import atexit
 import json
+import queue
 import sys
-from typing import Dict, Any, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
@@ -86,9 +89,58 @@ class ContextualLogger:
         self.error(message, *args, **kwargs)
 
 
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves exception formatting to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Interpolate the message now, while its arguments still hold their
+        # current values, but keep exc_info as-is: formatting the traceback is
+        # the expensive part and only handlers that accept the record need it
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listeners draining the logging queues into the configured handlers
+_listeners: List[QueueListener] = []
+
+
+def _stop_listeners() -> None:
+    """Flush queued records and stop the listener threads"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def _route_through_queues(logger_names) -> None:
+    """Replace each logger's handlers with a queue drained on a background thread
+    
+    Emitting then costs one enqueue on the calling thread (the event loop for
+    request handlers); stream and file writes happen on the listener. Loggers
+    sharing a handler set share one queue and listener.
+    """
+    queues: Dict[tuple, queue.SimpleQueue] = {}
+    for name in logger_names:
+        target = logging.getLogger(name)
+        handlers = tuple(target.handlers)
+        if not handlers:
+            continue
+        
+        if handlers not in queues:
+            queues[handlers] = queue.SimpleQueue()
+            listener = QueueListener(queues[handlers], *handlers, respect_handler_level=True)
+            listener.start()
+            _listeners.append(listener)
+        
+        target.handlers = [DeferredQueueHandler(queues[handlers])]
+
+
 def setup_logging() -> None:
     """Setup application logging configuration"""
     
+    # Already configured; reconfiguring would orphan the running listeners
+    if _listeners:
+        return
+    
     # Create logs directory
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
@@ -161,6 +213,8 @@ def setup_logging() -> None:
     }
     
     logging.config.dictConfig(config)
+    _route_through_queues(config['loggers'])
+    atexit.register(_stop_listeners)
 
 
 def get_logger(name: str = 'northstar') -> ContextualLogger:
@@ -173,60 +227,6 @@ def get_logger(name: str = 'northstar') -> ContextualLogger:
 logger = get_logger()
 
 
-class LoggerMiddleware:
-    """Middleware for request/response logging"""
-    
-    def __init__(self):
-        self.logger = get_logger('northstar.middleware')
-    
-    async def __call__(self, request, call_next):
-        """Log requests and responses"""
-        start_time = datetime.utcnow()
-        
-        # Log request
-        self.logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                'request_id': getattr(request.state, 'request_id', None),
-                'method': request.method,
-                'path': request.url.path,
-                'query_params': str(request.query_params),
-                'user_agent': request.headers.get('user-agent'),
-                'ip': request.client.host if request.client else None
-            }
-        )
-        
-        try:
-            response = await call_next(request)
-            
-            # Log response
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            self.logger.info(
-                f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-                extra={
-                    'request_id': getattr(request.state, 'request_id', None),
-                    'status_code': response.status_code,
-                    'duration_seconds': duration
-                }
-            )
-            
-            return response
-            
-        except Exception as e:
-            # Log error
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            self.logger.error(
-                f"Request failed: {request.method} {request.url.path} - {str(e)}",
-                extra={
-                    'request_id': getattr(request.state, 'request_id', None),
-                    'error': str(e),
-                    'duration_seconds': duration
-                },
-                exc_info=True
-            )
-            raise
-
-
 def log_function_call(func):
     """Decorator to log function calls"""
     def wrapper(*args, **kwargs):
@@ -94,6 +94,16 @@ class PostgreSQLContentRepository(ContentRepository):
             
             return result == "DELETE 1"
     
+    async def delete_if_owner(self, content_id: str, user_id: str) -> bool:
+        """Delete content by ID if it belongs to the user"""
+        # Ownership check and delete in one statement and one round trip
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute(
+                "DELETE FROM content WHERE id = $1 AND user_id = $2", content_id, user_id
+            )
+            
+            return result == "DELETE 1"
+    
     async def list_by_user(
         self, 
         user_id: str, 
@@ -4,10 +4,12 @@ Test the complete API flow from request to response
 """
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from unittest.mock import patch, AsyncMock
 import json
 
 from src.api.main import app
+from src.api.controllers.deps import get_content_service, get_content_repository
+from src.core.application.exceptions import ValidationError
 
 
 @pytest.fixture
@@ -16,10 +18,28 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def mock_content_service():
+    """Replace the startup-resolved content service for one test"""
+    service = AsyncMock()
+    app.dependency_overrides[get_content_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_content_service, None)
+
+
+@pytest.fixture
+def mock_content_repository():
+    """Replace the startup-resolved content repository for one test"""
+    repository = AsyncMock()
+    app.dependency_overrides[get_content_repository] = lambda: repository
+    yield repository
+    app.dependency_overrides.pop(get_content_repository, None)
+
+
 class TestContentAPI:
     """Test content API endpoints"""
     
-    def test_generate_content_success(self, client, auth_headers):
+    def test_generate_content_success(self, client, auth_headers, mock_content_service):
         """Test successful content generation"""
         payload = {
             "prompt": "Create an engaging post about AI automation in business",
@@ -29,24 +49,21 @@ class TestContentAPI:
             "include_emojis": False
         }
         
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            # Mock the content service
-            mock_service = mock_resolve.return_value
-            mock_service.generate_content.return_value = {
-                "id": "content-123",
-                "text": "AI automation is revolutionizing business processes! #AI #automation",
-                "platform": "twitter",
-                "variants": ["Alternative version"],
-                "hashtags": ["AI", "automation"],
-                "confidence_score": 0.85,
-                "created_at": "2024-01-01T12:00:00"
-            }
-            
-            response = client.post(
-                "/content/generate",
-                json=payload,
-                headers=auth_headers
-            )
+        mock_content_service.generate_content.return_value = {
+            "id": "content-123",
+            "text": "AI automation is revolutionizing business processes! #AI #automation",
+            "platform": "twitter",
+            "variants": ["Alternative version"],
+            "hashtags": ["AI", "automation"],
+            "confidence_score": 0.85,
+            "created_at": "2024-01-01T12:00:00"
+        }
+        
+        response = client.post(
+            "/content/generate",
+            json=payload,
+            headers=auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -122,84 +139,76 @@ class TestContentAPI:
         assert response.status_code == 429
         assert "X-RateLimit-Limit" in response.headers
     
-    def test_schedule_content_success(self, client, auth_headers):
+    def test_schedule_content_success(self, client, auth_headers, mock_content_service):
         """Test successful content scheduling"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.schedule_content.return_value = {
-                "id": "content-123",
-                "status": "scheduled",
-                "scheduled_for": "2024-01-02T12:00:00",
-                "text": "Test content"
-            }
-            
-            response = client.post(
-                "/content/content-123/schedule",
-                json={"scheduled_time": "2024-01-02T12:00:00"},
-                headers=auth_headers
-            )
+        mock_content_service.schedule_content.return_value = {
+            "id": "content-123",
+            "status": "scheduled",
+            "scheduled_for": "2024-01-02T12:00:00",
+            "text": "Test content"
+        }
+        
+        response = client.post(
+            "/content/content-123/schedule",
+            json={"scheduled_time": "2024-01-02T12:00:00"},
+            headers=auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "scheduled"
     
-    def test_publish_content_success(self, client, auth_headers):
+    def test_publish_content_success(self, client, auth_headers, mock_content_service):
         """Test successful content publishing"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.publish_content.return_value = {
-                "id": "content-123",
-                "status": "published",
-                "external_url": "https://twitter.com/user/status/123",
-                "text": "Published content"
-            }
-            
-            response = client.post(
-                "/content/content-123/publish",
-                headers=auth_headers
-            )
+        mock_content_service.publish_content.return_value = {
+            "id": "content-123",
+            "status": "published",
+            "external_url": "https://twitter.com/user/status/123",
+            "text": "Published content"
+        }
+        
+        response = client.post(
+            "/content/content-123/publish",
+            headers=auth_headers
+        )
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "published"
         assert "external_url" in data
     
-    def test_get_user_content_success(self, client, auth_headers):
+    def test_get_user_content_success(self, client, auth_headers, mock_content_service):
         """Test getting user content"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.get_user_content.return_value = [
-                {
-                    "id": "content-1",
-                    "text": "First post",
-                    "platform": "twitter",
-                    "status": "published"
-                },
-                {
-                    "id": "content-2", 
-                    "text": "Second post",
-                    "platform": "instagram",
-                    "status": "draft"
-                }
-            ]
-            
-            response = client.get("/content/", headers=auth_headers)
+        mock_content_service.get_user_content.return_value = [
+            {
+                "id": "content-1",
+                "text": "First post",
+                "platform": "twitter",
+                "status": "published"
+            },
+            {
+                "id": "content-2", 
+                "text": "Second post",
+                "platform": "instagram",
+                "status": "draft"
+            }
+        ]
+        
+        response = client.get("/content/", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
         assert data[0]["id"] == "content-1"
     
-    def test_get_user_content_with_pagination(self, client, auth_headers):
+    def test_get_user_content_with_pagination(self, client, auth_headers, mock_content_service):
         """Test getting user content with pagination"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.get_user_content.return_value = []
-            
-            response = client.get(
-                "/content/?limit=10&offset=20&status=published",
-                headers=auth_headers
-            )
+        mock_content_service.get_user_content.return_value = []
+        
+        response = client.get(
+            "/content/?limit=10&offset=20&status=published",
+            headers=auth_headers
+        )
         
         assert response.status_code == 200
         # Verify the service was called with correct parameters
@@ -207,46 +216,38 @@ class TestContentAPI:
             "test-user-123", 10, 20, "published"
         )
     
-    def test_get_content_by_id_success(self, client, auth_headers):
+    def test_get_content_by_id_success(self, client, auth_headers, mock_content_service):
         """Test getting specific content by ID"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.get_user_content.return_value = [
-                {
-                    "id": "content-123",
-                    "text": "Specific content",
-                    "platform": "twitter",
-                    "status": "published"
-                }
-            ]
-            
-            response = client.get("/content/content-123", headers=auth_headers)
+        mock_content_service.get_content.return_value = {
+            "id": "content-123",
+            "text": "Specific content",
+            "platform": "twitter",
+            "status": "published"
+        }
+        
+        response = client.get("/content/content-123", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == "content-123"
     
-    def test_get_content_by_id_not_found(self, client, auth_headers):
+    def test_get_content_by_id_not_found(self, client, auth_headers, mock_content_service):
         """Test getting non-existent content"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.get_user_content.return_value = []  # No content found
-            
-            response = client.get("/content/non-existent", headers=auth_headers)
+        mock_content_service.get_content.side_effect = ValidationError("Content not found or access denied")
+        
+        response = client.get("/content/non-existent", headers=auth_headers)
         
         assert response.status_code == 404
     
-    def test_get_content_analytics_success(self, client, auth_headers):
+    def test_get_content_analytics_success(self, client, auth_headers, mock_content_service):
         """Test getting content analytics"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.get_content_analytics.return_value = {
-                "content": {"id": "content-123"},
-                "competitive_analysis": {"average_engagement": 2.5},
-                "recommendations": ["Add more hashtags"]
-            }
-            
-            response = client.get("/content/content-123/analytics", headers=auth_headers)
+        mock_content_service.get_content_analytics.return_value = {
+            "content": {"id": "content-123"},
+            "competitive_analysis": {"average_engagement": 2.5},
+            "recommendations": ["Add more hashtags"]
+        }
+        
+        response = client.get("/content/content-123/analytics", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -254,42 +255,31 @@ class TestContentAPI:
         assert "competitive_analysis" in data
         assert "recommendations" in data
     
-    def test_delete_content_success(self, client, auth_headers):
+    def test_delete_content_success(self, client, auth_headers, mock_content_repository):
         """Test successful content deletion"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_repo = mock_resolve.return_value
-            mock_content = type('MockContent', (), {
-                'user_id': 'test-user-123'
-            })()
-            mock_repo.get_by_id.return_value = mock_content
-            mock_repo.delete.return_value = True
-            
-            response = client.delete("/content/content-123", headers=auth_headers)
+        mock_content_repository.delete_if_owner.return_value = True
+        
+        response = client.delete("/content/content-123", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Content deleted successfully"
+        mock_content_repository.delete_if_owner.assert_called_once_with("content-123", "test-user-123")
     
-    def test_delete_content_not_found(self, client, auth_headers):
+    def test_delete_content_not_found(self, client, auth_headers, mock_content_repository):
         """Test deleting non-existent content"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_repo = mock_resolve.return_value
-            mock_repo.get_by_id.return_value = None
-            
-            response = client.delete("/content/non-existent", headers=auth_headers)
+        mock_content_repository.delete_if_owner.return_value = False
+        
+        response = client.delete("/content/non-existent", headers=auth_headers)
         
         assert response.status_code == 404
     
-    def test_delete_content_wrong_user(self, client, auth_headers):
+    def test_delete_content_wrong_user(self, client, auth_headers, mock_content_repository):
         """Test deleting content belonging to different user"""
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_repo = mock_resolve.return_value
-            mock_content = type('MockContent', (), {
-                'user_id': 'different-user'
-            })()
-            mock_repo.get_by_id.return_value = mock_content
-            
-            response = client.delete("/content/content-123", headers=auth_headers)
+        # The ownership filter matches no row for another user's content
+        mock_content_repository.delete_if_owner.return_value = False
+        
+        response = client.delete("/content/content-123", headers=auth_headers)
         
         assert response.status_code == 404
 
@@ -344,22 +334,20 @@ class TestErrorHandling:
         data = response.json()
         assert "error" in data
     
-    def test_internal_server_error(self, client, auth_headers):
+    def test_internal_server_error(self, client, auth_headers, mock_content_service):
         """Test handling of internal server errors"""
         payload = {
             "prompt": "This is a valid prompt for testing",
             "platform": "twitter"
         }
         
-        with patch('src.infrastructure.di.container.container.resolve') as mock_resolve:
-            mock_service = mock_resolve.return_value
-            mock_service.generate_content.side_effect = Exception("Database error")
-            
-            response = client.post(
-                "/content/generate",
-                json=payload,
-                headers=auth_headers
-            )
+        mock_content_service.generate_content.side_effect = Exception("Database error")
+        
+        response = client.post(
+            "/content/generate",
+            json=payload,
+            headers=auth_headers
+        )
         
         assert response.status_code == 500
         data = response.json()
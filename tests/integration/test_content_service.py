@@ -223,6 +223,27 @@ class TestContentService:
         assert isinstance(result, list)
         assert len(result) <= 10
     
+    @pytest.mark.asyncio
+    async def test_get_content_success(self, content_service, sample_user, sample_content):
+        """Test getting a single piece of content"""
+        result = await content_service.get_content(sample_user.id, sample_content.id)
+        
+        assert result.id == sample_content.id
+    
+    @pytest.mark.asyncio
+    async def test_get_content_not_found(self, content_service, sample_user):
+        """Test getting non-existent content"""
+        with pytest.raises(ValidationError, match="Content not found or access denied"):
+            await content_service.get_content(sample_user.id, "non-existent-content")
+    
+    @pytest.mark.asyncio
+    async def test_get_content_wrong_user(self, content_service, sample_user, sample_content):
+        """Test getting content belonging to different user"""
+        sample_content.user_id = "different-user"
+        
+        with pytest.raises(ValidationError, match="Content not found or access denied"):
+            await content_service.get_content(sample_user.id, sample_content.id)
+    
     @pytest.mark.asyncio
     async def test_get_content_analytics_success(self, content_service, sample_user, sample_content):
         """Test getting content analytics"""
@@ -0,0 +1,133 @@
+"""
+Unit Tests: Authentication Middleware
+Test JWT verification caching and the auth dependencies
+"""
+import inspect
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.api.middleware.auth import (
+    JWTManager,
+    PasswordManager,
+    bearer_token,
+    get_current_user,
+    get_current_user_optional,
+)
+from src.core.application.exceptions import AuthenticationError
+
+
+class TestJWTManager:
+    """Test JWT verification and its payload cache"""
+    
+    def test_verify_token_caches_payload(self):
+        """Test repeat verification is served from the cache"""
+        manager = JWTManager()
+        token = manager.create_access_token("user-123")
+        
+        assert manager.verify_token(token)['sub'] == "user-123"
+        assert len(manager.token_cache._entries) == 1
+        assert manager.verify_token(token)['sub'] == "user-123"
+    
+    def test_cached_payload_is_copied(self):
+        """Test callers cannot mutate the cached payload"""
+        manager = JWTManager()
+        token = manager.create_access_token("user-123")
+        
+        manager.verify_token(token)['sub'] = "someone-else"
+        
+        assert manager.verify_token(token)['sub'] == "user-123"
+    
+    def test_cached_token_still_checks_type(self):
+        """Test a cached access token is rejected where a refresh token is expected"""
+        manager = JWTManager()
+        token = manager.create_access_token("user-123")
+        manager.verify_token(token)
+        
+        with pytest.raises(AuthenticationError, match="Invalid token type"):
+            manager.verify_token(token, 'refresh')
+    
+    def test_revoke_evicts_cached_token(self):
+        """Test revoking a token drops its cached verification"""
+        manager = JWTManager()
+        token = manager.create_access_token("user-123")
+        manager.verify_token(token)
+        
+        manager.revoke(token)
+        
+        assert len(manager.token_cache._entries) == 0
+    
+    def test_expired_token_is_rejected(self):
+        """Test the decoder's exp validation rejects expired tokens"""
+        manager = JWTManager()
+        manager.access_token_expire_minutes = -1
+        token = manager.create_access_token("user-123")
+        
+        with pytest.raises(AuthenticationError, match="Token has expired"):
+            manager.verify_token(token)
+    
+    def test_invalid_token_is_not_cached(self):
+        """Test failed verification leaves the cache empty"""
+        manager = JWTManager()
+        
+        with pytest.raises(AuthenticationError, match="Invalid token"):
+            manager.verify_token("not-a-jwt")
+        
+        assert len(manager.token_cache._entries) == 0
+
+
+class TestAuthDependencies:
+    """Test the FastAPI auth dependencies"""
+    
+    def test_dependencies_are_async(self):
+        """Test dependencies stay async so FastAPI does not run them in its threadpool"""
+        assert inspect.iscoroutinefunction(get_current_user)
+        assert inspect.iscoroutinefunction(get_current_user_optional)
+    
+    @pytest.mark.asyncio
+    async def test_get_current_user_invalid_token(self):
+        """Test an invalid bearer token is rejected with 401"""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user("not-a-jwt")
+        
+        assert exc_info.value.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_get_current_user_optional_invalid_token(self):
+        """Test an invalid bearer token yields no user instead of an error"""
+        assert await get_current_user_optional("not-a-jwt") is None
+    
+    @pytest.mark.parametrize("authorization, expected", [
+        (b"Bearer abc.def.ghi", "abc.def.ghi"),
+        (b"bearer abc.def.ghi", "abc.def.ghi"),
+    ])
+    @pytest.mark.asyncio
+    async def test_bearer_token(self, authorization, expected):
+        """Test the token is sliced out of the Authorization header"""
+        request = Request({'type': 'http', 'headers': [(b'authorization', authorization)]})
+        
+        assert await bearer_token(request) == expected
+    
+    @pytest.mark.parametrize("headers", [[], [(b'authorization', b'Basic dXNlcjpwYXNz')], [(b'authorization', b'Bearer ')]])
+    @pytest.mark.asyncio
+    async def test_bearer_token_missing(self, headers):
+        """Test requests without a bearer token are rejected with 401"""
+        request = Request({'type': 'http', 'headers': headers})
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await bearer_token(request)
+        
+        assert exc_info.value.status_code == 401
+
+
+class TestPasswordManager:
+    """Test password hashing off the event loop"""
+    
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_password(self):
+        """Test a hashed password verifies and a wrong one does not"""
+        hashed = await PasswordManager.hash_password("correct horse")
+        
+        assert await PasswordManager.verify_password("correct horse", hashed)
+        assert not await PasswordManager.verify_password("wrong horse", hashed)
@@ -0,0 +1,54 @@
+"""
+Unit Tests: Error Handling
+Test the per-exception handlers built from ERROR_MAPPINGS
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware.error_handler import ERROR_MAPPINGS, make_exception_handler
+from src.core.application.exceptions import (
+    ApplicationError,
+    ContentGenerationError,
+    UserNotFoundError,
+)
+
+
+class CustomApplicationError(ApplicationError):
+    """Unmapped subclass, handled through its base class"""
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    for exc_type in ERROR_MAPPINGS:
+        app.add_exception_handler(exc_type, make_exception_handler(exc_type))
+    
+    errors = {
+        'user': UserNotFoundError(),
+        'generation': ContentGenerationError("Model unavailable"),
+        'custom': CustomApplicationError("Something broke"),
+    }
+    
+    @app.get("/raise/{name}")
+    async def raise_error(name: str):
+        raise errors[name]
+    
+    return TestClient(app)
+
+
+class TestExceptionHandlers:
+    """Test exception handlers registered per exception class"""
+    
+    @pytest.mark.parametrize("name, status_code, code, message", [
+        ('user', 404, 'USER_NOT_FOUND', "User not found"),
+        ('generation', 500, 'CONTENT_GENERATION_ERROR', "Model unavailable"),
+        ('custom', 500, 'APPLICATION_ERROR', "Something broke"),
+    ])
+    def test_mapped_errors(self, client, name, status_code, code, message):
+        """Test each exception is answered with its mapped status and error body"""
+        response = client.get(f"/raise/{name}")
+        
+        assert response.status_code == status_code
+        assert response.json()['error']['code'] == code
+        assert response.json()['error']['message'] == message
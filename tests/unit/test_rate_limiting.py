@@ -0,0 +1,177 @@
+"""
+Unit Tests: Rate Limiting
+Test the rate limit decorator against a stubbed Redis script
+"""
+import inspect
+import os
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.middleware import rate_limiting
+from src.api.middleware.rate_limiting import SLIDING_WINDOW_SCRIPT, rate_limit
+from src.infrastructure.config.settings import settings
+
+
+class TestRateLimitDecorator:
+    """Test the rate_limit decorator"""
+    
+    @pytest.fixture
+    def script_calls(self, monkeypatch):
+        """Stub the sliding window script: allow two requests, then deny"""
+        calls = []
+        
+        async def sliding_window(keys, args):
+            calls.append((keys, args))
+            now, window = args[0], args[2]
+            if len(calls) > 2:
+                # The oldest counted request leaves the window in half an hour
+                return [1, 0, now + window // 2]
+            return [0, 2 - len(calls), now + window]
+        
+        monkeypatch.setattr(rate_limiting.rate_limiter, '_sliding_window', sliding_window)
+        return calls
+    
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        
+        @app.post("/generate")
+        @rate_limit("content_generation", per_hour=2)
+        async def generate(payload: dict, user_id: str = "user-123"):
+            return {"ok": True}
+        
+        return TestClient(app)
+    
+    def test_wrapper_requests_the_request_object(self):
+        """Test endpoints without a Request parameter still receive one for limiting"""
+        @rate_limit("content_generation", per_hour=2)
+        async def endpoint(user_id: str):
+            return user_id
+        
+        parameters = inspect.signature(endpoint).parameters
+        
+        assert parameters['_rate_limit_request'].annotation is Request
+    
+    def test_rate_limit_keys_by_user(self, client, script_calls):
+        """Test each request runs the script against the user's window key"""
+        response = client.post("/generate", json={})
+        
+        assert response.status_code == 200
+        keys, args = script_calls[0]
+        assert keys == ["rate_limit:content_generation_per_hour:user-123"]
+        assert args[2:] == [3600 * 1000, 2]
+    
+    def test_rate_limit_exceeded(self, client, script_calls):
+        """Test a denied request returns 429 with Retry-After"""
+        client.post("/generate", json={})
+        client.post("/generate", json={})
+        response = client.post("/generate", json={})
+        
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == "1800"
+        assert len({args[1] for _, args in script_calls}) == 3
+
+
+class TestRateLimiter:
+    """Test RateLimiter.is_allowed against a stubbed Redis client"""
+    
+    @pytest.fixture
+    def limiter(self, monkeypatch):
+        limiter = rate_limiting.RateLimiter.__new__(rate_limiting.RateLimiter)
+        limiter.redis_client = object()
+        limiter.calls = []
+        
+        async def sliding_window(keys, args):
+            limiter.calls.append((keys, args))
+            return limiter.result
+        
+        limiter._sliding_window = sliding_window
+        return limiter
+    
+    @pytest.mark.asyncio
+    async def test_single_round_trip(self, limiter):
+        """Test the check-and-record is one script call, never a pipeline"""
+        limiter.result = [0, 4, 1_700_000_060_000]
+        
+        allowed, info = await limiter.is_allowed("global:1.2.3.4", 5, 60)
+        
+        assert allowed is True
+        assert len(limiter.calls) == 1
+        assert info['remaining'] == 4
+        assert info['reset'] == 1_700_000_060
+        assert info['retry_after'] is None
+    
+    @pytest.mark.asyncio
+    async def test_denied(self, limiter):
+        """Test a denied call reports no remaining allowance and a retry delay"""
+        limiter.result = [1, 0, 0]
+        
+        allowed, info = await limiter.is_allowed("global:1.2.3.4", 5, 60)
+        
+        assert allowed is False
+        assert info['remaining'] == 0
+        assert info['retry_after'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_multiple_windows_in_one_call(self, limiter):
+        """Test all windows are checked together and the denying one is reported"""
+        limiter.result = [2, 3, 1_700_000_060_000, 0, 1_700_003_600_000]
+        
+        allowed, info = await limiter.check_windows([
+            ("op_per_minute:user-1", 5, 60),
+            ("op_per_hour:user-1", 20, 3600),
+        ])
+        
+        keys, args = limiter.calls[0]
+        assert len(limiter.calls) == 1
+        assert keys == ["rate_limit:op_per_minute:user-1", "rate_limit:op_per_hour:user-1"]
+        assert args[2:] == [60 * 1000, 5, 3600 * 1000, 20]
+        assert allowed is False
+        assert info['limit'] == 20
+        assert info['window'] == 3600
+
+
+@pytest.mark.redis
+class TestSlidingWindowScript:
+    """Run the sliding window Lua script against a real Redis"""
+    
+    @pytest_asyncio.fixture
+    async def limiter(self):
+        # Tests use Redis db 1, like the test_settings fixture
+        client = redis.Redis(
+            host=settings.redis.host, port=settings.redis.port, db=1, socket_connect_timeout=1
+        )
+        try:
+            await client.ping()
+        except (redis.ConnectionError, redis.TimeoutError, OSError):
+            await client.close()
+            pytest.skip("Redis is not available")
+        
+        limiter = rate_limiting.RateLimiter.__new__(rate_limiting.RateLimiter)
+        limiter.redis_client = client
+        limiter._sliding_window = client.register_script(SLIDING_WINDOW_SCRIPT)
+        limiter.suffix = os.urandom(4).hex()
+        yield limiter
+        await client.delete(*(f"rate_limit:{window}:{limiter.suffix}" for window in ("minute", "day")))
+        await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_denied_window_does_not_consume_others(self, limiter):
+        """Test a request denied by the day window is not recorded in the minute window"""
+        checks = [
+            (f"minute:{limiter.suffix}", 5, 60),
+            (f"day:{limiter.suffix}", 1, 86400),
+        ]
+        
+        first_allowed, _ = await limiter.check_windows(checks)
+        second_allowed, info = await limiter.check_windows(checks)
+        
+        assert first_allowed is True
+        assert second_allowed is False
+        assert info['window'] == 86400
+        assert await limiter.redis_client.zcard(f"rate_limit:minute:{limiter.suffix}") == 1
+        assert await limiter.redis_client.zcard(f"rate_limit:day:{limiter.suffix}") == 1
@@ -0,0 +1,49 @@
+"""
+Unit Tests: Response Cache Middleware
+Test how cached responses are scoped to callers
+"""
+from starlette.requests import Request
+
+from src.api.middleware.auth import jwt_manager
+from src.api.middleware.response_cache import ResponseCacheMiddleware
+
+
+def _request(authorization=None):
+    headers = [(b'authorization', authorization.encode('utf-8'))] if authorization else []
+    return Request({'type': 'http', 'headers': headers})
+
+
+class TestCacheScope:
+    """Test ResponseCacheMiddleware._scope"""
+
+    def test_tokens_of_one_user_share_a_scope(self):
+        """Test a user's tokens read and invalidate the same cache hash"""
+        first = jwt_manager.create_access_token("user-123")
+        second = jwt_manager.create_access_token("user-123", {'session': 'other'})
+
+        first_key, first_exp = ResponseCacheMiddleware._scope(_request(f"Bearer {first}"))
+        second_key, _ = ResponseCacheMiddleware._scope(_request(f"Bearer {second}"))
+
+        assert first_key == second_key == "resp:user:user-123"
+        assert first_exp == jwt_manager.verify_token(first)['exp']
+
+    def test_invalid_token_bypasses_cache(self):
+        """Test a token that does not verify gets no cache scope"""
+        assert ResponseCacheMiddleware._scope(_request("Bearer not-a-jwt")) is None
+        assert ResponseCacheMiddleware._scope(_request("Basic dXNlcjpwYXNz")) is None
+
+    def test_shared_routes_use_public_scope(self):
+        """Test anonymous requests and shared routes use the public hash without expiry"""
+        token = jwt_manager.create_access_token("user-123")
+
+        assert ResponseCacheMiddleware._scope(_request()) == ("resp:public", None)
+        assert ResponseCacheMiddleware._scope(_request(f"Bearer {token}"), per_caller=False) == ("resp:public", None)
+
+
+class TestCachePolicies:
+    """Test which routes ResponseCacheMiddleware caches"""
+
+    def test_health_is_never_cached(self):
+        """Test the health check always reaches the endpoint"""
+        assert ResponseCacheMiddleware._match("/health") is None
+        assert ResponseCacheMiddleware._match("/api/v1/content/abc") == (30, True)
@@ -0,0 +1,69 @@
+"""
+Unit Tests: API Routing
+Test the memoized dependency introspection
+"""
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.dependencies import utils as dependency_utils
+from fastapi.testclient import TestClient
+
+from src.api.routing import install_introspection_cache, warm_dependency_caches
+
+
+async def get_answer() -> int:
+    return 42
+
+
+def get_sync_answer() -> int:
+    return 7
+
+
+class TestIntrospectionCache:
+    """Test install_introspection_cache and warm_dependency_caches"""
+    
+    def test_dependency_introspection_is_memoized(self):
+        """Each dependency callable is introspected once and resolved correctly"""
+        install_introspection_cache()
+        router = APIRouter()
+        
+        @router.get("/answer")
+        async def answer(value: int = Depends(get_answer), other: int = Depends(get_sync_answer)):
+            return {"value": value, "other": other}
+        
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        
+        assert client.get("/answer").json() == {"value": 42, "other": 7}
+        assert client.get("/answer").json() == {"value": 42, "other": 7}
+        
+        cache = dependency_utils.is_coroutine_callable._introspection_cache
+        assert cache[get_answer] is True
+        assert cache[get_sync_answer] is False
+    
+    def test_warm_dependency_caches(self):
+        """Startup warming introspects each dependency once, before any request"""
+        install_introspection_cache()
+        router = APIRouter()
+        
+        async def get_nested(value: int = Depends(get_answer)) -> int:
+            return value
+        
+        @router.get("/nested")
+        async def nested(value: int = Depends(get_nested), again: int = Depends(get_answer)):
+            return {"value": value}
+        
+        assert warm_dependency_caches(router.routes) == 2
+        assert dependency_utils.is_coroutine_callable._introspection_cache[get_nested] is True
+    
+    def test_missing_helper_is_skipped(self, monkeypatch):
+        """A helper missing from fastapi.dependencies.utils is skipped, not an error"""
+        monkeypatch.delattr(dependency_utils, 'is_async_gen_callable')
+        router = APIRouter()
+        
+        @router.get("/answer")
+        async def answer(value: int = Depends(get_answer)):
+            return {"value": value}
+        
+        install_introspection_cache()
+        
+        assert warm_dependency_caches(router.routes) == 1
@@ -0,0 +1,88 @@
+"""
+Unit Tests: Unified Middleware
+Test request ids, global rate limiting and error handling in one middleware
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware import rate_limiting
+from src.api.middleware.rate_limiting import rate_limit
+from src.api.middleware.unified import UnifiedMiddleware
+
+
+@pytest.fixture
+def allowed(monkeypatch):
+    """Stub the global rate limit check; flip allowed[0] to deny"""
+    state = [True]
+    
+    async def is_allowed(key, limit, window_seconds):
+        info = {'limit': limit, 'remaining': limit - 1 if state[0] else 0, 'reset': 0, 'retry_after': None if state[0] else 60}
+        return state[0], info
+    
+    monkeypatch.setattr(rate_limiting.rate_limiter, 'is_allowed', is_allowed)
+    return state
+
+
+@pytest.fixture
+def client(allowed):
+    app = FastAPI()
+    app.add_middleware(UnifiedMiddleware)
+    
+    @app.get("/ok")
+    async def ok():
+        return {"ok": True}
+    
+    @app.get("/generate")
+    @rate_limit("generation", per_hour=5)
+    async def generate(user_id: str = "user-123"):
+        return {"ok": True}
+    
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+    
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestUnifiedMiddleware:
+    """Test the UnifiedMiddleware request pipeline"""
+    
+    def test_sets_request_id_and_rate_limit_headers(self, client):
+        """Test successful responses carry a request id and the rate limit state"""
+        response = client.get("/ok")
+        
+        assert response.status_code == 200
+        assert len(response.headers['X-Request-ID']) == 32
+        assert response.headers['X-RateLimit-Remaining'].isdigit()
+    
+    def test_denied_request_returns_429(self, client, allowed):
+        """Test a denied request is answered without reaching the endpoint"""
+        allowed[0] = False
+        
+        response = client.get("/ok")
+        
+        assert response.status_code == 429
+        assert response.headers['Retry-After'] == "60"
+        assert response.headers['X-RateLimit-Remaining'] == "0"
+        assert response.json()['error']['code'] == 'RATE_LIMIT_EXCEEDED'
+    
+    def test_unhandled_exception_becomes_500(self, client):
+        """Test exceptions escaping the endpoint get the standard error body"""
+        response = client.get("/boom")
+        
+        assert response.status_code == 500
+        assert response.json()['error']['request_id'] == response.headers['X-Request-ID']
+    
+    def test_endpoint_window_reported_when_tighter(self, client, monkeypatch):
+        """Test the decorator's tighter endpoint window ends up in the headers"""
+        async def check_windows(checks):
+            return True, {'limit': 5, 'remaining': 2, 'reset': 0, 'retry_after': None, 'window': 3600}
+        
+        monkeypatch.setattr(rate_limiting.rate_limiter, 'check_windows', check_windows)
+        
+        response = client.get("/generate")
+        
+        assert response.status_code == 200
+        assert response.headers['X-RateLimit-Limit'] == "5"
+        assert response.headers['X-RateLimit-Remaining'] == "2"
@@ -65,12 +65,12 @@ class PostScheduler:
             logger.info(f"Executing scheduled post for {platform}")
             
             if platform.lower() == 'twitter':
-                from integrations.twitter_api import TwitterAPI
-                api = TwitterAPI()
+                from integrations.twitter_api import get_twitter_api
+                api = get_twitter_api()
                 result = api.post_tweet(content)
             elif platform.lower() == 'instagram':
-                from integrations.instagram_api import InstagramAPI
-                api = InstagramAPI()
+                from integrations.instagram_api import get_instagram_api
+                api = get_instagram_api()
                 result = api.create_post(content)
             else:
                 logger.warning(f"Unsupported platform: {platform}")